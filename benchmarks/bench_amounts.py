@@ -0,0 +1,88 @@
+"""
+Amount rules on Decimal versus integer cents.
+
+Checks that both paths agree around the 0.01 tolerance boundary, then
+times a 999-line invoice three ways: Decimal (what the models run), cents
+already in hand (columnar batch data), and cents converted from Decimal.
+Run with:
+
+    python benchmarks/bench_amounts.py
+"""
+import os
+import sys
+import timeit
+from decimal import Decimal
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from kra_etims_sdk.amounts import invoice_aggregate_error, item_total_error, to_cents
+
+LINES = 999
+ROUNDS = 200
+
+
+def check_boundaries():
+    for offset in range(-300, 301):
+        tot = Decimal("1160.00") + Decimal(offset).scaleb(-2)
+        expected = item_total_error(Decimal("1000.00"), Decimal("0"), Decimal("160.00"), tot) is None
+        actual = item_total_error(100000, 0, 16000, to_cents(tot), cents=True) is None
+        if expected != actual:
+            raise AssertionError(f"Paths disagree for totAmt {tot}")
+
+
+def run(items, header, cents):
+    for sply, dc, taxbl, tax, tot in items:
+        if item_total_error(sply, dc, tax, tot, cents):
+            return False
+
+    calc_taxbl = calc_tax = calc_tot = 0
+    for _, _, taxbl, tax, tot in items:
+        calc_taxbl += taxbl
+        calc_tax += tax
+        calc_tot += tot
+
+    return invoice_aggregate_error(*header, calc_taxbl, calc_tax, calc_tot, cents) is None
+
+
+def convert(items, header):
+    items = [tuple(map(to_cents, item)) for item in items]
+    tot_taxbl, tot_tax, tot, taxbl_bands, tax_bands = header
+    header = (
+        to_cents(tot_taxbl),
+        to_cents(tot_tax),
+        to_cents(tot),
+        tuple(map(to_cents, taxbl_bands)),
+        tuple(map(to_cents, tax_bands)),
+    )
+    return items, header
+
+
+def main():
+    check_boundaries()
+
+    zero = Decimal("0")
+    item = (Decimal("1000.00"), zero, Decimal("1000.00"), Decimal("160.00"), Decimal("1160.00"))
+    items = [item] * LINES
+    header = (
+        Decimal("1000.00") * LINES,
+        Decimal("160.00") * LINES,
+        Decimal("1160.00") * LINES,
+        (zero, Decimal("1000.00") * LINES, zero, zero, zero),
+        (zero, Decimal("160.00") * LINES, zero, zero, zero),
+    )
+    cent_items, cent_header = convert(items, header)
+    assert run(items, header, False) and run(cent_items, cent_header, True)
+
+    decimal_time = min(timeit.repeat(lambda: run(items, header, False), number=ROUNDS, repeat=5)) / ROUNDS
+    cents_time = min(timeit.repeat(lambda: run(cent_items, cent_header, True), number=ROUNDS, repeat=5)) / ROUNDS
+    convert_time = min(timeit.repeat(lambda: run(*convert(items, header), True), number=ROUNDS, repeat=5)) / ROUNDS
+
+    print(f"{LINES}-line invoice")
+    print(f"Decimal:               {decimal_time * 1e6:8.1f} us")
+    print(f"cents:                 {cents_time * 1e6:8.1f} us")
+    print(f"cents incl. converting:{convert_time * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Import-time guard for the client modules.
+
+Runs ``python -X importtime`` in fresh interpreters, reports the best
+cumulative import time per module, and fails (exit status 1) when a
+module pulls in a dependency that should load lazily or takes longer
+than its budget. Budgets are multiples of ``import pydantic`` timed in
+the same run, so they hold on slow or busy machines. Run with:
+
+    python benchmarks/bench_import.py [--runs 5] [--scale 1.0]
+
+``--scale`` multiplies every budget; ``--report-only`` prints the
+timings without failing on them.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Timed alongside each module; budgets are multiples of its import time
+BASELINE = "pydantic"
+
+# module -> (budget as a multiple of BASELINE, modules it must not import)
+BUDGETS = {
+    "kra_etims_sdk.oclient": (1.5, ("pydantic", "requests", "kra_etims_sdk.schemas")),
+    "kra_etims_sdk.oauth": (0.5, ("pydantic", "requests")),
+    "kra_etims_sdk.schemas": (8.0, ()),
+}
+
+
+def import_time_ms(module: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"No importtime entry for {module}")
+
+
+def loaded_modules(module: str, candidates) -> list:
+    code = f"import sys, {module}; print(' '.join(m for m in {list(candidates)!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--report-only", action="store_true")
+    args = parser.parse_args()
+
+    failures = []
+    for module, (budget, forbidden) in BUDGETS.items():
+        # Interleaved, so both see the same load on the machine
+        module_ms, baseline_ms = [], []
+        for _ in range(args.runs):
+            module_ms.append(import_time_ms(module))
+            baseline_ms.append(import_time_ms(BASELINE))
+        best, baseline = min(module_ms), min(baseline_ms)
+        limit = budget * args.scale
+        print(f"{module:<24}{best:8.1f} ms  {best / baseline:5.2f}x {BASELINE} (budget {limit:.2f}x)")
+        if best > limit * baseline and not args.report_only:
+            failures.append(f"{module} took {best / baseline:.2f}x {BASELINE}, over its {limit:.2f}x budget")
+
+        eager = loaded_modules(module, forbidden)
+        if eager:
+            failures.append(f"{module} eagerly imports {', '.join(eager)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
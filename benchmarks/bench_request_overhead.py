@@ -0,0 +1,74 @@
+"""
+Per-call overhead of building the URL and headers for an eTIMS request.
+
+Compares resolving them from the raw config on every call (how the client
+used to do it) with the precomputed ClientSettings. Run with:
+
+    python benchmarks/bench_request_overhead.py
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from kra_etims_sdk.base_oclient import BaseOClient
+from kra_etims_sdk.settings import ClientSettings
+
+CONFIG = {
+    "env": "sbx",
+    "http": {"timeout": 30},
+    "oscu": {"tin": "P000000000A", "bhf_id": "00", "cmc_key": "0" * 64},
+}
+TOKEN = "x" * 28
+ENDPOINT_KEY = "saveTrnsSalesOsdc"
+ROUNDS = 200_000
+
+
+def per_call_from_config(config, endpoint):
+    env = config.get("env")
+    if env == "sbx":
+        base = "https://etims-api-sbx.kra.go.ke/etims-api"
+    else:
+        base = "https://etims-api.kra.go.ke/etims-api"
+    url = base.rstrip("/").strip() + endpoint
+
+    if endpoint.endswith("/selectInitOsdcInfo"):
+        headers = {
+            "Authorization": f"Bearer {TOKEN}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+    else:
+        headers = {
+            "Authorization": f"Bearer {TOKEN}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "tin": config.get("oscu", {}).get("tin", ""),
+            "bhfId": config.get("oscu", {}).get("bhf_id", ""),
+            "cmcKey": config.get("oscu", {}).get("cmc_key", ""),
+        }
+    timeout = config.get("http", {}).get("timeout", 30)
+    return url, headers, timeout
+
+
+def per_call_from_settings(settings, endpoint_key):
+    url, headers = settings.route(endpoint_key, TOKEN)
+    return url, headers, settings.timeout
+
+
+def main():
+    settings = ClientSettings.from_config(CONFIG, BaseOClient.endpoints)
+    endpoint = BaseOClient.endpoints[ENDPOINT_KEY]
+
+    before = min(timeit.repeat(lambda: per_call_from_config(CONFIG, endpoint), number=ROUNDS, repeat=5))
+    after = min(timeit.repeat(lambda: per_call_from_settings(settings, ENDPOINT_KEY), number=ROUNDS, repeat=5))
+
+    print(f"per call from config:   {before / ROUNDS * 1e9:8.0f} ns")
+    print(f"per call from settings: {after / ROUNDS * 1e9:8.0f} ns")
+    print(f"speedup:                {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
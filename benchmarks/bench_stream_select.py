@@ -0,0 +1,147 @@
+"""
+Peak memory of a large selectItemList response: select_items (the body
+is buffered and decoded whole) against stream_items (records are decoded
+as the body arrives).
+
+Each path runs in a fresh interpreter against an in-process fake
+transport that produces the body in chunks, as the network would, and
+reports how far its peak RSS rose above the RSS before the call (Linux).
+Run with:
+
+    python benchmarks/bench_stream_select.py [--items 200000]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+CONFIG = {
+    "env": "sbx",
+    "oscu": {"tin": "P000000000A", "bhf_id": "00", "cmc_key": "0" * 64},
+}
+CHUNK_SIZE = 64 * 1024
+
+
+def body_chunks(items: int):
+    head = '{"resultCd":"000","resultMsg":"It is succeeded","resultDt":"20240101120000","data":{"itemList":['
+    pending = [head]
+    size = len(head)
+    for seq in range(items):
+        record = json.dumps({
+            "tin": "P000000000A",
+            "itemCd": f"KE1NTXU{seq:07d}",
+            "itemClsCd": "5059690800",
+            "itemTyCd": "2",
+            "itemNm": f"Item {seq}",
+            "orgnNatCd": "KE",
+            "pkgUnitCd": "NT",
+            "qtyUnitCd": "U",
+            "taxTyCd": "B",
+            "dftPrc": 500.0,
+            "useYn": "Y",
+        })
+        pending.append(("," if seq else "") + record)
+        size += len(record) + 1
+        if size >= CHUNK_SIZE:
+            yield "".join(pending).encode()
+            pending, size = [], 0
+    pending.append("]}}")
+    yield "".join(pending).encode()
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, items):
+        self._items = items
+
+    def iter_content(self, chunk_size=None):
+        return body_chunks(self._items)
+
+    def json(self):
+        # As requests does: read the whole body, then decode it
+        return json.loads(b"".join(body_chunks(self._items)))
+
+    @property
+    def text(self):
+        return b"".join(body_chunks(self._items)).decode()
+
+    def close(self):
+        pass
+
+
+class FakeTransport:
+    def __init__(self, items):
+        self.items = items
+
+    def request(self, method, url, **kwargs):
+        return FakeResponse(self.items)
+
+    def close(self):
+        pass
+
+
+class FakeAuth:
+    def token(self, force=False):
+        return "x" * 28
+
+
+def rss_kb() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def run(mode: str, items: int):
+    from kra_etims_sdk.oclient import EtimsOClient
+
+    transport = FakeTransport(10)
+    client = EtimsOClient(CONFIG, FakeAuth(), transport=transport)
+    data = {"lastReqDt": "20240101000000"}
+    # Warm up imports and the validator on a small body
+    client.select_items(data)
+    sum(1 for _ in client.stream_items(data))
+    transport.items = items
+
+    before = rss_kb()
+    started = time.perf_counter()
+    if mode == "buffered":
+        count = len(client.select_items(data)["data"]["itemList"])
+    else:
+        count = sum(1 for _ in client.stream_items(data))
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    assert count == items
+    print(json.dumps({"peak_mb": (peak - before) / 1024, "seconds": elapsed}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--mode", choices=("buffered", "streamed"))
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.items)
+        return
+
+    print(f"selectItemList with {args.items} items")
+    for mode in ("buffered", "streamed"):
+        result = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--items", str(args.items)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        stats = json.loads(result.stdout)
+        print(f"{mode:<10}peak RSS +{stats['peak_mb']:8.1f} MB  {stats['seconds']:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Validator throughput per schema key.
+
+Compares the model round trip ``SCHEMAS[key](**data).model_dump(mode="json")``
+with Validator.validate, and checks both produce the same JSON bytes.
+Run with:
+
+    python benchmarks/bench_validation.py
+"""
+import json
+import os
+import sys
+import timeit
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCHMARKS)
+sys.path.insert(0, os.path.dirname(BENCHMARKS))
+
+from payloads import PAYLOADS
+from kra_etims_sdk.schemas import SCHEMAS
+from kra_etims_sdk.validator import Validator
+
+
+def model_round_trip(schema, data):
+    return SCHEMAS[schema](**data).model_dump(mode="json")
+
+
+def main():
+    validator = Validator()
+    print(f"{'schema':<22}{'round trip':>14}{'validator':>14}{'speedup':>10}")
+
+    for schema, data in PAYLOADS.items():
+        expected = json.dumps(model_round_trip(schema, data))
+        actual = json.dumps(validator.validate(data, schema))
+        if actual != expected:
+            raise AssertionError(f"Output differs for schema [{schema}]")
+
+        rounds = 200 if "itemList" in data else 20_000
+        before = min(timeit.repeat(lambda: model_round_trip(schema, data), number=rounds, repeat=5)) / rounds
+        after = min(timeit.repeat(lambda: validator.validate(data, schema), number=rounds, repeat=5)) / rounds
+        print(f"{schema:<22}{before * 1e6:>11.1f} us{after * 1e6:>11.1f} us{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Valid sample payloads for every schema key in SCHEMAS, used by the benchmarks."""
+from decimal import Decimal
+
+TIN = "P000000000A"
+
+
+def sales_invoice(items: int = 50) -> dict:
+    item_list = []
+    for seq in range(1, items + 1):
+        item_list.append({
+            "itemSeq": seq,
+            "itemClsCd": "5059690800",
+            "itemCd": f"KE1NTXU{seq:07d}",
+            "itemNm": f"Item {seq}",
+            "pkgUnitCd": "NT",
+            "pkg": "1",
+            "qtyUnitCd": "U",
+            "qty": "2",
+            "prc": "500.00",
+            "splyAmt": "1000.00",
+            "dcRt": "0",
+            "dcAmt": "0",
+            "taxTyCd": "B",
+            "taxblAmt": "1000.00",
+            "taxAmt": "160.00",
+            "totAmt": "1160.00",
+        })
+
+    taxbl = Decimal("1000.00") * items
+    tax = Decimal("160.00") * items
+    return {
+        "tin": TIN,
+        "bhfId": "00",
+        "cmcKey": "0" * 64,
+        "trdInvcNo": "INV-1",
+        "invcNo": "1",
+        "orgInvcNo": "0",
+        "rcptTyCd": "S",
+        "salesSttsCd": "02",
+        "cfmDt": "20240101120000",
+        "salesDt": "20240101",
+        "totItemCnt": items,
+        "taxblAmtA": "0", "taxblAmtB": str(taxbl), "taxblAmtC": "0", "taxblAmtD": "0", "taxblAmtE": "0",
+        "taxRtA": "0", "taxRtB": "16", "taxRtC": "0", "taxRtD": "0", "taxRtE": "0",
+        "taxAmtA": "0", "taxAmtB": str(tax), "taxAmtC": "0", "taxAmtD": "0", "taxAmtE": "0",
+        "totTaxblAmt": str(taxbl),
+        "totTaxAmt": str(tax),
+        "totAmt": str(taxbl + tax),
+        "prchrAcptcYn": "N",
+        "regrId": "Test",
+        "regrNm": "Test",
+        "modrId": "Test",
+        "modrNm": "Test",
+        "receipt": {"rcptPbctDt": "20240101120000", "prchrAcptcYn": "N"},
+        "itemList": item_list,
+    }
+
+
+def purchase(items: int = 50) -> dict:
+    item_list = [
+        {
+            "itemSeq": seq,
+            "itemCd": f"KE1NTXU{seq:07d}",
+            "itemClsCd": "5059690800",
+            "itemNm": f"Item {seq}",
+            "pkgUnitCd": "NT",
+            "pkg": 1,
+            "qtyUnitCd": "U",
+            "qty": 2,
+            "prc": 500,
+            "splyAmt": 1000,
+            "dcRt": 0,
+            "dcAmt": 0,
+            "taxblAmt": 1000,
+            "taxTyCd": "B",
+            "taxAmt": 160,
+            "totAmt": 1160,
+        }
+        for seq in range(1, items + 1)
+    ]
+    return {
+        "invcNo": 1,
+        "orgInvcNo": 0,
+        "spplrTin": "A123456789Z",
+        "regTyCd": "M",
+        "pchsTyCd": "N",
+        "rcptTyCd": "P",
+        "pmtTyCd": "01",
+        "pchsSttsCd": "02",
+        "cfmDt": "20240101120000",
+        "pchsDt": "20240101",
+        "totItemCnt": items,
+        "taxblAmtA": 0, "taxblAmtB": 1000 * items, "taxblAmtC": 0, "taxblAmtD": 0, "taxblAmtE": 0,
+        "taxRtA": 0, "taxRtB": 16, "taxRtC": 0, "taxRtD": 0, "taxRtE": 0,
+        "taxAmtA": 0, "taxAmtB": 160 * items, "taxAmtC": 0, "taxAmtD": 0, "taxAmtE": 0,
+        "totTaxblAmt": 1000 * items,
+        "totTaxAmt": 160 * items,
+        "totAmt": 1160 * items,
+        "regrId": "Test",
+        "regrNm": "Test",
+        "modrId": "Test",
+        "modrNm": "Test",
+        "itemList": item_list,
+    }
+
+
+def stock_io(items: int = 50) -> dict:
+    item_list = [
+        {
+            "itemSeq": seq,
+            "itemCd": f"KE1NTXU{seq:07d}",
+            "itemClsCd": "5059690800",
+            "itemNm": f"Item {seq}",
+            "pkgUnitCd": "NT",
+            "pkg": 1,
+            "qtyUnitCd": "U",
+            "qty": 2,
+            "prc": 500,
+            "splyAmt": 1000,
+            "totDcAmt": 0,
+            "taxblAmt": 1000,
+            "taxTyCd": "B",
+            "taxAmt": 160,
+            "totAmt": 1160,
+        }
+        for seq in range(1, items + 1)
+    ]
+    return {
+        "tin": TIN,
+        "bhfId": "00",
+        "sarNo": 1,
+        "orgSarNo": 0,
+        "regTyCd": "M",
+        "sarTyCd": "11",
+        "ocrnDt": "20240101",
+        "totItemCnt": items,
+        "totTaxblAmt": 1000 * items,
+        "totTaxAmt": 160 * items,
+        "totAmt": 1160 * items,
+        "regrId": "Test",
+        "regrNm": "Test",
+        "modrId": "Test",
+        "modrNm": "Test",
+        "itemList": item_list,
+    }
+
+
+PAYLOADS = {
+    "selectInitOsdcInfo": {"tin": TIN, "bhfId": "00", "dvcSrlNo": "DVC-1"},
+    "lastReqOnly": {"lastReqDt": "20240101000000"},
+    "selectCustomer": {"custmTin": "A123456789Z"},
+    "saveBhfCustomer": {
+        "custNo": "999991113", "custTin": "A123456789Z", "custNm": "Taxpayer", "useYn": "Y",
+        "regrId": "Test", "regrNm": "Test", "modrId": "Test", "modrNm": "Test",
+    },
+    "saveBhfUser": {
+        "userId": "user1", "userNm": "User", "pwd": "12341234", "useYn": "Y",
+        "regrId": "Test", "regrNm": "Test", "modrId": "Test", "modrNm": "Test",
+    },
+    "saveBhfInsurance": {
+        "isrccCd": "ISRCC01", "isrccNm": "ISRCC NAME", "isrcRt": 20, "useYn": "Y",
+        "regrId": "Test", "regrNm": "Test", "modrId": "Test", "modrNm": "Test",
+    },
+    "saveItem": {
+        "itemCd": "KE1NTXU0000006", "itemClsCd": "5059690800", "itemTyCd": "1", "itemNm": "Item",
+        "itemStdNm": None, "orgnNatCd": "KE", "pkgUnitCd": "NT", "qtyUnitCd": "U", "taxTyCd": "B",
+        "dftPrc": 3500, "grpPrcL1": 3500, "grpPrcL2": 3500, "isrcAplcbYn": "N", "useYn": "Y",
+        "regrId": "Test", "regrNm": "Test", "modrId": "Test", "modrNm": "Test",
+    },
+    "saveItemComposition": {
+        "itemCd": "KE1NTXU0000006", "cpstItemCd": "KE1NTXU0000001", "cpstQty": 2,
+        "regrId": "Test", "regrNm": "Test",
+    },
+    "importItemUpdate": {
+        "taskCd": "2231943", "dclDe": "20191217", "itemSeq": 1, "hsCd": "1231531231",
+        "itemClsCd": "5022110801", "itemCd": "KE1NTXU0000001", "imptItemSttsCd": "1",
+        "modrId": "Test", "modrNm": "Test",
+    },
+    "saveStockMaster": {
+        "itemCd": "KE1NTXU0000001", "rsdQty": 10,
+        "regrId": "Test", "regrNm": "Test", "modrId": "Test", "modrNm": "Test",
+    },
+    "insertTrnsPurchase": purchase(),
+    "insertStockIO": stock_io(),
+    "saveTrnsSalesOsdc": sales_invoice(),
+}
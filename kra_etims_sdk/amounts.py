@@ -0,0 +1,107 @@
+"""
+Amount consistency rules shared by the schema models and batch checks.
+
+Every rule runs unchanged on the ``Decimal`` fields of a validated model
+and, with ``cents=True``, on integer cents (messages still show amounts).
+AMOUNT_* and RATE_* values carry at most two decimal places, so scaling
+by 100 is exact and both forms agree at the 0.01 boundary:
+``abs(x) > 0.01`` holds exactly when ``abs(100 * x) > 1``.
+
+Integer cents pay off when amounts arrive as integers already, as in
+columnar batch data. Converting a model's Decimals to cents costs more
+than the Decimal arithmetic it replaces, so the models stay on Decimal.
+"""
+from decimal import Decimal, InvalidOperation
+from functools import reduce
+from operator import add
+from typing import Optional, Sequence
+
+SCALE = 100
+TOLERANCE = Decimal("0.01")
+TOLERANCE_CENTS = 1
+
+
+def to_cents(value) -> int:
+    """Exact integer cents for an amount with at most two decimal places."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value * SCALE
+
+    try:
+        amount = value if isinstance(value, Decimal) else Decimal(str(value))
+        if not amount.is_finite():
+            raise ValueError(f"Amount {value!r} is not a finite number")
+        cents = amount.scaleb(2)
+        if cents != cents.to_integral_value():
+            raise ValueError(f"Amount {value} has more than two decimal places")
+        return int(cents)
+    except InvalidOperation:
+        raise ValueError(f"Amount {value!r} is not a number")
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def item_count_error(tot_item_cnt, item_count) -> Optional[str]:
+    """totItemCnt must match the number of line items, of which there must be some."""
+    if item_count == 0:
+        return "itemList cannot be empty when totItemCnt > 0"
+    if item_count != tot_item_cnt:
+        return f"totItemCnt ({tot_item_cnt}) must match actual itemList length ({item_count})"
+    return None
+
+
+def item_total_error(sply_amt, dc_amt, tax_amt, tot_amt, cents: bool = False) -> Optional[str]:
+    """totAmt must equal splyAmt - dcAmt + taxAmt."""
+    calculated = sply_amt - dc_amt + tax_amt
+    if abs(calculated - tot_amt) > (TOLERANCE_CENTS if cents else TOLERANCE):
+        shown = _shown(cents)
+        return (
+            f"Item total mismatch: splyAmt({shown(sply_amt)}) - dcAmt({shown(dc_amt)}) + taxAmt({shown(tax_amt)}) = {shown(calculated)} ≠ totAmt({shown(tot_amt)})"
+        )
+    return None
+
+
+def invoice_aggregate_error(
+    tot_taxbl_amt,
+    tot_tax_amt,
+    tot_amt,
+    taxbl_components: Sequence,
+    tax_components: Sequence,
+    item_taxbl_sum,
+    item_tax_sum,
+    item_tot_sum,
+    cents: bool = False,
+) -> Optional[str]:
+    """
+    Header totals must match the item sums, and the A-E tax band amounts
+    must add up to the header totals. Returns the first rule that fails.
+    """
+    tolerance = TOLERANCE_CENTS if cents else TOLERANCE
+    shown = _shown(cents)
+
+    if abs(item_taxbl_sum - tot_taxbl_amt) > tolerance:
+        return f"Header totTaxblAmt ({shown(tot_taxbl_amt)}) ≠ sum of item taxblAmt ({shown(item_taxbl_sum)})"
+    if abs(item_tax_sum - tot_tax_amt) > tolerance:
+        return f"Header totTaxAmt ({shown(tot_tax_amt)}) ≠ sum of item taxAmt ({shown(item_tax_sum)})"
+    if abs(item_tot_sum - tot_amt) > tolerance:
+        return f"Header totAmt ({shown(tot_amt)}) ≠ sum of item totAmt ({shown(item_tot_sum)})"
+
+    # reduce, not sum: starting from int 0 could change how a Decimal sum prints
+    taxbl_sum = reduce(add, taxbl_components)
+    if abs(taxbl_sum - tot_taxbl_amt) > tolerance:
+        return f"Sum of taxblAmtA-E ({shown(taxbl_sum)}) must equal totTaxblAmt ({shown(tot_taxbl_amt)})"
+
+    tax_sum = reduce(add, tax_components)
+    if abs(tax_sum - tot_tax_amt) > tolerance:
+        return f"Sum of taxAmtA-E ({shown(tax_sum)}) must equal totTaxAmt ({shown(tot_tax_amt)})"
+
+    return None
+
+
+def _shown(cents: bool):
+    return from_cents if cents else _as_is
+
+
+def _as_is(value):
+    return value
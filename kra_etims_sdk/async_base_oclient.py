@@ -0,0 +1,151 @@
+import asyncio
+import inspect
+import time
+
+from .base_oclient import STREAMED, BaseOClient
+from .exceptions import ApiException
+from .json_stream import RecordParser
+from .transport import AsyncHttpTransport
+
+
+class AsyncBaseOClient(BaseOClient):
+    def _build_transport(self):
+        return AsyncHttpTransport(self.config.get("http", {}))
+
+    async def close(self):
+        self._close_shared()
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def invalidate_cache(self, endpoint_key=None):
+        """Drop cached responses of ``endpoint_key``, or all of them."""
+        if self.response_cache is not None:
+            await self._cache_call(self.response_cache.invalidate, endpoint_key)
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with the async client")
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _send(self, method, endpoint_key, data, list_key=None):
+        self.endpoint(endpoint_key)
+        key = self._cache_key(endpoint_key, data, list_key)
+        if key is None:
+            return await self._call(method, endpoint_key, data, list_key)
+
+        cached = await self._cache_call(self.response_cache.get, key, endpoint_key)
+        if cached is not None:
+            return cached
+        result = await self._call(method, endpoint_key, data, list_key)
+        await self._cache_call(self.response_cache.put, key, endpoint_key, result)
+        return result
+
+    async def _cache_call(self, method, *args):
+        # A blocking backend (sqlite) may wait on a lock held by another process
+        if self.response_cache.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def _call(self, method, endpoint_key, data, list_key=None):
+        policy = self.retry_policy
+        policy.budget.deposit()
+        started = time.monotonic()
+        attempt = 1
+
+        while True:
+            try:
+                return await self._attempt(method, endpoint_key, data, started, list_key)
+            except Exception as e:
+                delay = policy.next_delay(endpoint_key, e, attempt, started)
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _attempt(self, method, endpoint_key, data, started, list_key=None):
+        delay = self._throttle_delay(endpoint_key, started)
+        if delay:
+            await asyncio.sleep(delay)
+        timeout = self._attempt_timeout(started)
+
+        stream = list_key is not None
+        with self._circuit(endpoint_key):
+            response = await self._request(method, endpoint_key, data, timeout, stream)
+            body = await self._read_body(response, stream)
+
+            if self._is_token_expired(response, body):
+                await self._token(force=True)
+                response = await self._request(method, endpoint_key, data, timeout, stream)
+                body = await self._read_body(response, stream)
+
+            if body is STREAMED:
+                return await self._records(response, list_key)
+            return self._unwrap(response, body)
+
+    async def _request(self, method, endpoint_key, data, timeout=None, stream=False):
+        settings = self.settings
+        url, headers = settings.route(endpoint_key, await self._token())
+        timeout = settings.timeout if timeout is None else timeout
+        options = {"stream": True} if stream else {}
+
+        if method == "GET" and data:
+            return await self.transport.request("GET", url, params=data, headers=headers, timeout=timeout, **options)
+
+        return await self.transport.request(method, url, json=data, headers=headers, timeout=timeout, **options)
+
+    async def _read_body(self, response, stream):
+        if stream and not 200 <= response.status_code < 300:
+            await response.aread()  # An error body is small; read it before decoding
+        return self._body(response, stream)
+
+    async def _records(self, response, list_key):
+        parser = RecordParser(list_key)
+        chunks = response.aiter_bytes()
+        try:
+            # Read up to the record list, so resultCd is checked before any record
+            records = []
+            async for chunk in chunks:
+                records = parser.feed(chunk)
+                if parser.in_list:
+                    break
+            else:
+                records = parser.close()
+            self._check_head(parser, response.status_code)
+        except BaseException as e:
+            await response.aclose()
+            if isinstance(e, ValueError):
+                raise ApiException(f"Malformed response: {e}", response.status_code)
+            raise
+        return self._stream_records(response, parser, chunks, records)
+
+    async def _stream_records(self, response, parser, chunks, records):
+        try:
+            for record in records:
+                yield record
+            if not parser.done:
+                async for chunk in chunks:
+                    for record in parser.feed(chunk):
+                        yield record
+                for record in parser.close():
+                    yield record
+                # In case resultCd only followed the records
+                self._check_head(parser, response.status_code)
+        except ValueError as e:
+            raise ApiException(f"Malformed response: {e}", response.status_code)
+        finally:
+            await response.aclose()
+
+    async def _token(self, force=False):
+        # Accept a plain AuthOClient too; its cached token() rarely blocks
+        token = self.auth.token(force=force)
+        if inspect.isawaitable(token):
+            token = await token
+        return token
@@ -0,0 +1,48 @@
+import asyncio
+import time
+
+from .oauth import AuthOClient
+
+
+class AsyncAuthOClient(AuthOClient):
+    """
+    AuthOClient for asyncio code: ``token()`` is a coroutine.
+
+    Tokens come from the same in-memory cache and token store as the sync
+    client. The rare refresh round trip, including the cross-process store
+    lock, runs in a worker thread so it never blocks the event loop.
+    """
+
+    def __init__(self, config: dict, store=None):
+        super().__init__(config, store)
+        self._async_lock = None
+
+    async def token(self, force=False):
+        if not force:
+            cached = self._cached
+            if cached and time.time() < cached["expires_at"]:
+                return cached["access_token"]
+
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        async with self._async_lock:
+            stale = self._cached["access_token"] if force and self._cached else None
+
+            if not force:
+                # Another task may have refreshed while we waited for the lock
+                cached = self._cached
+                if cached and time.time() < cached["expires_at"]:
+                    return cached["access_token"]
+
+                cached = self._read_cache()
+                if cached and time.time() < cached["expires_at"]:
+                    self._cached = cached
+                    return cached["access_token"]
+
+            token = await asyncio.to_thread(self._refresh_locked, stale)
+            return token["access_token"]
+
+    def _refresh_locked(self, stale):
+        with self._lock:
+            return self._refresh(stale=stale)
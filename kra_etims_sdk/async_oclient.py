@@ -0,0 +1,99 @@
+import asyncio
+import functools
+import inspect
+
+from .async_base_oclient import AsyncBaseOClient
+from .lazy import build
+from .oclient import EtimsOClient
+
+
+class AsyncEtimsOClient(EtimsOClient, AsyncBaseOClient):
+    """
+    asyncio version of EtimsOClient with the same methods.
+
+    Every endpoint method is a coroutine function, e.g.
+    ``await client.save_sales_transaction(data)``; an invalid payload
+    raises ValidationException when the call is awaited, so
+    ``asyncio.gather`` and tasks see it like any other failure. The
+    stream_* methods resolve to async iterators:
+    ``async for item in await client.stream_items(data)``.
+    """
+
+    def _post(self, endpoint_key, data):
+        response = self.post(endpoint_key, data)
+        if not self.typed_responses:
+            return response
+        return self._typed_later(endpoint_key, response)
+
+    async def _typed_later(self, endpoint_key, response):
+        return self._typed(endpoint_key, await response)
+
+    def _stream(self, endpoint_key, list_key, data):
+        records = self.post_stream(endpoint_key, list_key, data)
+        if not self.typed_responses:
+            return records
+        return self._typed_records(endpoint_key, records)
+
+    async def _typed_records(self, endpoint_key, records):
+        from .schemas import STREAM_RECORDS
+        return _built(STREAM_RECORDS[endpoint_key], await records)
+
+    async def _bulk(self, endpoint_key, schema, items, max_concurrency):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        pending = self._bulk_jobs(schema, items, max_concurrency)
+        lock = asyncio.Lock()
+        results = {}
+
+        # A fixed set of workers pulls from one shared iterator, so large
+        # batches never create more than max_concurrency pending requests
+        async def worker():
+            while True:
+                async with lock:
+                    try:
+                        index, (data, validated) = await pending.__anext__()
+                    except StopAsyncIteration:
+                        return
+                try:
+                    results[index] = await self._submit(endpoint_key, schema, data, validated)
+                except Exception as e:
+                    results[index] = e
+
+        await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+        return [results[index] for index in range(len(results))]
+
+    async def _bulk_jobs(self, schema, items, max_concurrency):
+        windows = self._bulk_windows(schema, items, max_concurrency)
+        # Waiting on the worker processes must not block the event loop
+        offload = self.batch_validator is not None and not self.trusted_input
+        index = 0
+        while True:
+            window = await asyncio.to_thread(next, windows, None) if offload else next(windows, None)
+            if window is None:
+                return
+            for job in window:
+                yield index, job
+                index += 1
+
+def _awaited(method):
+    # The sync client validates before sending; here that happens on await
+    @functools.wraps(method)
+    async def call(self, *args, **kwargs):
+        return await method(self, *args, **kwargs)
+
+    return call
+
+
+# Every public endpoint method of EtimsOClient becomes a coroutine function
+for _name, _method in list(vars(EtimsOClient).items()):
+    if inspect.isfunction(_method) and not _name.startswith("_") and _name != "close":
+        setattr(AsyncEtimsOClient, _name, _awaited(_method))
+del _name, _method
+
+
+async def _built(model, records):
+    index = 0
+    async for record in records:
+        yield build(model, record, str(index))
+        index += 1
@@ -1,5 +1,18 @@
-import requests
+import time
+from contextlib import nullcontext
+from .circuit_breaker import CircuitBreakerRegistry
 from .exceptions import ApiException, AuthenticationException
+from .json_stream import RecordParser
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .settings import ClientSettings
+from .transport import HttpTransport
+
+# Bytes read at a time from a streamed response body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Stands in for the decoded body of a successful response that is streamed
+STREAMED = object()
 
 
 class BaseOClient:
@@ -43,22 +56,75 @@ class BaseOClient:
         'saveStockMaster': '/saveStockMaster',
     }
 
-    def __init__(self, config, auth):
+    def __init__(self, config, auth, transport=None, shared=None):
         self.config = config
         self.auth = auth
+        self.settings = ClientSettings.from_config(config, self.endpoints)
+        self._owns_transport = transport is None
+        self.transport = transport or self._build_transport()
+
+        # A ClientPool passes the components all of its clients share; the
+        # pool built them and closes them, so this client does neither
+        self._owns_shared = shared is None
+        if shared is None:
+            shared = self._build_shared(config)
+        for name, component in shared.items():
+            setattr(self, name, component)
+
+    @classmethod
+    def _build_shared(cls, config) -> dict:
+        breaker_config = config.get("circuit_breaker")
+        if breaker_config and breaker_config.get("enabled", True):
+            circuit_breakers = CircuitBreakerRegistry(breaker_config)
+        else:
+            circuit_breakers = None
 
-    def base_url(self) -> str:
-        env = self.config.get("env")
-
-        if env == "sbx":
-            url = "https://etims-api-sbx.kra.go.ke/etims-api"
+        cache_config = config.get("response_cache")
+        if cache_config:
+            from .response_cache import ResponseCache
+            response_cache = ResponseCache.from_config(cache_config, cls.endpoints)
         else:
-            url = "https://etims-api.kra.go.ke/etims-api"
+            response_cache = None
+
+        return {
+            "retry_policy": RetryPolicy.from_config(config.get("retry", {})),
+            "circuit_breakers": circuit_breakers,
+            "rate_limiter": RateLimiter.from_config(config.get("rate_limit", {})),
+            "response_cache": response_cache,
+        }
+
+    def reload_settings(self):
+        """Re-read ``config`` after changing it; settings are otherwise resolved once, at construction."""
+        self.settings = ClientSettings.from_config(self.config, self.endpoints)
+
+    def set_cmc_key(self, cmc_key: str):
+        """Use the cmcKey issued by selectInitOsdcInfo on every following request."""
+        self.config.setdefault("oscu", {})["cmc_key"] = cmc_key
+        self.reload_settings()
+
+    def _build_transport(self):
+        return HttpTransport(self.config.get("http", {}))
+
+    def close(self):
+        self._close_shared()
+        if self._owns_transport:
+            self.transport.close()
+
+    def _close_shared(self):
+        if self.response_cache is not None and self._owns_shared:
+            self.response_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def base_url(self) -> str:
+        return self.settings.base_url
 
-        return url.rstrip("/").strip()
-    
     def timeout(self):
-        return self.config.get("http", {}).get("timeout", 30)
+        return self.settings.timeout
 
     def endpoint(self, key: str):
         if key.startswith("/"):
@@ -75,68 +141,181 @@ class BaseOClient:
     def post(self, endpoint_key, data=None):
         return self._send("POST", endpoint_key, data or {})
 
-    def _send(self, method, endpoint_key, data):
-        endpoint = self.endpoint(endpoint_key)
-        response = self._request(method, endpoint, data)
-
-        if self._is_token_expired(response):
-            self.auth.forget_token()
-            self.auth.token(force=True)
-            response = self._request(method, endpoint, data)
-
-        return self._unwrap(response)
-
-    def _request(self, method, endpoint, data):
-        url = self.base_url() + endpoint
-        headers = self._headers(endpoint)
-
-        if method.upper() == "GET" and data:
-            response = requests.get(url, params=data, headers=headers, timeout=self.timeout())
-        else:
-            response = requests.request(
-                method.upper(),
-                url,
-                json=data,
-                headers=headers,
-                timeout=self.timeout()
-            )
-
-        return response
-
-    def _headers(self, endpoint):
-        if endpoint.endswith("/selectInitOsdcInfo"):
-            return {
-                "Authorization": f"Bearer {self.auth.token()}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            }
-
-        return {
-            "Authorization": f"Bearer {self.auth.token()}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "tin": self.config.get("oscu", {}).get("tin", ""),
-            "bhfId": self.config.get("oscu", {}).get("bhf_id", ""),
-            "cmcKey": self.config.get("oscu", {}).get("cmc_key", ""),
-        }
+    def post_stream(self, endpoint_key, list_key, data=None):
+        """
+        POST and iterate over the records of ``data.<list_key>`` in the
+        response as they arrive, without buffering the body. Status and
+        resultCd are checked before the first record (KRA sends resultCd
+        ahead of data), so retries and the circuit breaker apply up to
+        that point; a failure while iterating is raised as it happens.
+        """
+        return self._send("POST", endpoint_key, data or {}, list_key)
+
+    def circuit_states(self) -> dict:
+        if self.circuit_breakers is None:
+            return {}
+        return self.circuit_breakers.states()
+
+    def cache_stats(self) -> dict:
+        if self.response_cache is None:
+            return {}
+        return self.response_cache.stats()
+
+    def invalidate_cache(self, endpoint_key=None):
+        """Drop cached responses of ``endpoint_key``, or all of them."""
+        if self.response_cache is not None:
+            self.response_cache.invalidate(endpoint_key)
+
+    def _send(self, method, endpoint_key, data, list_key=None):
+        self.endpoint(endpoint_key)
+        key = self._cache_key(endpoint_key, data, list_key)
+        if key is None:
+            return self._call(method, endpoint_key, data, list_key)
+
+        cached = self.response_cache.get(key, endpoint_key)
+        if cached is not None:
+            return cached
+        result = self._call(method, endpoint_key, data, list_key)
+        self.response_cache.put(key, endpoint_key, result)
+        return result
+
+    def _cache_key(self, endpoint_key, data, list_key):
+        if self.response_cache is None or list_key is not None:
+            return None
+        return self.response_cache.key(self.settings, endpoint_key, data)
+
+    def _call(self, method, endpoint_key, data, list_key=None):
+        policy = self.retry_policy
+        policy.budget.deposit()
+        started = time.monotonic()
+        attempt = 1
+
+        while True:
+            try:
+                return self._attempt(method, endpoint_key, data, started, list_key)
+            except Exception as e:
+                delay = policy.next_delay(endpoint_key, e, attempt, started)
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _attempt(self, method, endpoint_key, data, started, list_key=None):
+        delay = self._throttle_delay(endpoint_key, started)
+        if delay:
+            time.sleep(delay)
+        timeout = self._attempt_timeout(started)
+
+        stream = list_key is not None
+        with self._circuit(endpoint_key):
+            response = self._request(method, endpoint_key, data, timeout, stream)
+            body = self._body(response, stream)
+
+            if self._is_token_expired(response, body):
+                # A forced refresh replaces only the rejected token; deleting the
+                # shared cache first would discard a token another worker just fetched
+                self.auth.token(force=True)
+                response = self._request(method, endpoint_key, data, timeout, stream)
+                body = self._body(response, stream)
+
+            if body is STREAMED:
+                return self._records(response, list_key)
+            return self._unwrap(response, body)
+
+    def _circuit(self, endpoint_key):
+        if self.circuit_breakers is None:
+            return nullcontext()
+        return self.circuit_breakers.get(endpoint_key).guard()
+
+    def _throttle_delay(self, endpoint_key, started):
+        if self.rate_limiter is None:
+            return 0.0
+        # Raise RateLimitException rather than wait past the per-call deadline
+        remaining = self.retry_policy.remaining(started)
+        max_wait = max(0.0, remaining) if remaining is not None else None
+        return self.rate_limiter.reserve(self.settings.tin, self.settings.bhf_id, endpoint_key, max_wait)
+
+    def _attempt_timeout(self, started):
+        # Never let a single attempt outlive the per-call deadline
+        remaining = self.retry_policy.remaining(started)
+        if remaining is None:
+            return self.settings.timeout
+        return max(0.001, min(self.settings.timeout, remaining))
+
+    def _request(self, method, endpoint_key, data, timeout=None, stream=False):
+        settings = self.settings
+        url, headers = settings.route(endpoint_key, self.auth.token())
+        timeout = settings.timeout if timeout is None else timeout
+        options = {"stream": True} if stream else {}
+
+        if method == "GET" and data:
+            return self.transport.request("GET", url, params=data, headers=headers, timeout=timeout, **options)
+
+        return self.transport.request(method, url, json=data, headers=headers, timeout=timeout, **options)
+
+    def _body(self, response, stream=False):
+        """The decoded JSON body, decoded once per response; None if it is not JSON."""
+        if stream and 200 <= response.status_code < 300:
+            return STREAMED  # Left unread for _records
+        try:
+            return response.json()
+        except Exception:
+            return None
 
-    def _is_token_expired(self, response):
+    def _is_token_expired(self, response, body):
         if response.status_code == 401:
             return True
         try:
-            fault = response.json().get("fault", {}).get("faultstring", "")
+            fault = body.get("fault", {}).get("faultstring", "")
             return "access token expired" in fault.lower() or "invalid token" in fault.lower()
         except Exception:
             return False
 
-    def _unwrap(self, response):
+    def _records(self, response, list_key):
+        parser = RecordParser(list_key)
+        chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
         try:
-            json_data = response.json()
-        except Exception:
+            # Read up to the record list, so resultCd is checked before any record
+            records = []
+            for chunk in chunks:
+                records = parser.feed(chunk)
+                if parser.in_list:
+                    break
+            else:
+                records = parser.close()
+            self._check_head(parser, response.status_code)
+        except BaseException as e:
+            response.close()
+            if isinstance(e, ValueError):
+                raise ApiException(f"Malformed response: {e}", response.status_code)
+            raise
+        return self._stream_records(response, parser, chunks, records)
+
+    def _stream_records(self, response, parser, chunks, records):
+        try:
+            yield from records
+            if not parser.done:
+                for chunk in chunks:
+                    yield from parser.feed(chunk)
+                yield from parser.close()
+                # In case resultCd only followed the records
+                self._check_head(parser, response.status_code)
+        except ValueError as e:
+            raise ApiException(f"Malformed response: {e}", response.status_code)
+        finally:
+            response.close()
+
+    def _check_head(self, parser, status_code):
+        fault = parser.head.get("fault")
+        if isinstance(fault, dict):
+            raise ApiException(fault.get("faultstring", "API fault"), status_code)
+        self._check_result(parser.head)
+
+    def _unwrap(self, response, body):
+        if body is None:
             raise ApiException(response.text, response.status_code)
-
-        result_cd = json_data.get("resultCd")
-        result_msg = json_data.get("resultMsg", "Unknown API response")
+        json_data = body
 
         # ---------------------------------
         # HTTP-level handling
@@ -148,6 +327,12 @@ class BaseOClient:
             fault_msg = json_data.get("fault", {}).get("faultstring", response.text)
             raise ApiException(fault_msg, response.status_code)
 
+        return self._check_result(json_data)
+
+    def _check_result(self, json_data):
+        result_cd = json_data.get("resultCd")
+        result_msg = json_data.get("resultMsg", "Unknown API response")
+
         # ---------------------------------
         # Business-level handling
         # ---------------------------------
@@ -159,11 +344,11 @@ class BaseOClient:
 
         # Client errors (891–899)
         if "891" <= result_cd <= "899":
-            raise ApiException(f"Client Error ({result_cd}): {result_msg}", 400)
+            raise ApiException(f"Client Error ({result_cd}): {result_msg}", 400, result_cd)
 
         # Server errors (900+)
         if result_cd >= "900":
-            raise ApiException(f"Server Error ({result_cd}): {result_msg}", 500)
+            raise ApiException(f"Server Error ({result_cd}): {result_msg}", 500, result_cd)
 
         # Fallback business error
-        raise ApiException(f"Business Error ({result_cd}): {result_msg}", 400)
+        raise ApiException(f"Business Error ({result_cd}): {result_msg}", 400, result_cd)
@@ -0,0 +1,175 @@
+from typing import List, Mapping, Sequence
+
+from .amounts import invoice_aggregate_error, item_count_error, item_total_error, to_cents
+
+BAND_COLUMNS = ("A", "B", "C", "D", "E")
+INVOICE_AMOUNT_COLUMNS = (
+    ("totTaxblAmt", "totTaxAmt", "totAmt")
+    + tuple(f"taxblAmt{band}" for band in BAND_COLUMNS)
+    + tuple(f"taxAmt{band}" for band in BAND_COLUMNS)
+)
+ITEM_AMOUNT_COLUMNS = ("splyAmt", "dcAmt", "taxblAmt", "taxAmt", "totAmt")
+
+# Largest cent value whose sum over a 999-line invoice still fits in int64
+MAX_CENTS = (2 ** 63 - 1) // 999
+
+
+class BatchReport:
+    """
+    Outcome of validate_invoice_aggregates and Validator.report:
+    ``ok[i]`` tells whether record ``i`` passed and ``errors[i]`` maps
+    field to message like ValidationException.errors (empty if it passed).
+    """
+
+    def __init__(self, ok, errors: List[dict]):
+        self.ok = ok
+        self.errors = errors
+
+    @property
+    def failed(self) -> List[int]:
+        return [index for index, messages in enumerate(self.errors) if messages]
+
+    def __len__(self):
+        return len(self.errors)
+
+
+def validate_invoice_aggregates(
+    invoices: Mapping[str, Sequence],
+    items: Mapping[str, Sequence],
+    cents: bool = False,
+) -> BatchReport:
+    """
+    Re-check the amount rules of SaveTrnsSalesOsdc for many invoices at once.
+
+    ``invoices`` holds one column per header field: ``totItemCnt``,
+    ``totTaxblAmt``, ``totTaxAmt``, ``totAmt``, ``taxblAmtA``-``E`` and
+    ``taxAmtA``-``E``. ``items`` holds one row per line item across all
+    invoices: ``invoice`` (the invoice's row number) plus ``splyAmt``,
+    ``dcAmt``, ``taxblAmt``, ``taxAmt`` and ``totAmt``; an invoice's items
+    may be interleaved with others but keep their itemList order. Columns
+    may be lists or numpy arrays. With ``cents=True`` amounts are integer
+    cents; otherwise they are amounts with at most two decimal places.
+
+    The rules are those of ``TrnsSalesSaveWrItem.validate_amounts`` and
+    ``SaveTrnsSalesOsdc.validate_amount_aggregates``, with the same
+    messages, except that amounts always show two decimals. As in the
+    model, an invoice with a failing line item reports only its item
+    errors. Requires numpy (``pip install kra-etims-sdk[batch]``).
+    """
+    np = _numpy()
+
+    count = len(invoices["totItemCnt"])
+    tot_item_cnt = np.asarray(invoices["totItemCnt"], dtype=np.int64)
+    head = {name: _cents_column(np, invoices[name], cents) for name in INVOICE_AMOUNT_COLUMNS}
+
+    invoice = np.asarray(items["invoice"], dtype=np.int64)
+    if invoice.size and (invoice.min() < 0 or invoice.max() >= count):
+        raise ValueError("items['invoice'] must refer to invoice rows")
+    line = {name: _cents_column(np, items[name], cents) for name in ITEM_AMOUNT_COLUMNS}
+
+    # Rule 1: totAmt = splyAmt - dcAmt + taxAmt on every line
+    item_bad = np.abs(line["splyAmt"] - line["dcAmt"] + line["taxAmt"] - line["totAmt"]) > 1
+    invoice_item_bad = np.bincount(invoice[item_bad], minlength=count) > 0
+
+    # Rule 2: item count, header totals against item sums, A-E bands against header totals
+    item_count = np.bincount(invoice, minlength=count)
+    sums = {}
+    for name in ("taxblAmt", "taxAmt", "totAmt"):
+        total = np.zeros(count, dtype=np.int64)
+        np.add.at(total, invoice, line[name])
+        sums[name] = total
+
+    taxbl_bands = sum(head[f"taxblAmt{band}"] for band in BAND_COLUMNS)
+    tax_bands = sum(head[f"taxAmt{band}"] for band in BAND_COLUMNS)
+    aggregate_bad = (
+        (item_count == 0)
+        | (item_count != tot_item_cnt)
+        | (np.abs(sums["taxblAmt"] - head["totTaxblAmt"]) > 1)
+        | (np.abs(sums["taxAmt"] - head["totTaxAmt"]) > 1)
+        | (np.abs(sums["totAmt"] - head["totAmt"]) > 1)
+        | (np.abs(taxbl_bands - head["totTaxblAmt"]) > 1)
+        | (np.abs(tax_bands - head["totTaxAmt"]) > 1)
+    )
+
+    bad = invoice_item_bad | aggregate_bad
+    errors = [{} for _ in range(count)]
+
+    # Messages are built only for failures, by the same rules in scalar form
+    if invoice_item_bad.any():
+        positions = _positions(np, invoice, count)
+        for row in np.flatnonzero(item_bad):
+            error = item_total_error(
+                *(int(line[name][row]) for name in ("splyAmt", "dcAmt", "taxAmt", "totAmt")),
+                cents=True,
+            )
+            errors[invoice[row]][f"itemList.{positions[row]}"] = f"Value error, {error}"
+
+    for index in np.flatnonzero(aggregate_bad & ~invoice_item_bad):
+        errors[index][""] = "Value error, " + _aggregate_message(
+            index, item_count, tot_item_cnt, head, sums
+        )
+
+    return BatchReport(~bad, errors)
+
+
+def _aggregate_message(index, item_count, tot_item_cnt, head, sums) -> str:
+    error = item_count_error(int(tot_item_cnt[index]), int(item_count[index]))
+    if error:
+        return error
+
+    return invoice_aggregate_error(
+        int(head["totTaxblAmt"][index]),
+        int(head["totTaxAmt"][index]),
+        int(head["totAmt"][index]),
+        [int(head[f"taxblAmt{band}"][index]) for band in BAND_COLUMNS],
+        [int(head[f"taxAmt{band}"][index]) for band in BAND_COLUMNS],
+        int(sums["taxblAmt"][index]),
+        int(sums["taxAmt"][index]),
+        int(sums["totAmt"][index]),
+        cents=True,
+    )
+
+
+def _positions(np, invoice, count):
+    """Each item's index within its own invoice's itemList."""
+    order = np.argsort(invoice, kind="stable")
+    starts = np.zeros(count, dtype=np.int64)
+    starts[1:] = np.cumsum(np.bincount(invoice, minlength=count))[:-1]
+    positions = np.empty_like(invoice)
+    positions[order] = np.arange(invoice.size) - starts[invoice[order]]
+    return positions
+
+
+def _cents_column(np, values, cents: bool):
+    array = np.asarray(values)
+
+    if cents:
+        if array.dtype.kind not in "iu":
+            raise ValueError("cents=True expects integer columns")
+        column = array.astype(np.int64)
+    elif array.dtype.kind in "iu":
+        column = array.astype(np.int64) * 100
+    elif array.dtype.kind == "f":
+        if not np.isfinite(array).all():
+            raise ValueError("Amounts must be finite numbers")
+        scaled = np.rint(array * 100)
+        if not np.allclose(scaled, array * 100, rtol=0, atol=1e-6):
+            raise ValueError("Amounts must have at most two decimal places")
+        column = scaled.astype(np.int64)
+    else:
+        # Decimals and strings go through the exact scalar conversion
+        column = np.fromiter((to_cents(value) for value in array.ravel()), dtype=np.int64, count=array.size)
+
+    if column.size and np.abs(column).max() > MAX_CENTS:
+        raise ValueError("Amount too large for batch validation")
+    return column
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Batch validation requires numpy. Install it with: pip install kra-etims-sdk[batch]"
+        ) from e
+    return numpy
@@ -0,0 +1,197 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
+
+from .amounts import item_count_error
+from .exceptions import ValidationException
+from .validator import Validator, _validation_error
+
+if TYPE_CHECKING:
+    from .reference import ReferenceData
+
+BANDS = ("A", "B", "C", "D", "E")
+
+# Standard KRA rates per tax type: A exempt, B 16% VAT, C zero-rated,
+# D non-VAT, E 8%
+DEFAULT_TAX_RATES = {"A": 0, "B": 16, "C": 0, "D": 0, "E": 8}
+
+# schema key -> (header model, item model, has A-E tax bands)
+KINDS = {
+    "saveTrnsSalesOsdc": ("SaveTrnsSalesOsdc", "TrnsSalesSaveWrItem", True),
+    "insertTrnsPurchase": ("InsertTrnsPurchase", "InsertTrnsPurchaseItem", True),
+    "insertStockIO": ("SaveStockIO", "SaveStockIOItem", False),
+}
+
+# Schemas whose model checks the header totals against the items; with
+# AGGREGATES_CHECKED set, the caller runs those checks instead
+AGGREGATE_RULES = {"saveTrnsSalesOsdc"}
+
+
+class LineItems:
+    """
+    Validates the line items of one schema as they arrive and keeps
+    their running totals, without holding on to the items themselves.
+    With ``banded``, taxblAmt and taxAmt are also summed per taxTyCd.
+    With ``reference``, item codes are checked against it.
+    """
+
+    def __init__(self, schema: str, banded: bool = False, reference: Optional["ReferenceData"] = None):
+        if schema not in KINDS:
+            raise ValueError(f"Line items of schema '{schema}' are not supported")
+
+        from . import schemas
+
+        header, item, _ = KINDS[schema]
+        self.model = getattr(schemas, header)
+        self.item_model = getattr(schemas, item)
+        for model in (self.model, self.item_model):
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+        # The core validator directly: add() runs once per line
+        self._validate_item = self.item_model.__pydantic_validator__.validate_python
+        self.context = {schemas.AGGREGATES_CHECKED: True}
+        if reference is not None:
+            self.context[schemas.REFERENCE_DATA] = reference
+
+        self.banded = banded
+        self.count = 0
+        self.taxbl = {band: Decimal(0) for band in BANDS}
+        self.tax = {band: Decimal(0) for band in BANDS}
+        self.tot_taxbl = self.tot_tax = self.tot = Decimal(0)
+
+    def add(self, item: Union[dict, Any]):
+        """Validate one item and add it to the totals; returns the item model."""
+        index = self.count
+        if isinstance(item, dict):
+            try:
+                item = self._validate_item(item, context=self.context)
+            except Exception as e:
+                if not isinstance(e, _validation_error()):
+                    raise
+                raise ValidationException("Validation failed", _prefixed(Validator._messages(e), index))
+        elif not isinstance(item, self.item_model):
+            raise ValueError(f"Expected {self.item_model.__name__}, got {type(item).__name__}")
+
+        if self.banded:
+            if item.taxTyCd not in self.taxbl:
+                raise ValidationException(
+                    "Validation failed",
+                    {f"itemList.{index}.taxTyCd": f"Tax type must be one of {', '.join(BANDS)}"},
+                )
+            self.taxbl[item.taxTyCd] += item.taxblAmt
+            self.tax[item.taxTyCd] += item.taxAmt
+
+        self.tot_taxbl += item.taxblAmt
+        self.tot_tax += item.taxAmt
+        self.tot += item.totAmt
+        self.count += 1
+        return item
+
+
+class InvoiceBuilder:
+    """
+    Accumulates line items and emits a request model whose totals and
+    A-E tax bands are derived from them.
+
+    Each item is validated as it is added and its taxblAmt/taxAmt are
+    added to the band of its taxTyCd, so build() only copies the running
+    sums into the header. The sales model then skips re-aggregating its
+    items, which are not validated a second time either:
+
+        builder = InvoiceBuilder.sales()
+        for line in lines:
+            builder.add_item(line)
+        invoice = builder.build(tin=..., bhfId=..., ...)
+        client.save_sales_transaction(invoice)
+    """
+
+    def __init__(
+        self,
+        schema: str = "saveTrnsSalesOsdc",
+        tax_rates: Optional[Dict[str, Any]] = None,
+        reference: Optional["ReferenceData"] = None,
+    ):
+        if schema not in KINDS:
+            raise ValueError(f"InvoiceBuilder does not support schema '{schema}'")
+
+        self.schema = schema
+        self._lines = LineItems(schema, banded=KINDS[schema][2], reference=reference)
+
+        rates = dict(DEFAULT_TAX_RATES)
+        rates.update(tax_rates or {})
+        unknown = set(rates) - set(BANDS)
+        if unknown:
+            raise ValueError(f"Unknown tax bands: {', '.join(sorted(unknown))}")
+        self.tax_rates = {band: Decimal(str(rate)) for band, rate in rates.items()}
+
+        self._items = []
+
+    @classmethod
+    def sales(cls, tax_rates: Optional[Dict[str, Any]] = None, reference: Optional["ReferenceData"] = None) -> "InvoiceBuilder":
+        return cls("saveTrnsSalesOsdc", tax_rates, reference)
+
+    @classmethod
+    def purchase(cls, tax_rates: Optional[Dict[str, Any]] = None, reference: Optional["ReferenceData"] = None) -> "InvoiceBuilder":
+        return cls("insertTrnsPurchase", tax_rates, reference)
+
+    @classmethod
+    def stock_io(cls, reference: Optional["ReferenceData"] = None) -> "InvoiceBuilder":
+        return cls("insertStockIO", reference=reference)
+
+    def add_item(self, item: Union[dict, Any]) -> "InvoiceBuilder":
+        """Validate one line item and add it to the running totals. itemSeq defaults to its position."""
+        if isinstance(item, dict) and "itemSeq" not in item:
+            item = {**item, "itemSeq": len(self._items) + 1}
+        self._items.append(self._lines.add(item))
+        return self
+
+    def add_items(self, items: Iterable[Union[dict, Any]]) -> "InvoiceBuilder":
+        for item in items:
+            self.add_item(item)
+        return self
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def totals(self) -> Dict[str, Any]:
+        """The header fields build() derives from the items added so far."""
+        lines = self._lines
+        totals = {}
+        if lines.banded:
+            for band in BANDS:
+                totals[f"taxblAmt{band}"] = lines.taxbl[band]
+                totals[f"taxRt{band}"] = self.tax_rates[band]
+                totals[f"taxAmt{band}"] = lines.tax[band]
+        totals["totTaxblAmt"] = lines.tot_taxbl
+        totals["totTaxAmt"] = lines.tot_tax
+        totals["totAmt"] = lines.tot
+        totals["totItemCnt"] = lines.count
+        return totals
+
+    def build(self, **header):
+        """
+        Validate ``header`` together with the derived totals and items and
+        return the request model. Derived fields may not be passed in.
+        """
+        totals = self.totals
+        clashes = sorted(set(header) & (set(totals) | {"itemList"}))
+        if clashes:
+            raise ValueError(f"Derived by InvoiceBuilder, do not pass: {', '.join(clashes)}")
+
+        # Under AGGREGATES_CHECKED the model skips its empty-itemList check too
+        error = item_count_error(totals["totItemCnt"], self._lines.count) if self.schema in AGGREGATE_RULES else None
+        if error:
+            raise ValidationException("Validation failed", {"": f"Value error, {error}"})
+
+        data = {**header, **totals, "itemList": list(self._items)}
+        try:
+            return self._lines.model.model_validate(data, context=self._lines.context)
+        except Exception as e:
+            if not isinstance(e, _validation_error()):
+                raise
+            raise ValidationException("Validation failed", Validator._messages(e))
+
+
+def _prefixed(messages: dict, index: int) -> dict:
+    prefix = f"itemList.{index}"
+    return {f"{prefix}.{field}" if field else prefix: message for field, message in messages.items()}
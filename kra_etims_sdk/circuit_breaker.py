@@ -0,0 +1,197 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from .exceptions import ApiException, CircuitOpenException
+from .retry import is_transport_error
+
+
+class CircuitBreaker:
+    """
+    Tracks the outcome of recent calls to one endpoint.
+
+    The breaker opens when, over the last ``window_size`` calls (and at
+    least ``minimum_calls``), the failure rate reaches
+    ``failure_rate_threshold`` or the share of calls slower than
+    ``slow_call_threshold`` seconds reaches ``slow_call_rate_threshold``.
+    While open every call fails fast with CircuitOpenException. After
+    ``open_duration`` seconds up to ``half_open_max_calls`` probes are let
+    through: if all succeed the breaker closes, if any fails it opens again.
+
+    Failures are transport errors and HTTP/eTIMS server errors (status 500
+    and up). Client and business errors mean the backend answered, so they
+    count as successes.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float = None,
+        slow_call_rate_threshold: float = 1.0,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = self.CLOSED
+        self._window = deque(maxlen=window_size)  # (failed, slow) per call
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            self._maybe_half_open()
+            calls = len(self._window)
+            failures = sum(1 for failed, _ in self._window if failed)
+            slow = sum(1 for _, is_slow in self._window if is_slow)
+            return {
+                "state": self._state,
+                "calls": calls,
+                "failure_rate": failures / calls if calls else 0.0,
+                "slow_call_rate": slow / calls if calls else 0.0,
+                "retry_after": self._retry_after(),
+            }
+
+    @contextmanager
+    def guard(self):
+        probe = self._acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._record(self.is_failure(e), time.monotonic() - started, probe)
+            raise
+        except BaseException:
+            # Cancelled or interrupted: says nothing about the backend
+            self._release(probe)
+            raise
+        else:
+            self._record(False, time.monotonic() - started, probe)
+
+    @staticmethod
+    def is_failure(error: BaseException) -> bool:
+        if isinstance(error, ApiException):
+            return error.status_code is not None and error.status_code >= 500
+        return is_transport_error(error)
+
+    def reset(self):
+        with self._lock:
+            self._close()
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state == self.CLOSED:
+                return False
+
+            if self._state == self.HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return True
+
+            raise CircuitOpenException(self.name, self._retry_after())
+
+    def _record(self, failed: bool, latency: float, probe: bool):
+        slow = self.slow_call_threshold is not None and latency >= self.slow_call_threshold
+
+        with self._lock:
+            if probe:
+                self._probes_in_flight -= 1
+                if self._state != self.HALF_OPEN:
+                    return
+                if failed or slow:
+                    self._open()
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._close()
+                return
+
+            if self._state != self.CLOSED:
+                return
+
+            self._window.append((failed, slow))
+            calls = len(self._window)
+            if calls < self.minimum_calls:
+                return
+
+            failures = sum(1 for f, _ in self._window if f)
+            slow_calls = sum(1 for _, s in self._window if s)
+            if (
+                failures / calls >= self.failure_rate_threshold
+                or slow_calls / calls >= self.slow_call_rate_threshold
+            ):
+                self._open()
+
+    def _release(self, probe: bool):
+        if probe:
+            with self._lock:
+                self._probes_in_flight -= 1
+
+    def _maybe_half_open(self):
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+            self._state = self.HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+
+    def _retry_after(self) -> float:
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self.open_duration - (time.monotonic() - self._opened_at))
+
+    def _open(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._window.clear()
+
+    def _close(self):
+        self._state = self.CLOSED
+        self._window.clear()
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+
+class CircuitBreakerRegistry:
+    """One CircuitBreaker per endpoint key, built on first use from ``config["circuit_breaker"]``."""
+
+    def __init__(self, breaker_config: dict = None):
+        breaker_config = dict(breaker_config or {})
+        breaker_config.pop("enabled", None)
+        self._settings = breaker_config
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint_key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint_key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(endpoint_key)
+                if breaker is None:
+                    breaker = CircuitBreaker(endpoint_key, **self._settings)
+                    self._breakers[endpoint_key] = breaker
+        return breaker
+
+    def states(self) -> dict:
+        return {key: breaker.snapshot() for key, breaker in list(self._breakers.items())}
@@ -0,0 +1,212 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .async_oauth import AsyncAuthOClient
+from .async_oclient import AsyncEtimsOClient
+from .exceptions import ApiException
+from .oauth import AuthOClient
+from .oclient import EtimsOClient
+from .transport import AsyncHttpTransport, HttpTransport
+
+
+class ClientPool:
+    """
+    Serves EtimsOClients for many taxpayer branches from one process.
+
+    Register each tenant once with its ``tin``, ``bhf_id`` and ``cmc_key``
+    (and its own consumer key/secret if it does not use the pool's
+    ``config["auth"][env]``), then route calls with
+    ``pool.client(tin, bhf_id)``.
+
+    Every client shares one HTTP transport, retry policy, circuit breaker
+    registry, rate limiter (whose buckets are still per TIN/branch),
+    response cache (whose entries are still per TIN/branch) and batch
+    validator.
+    Tenants with the same consumer key and secret share one AuthOClient,
+    so a token is fetched and read from disk once, not once per branch.
+
+    At most ``max_clients`` clients are kept; the least recently used one
+    is dropped first and rebuilt from its registration when next needed.
+    Size ``config["http"]["pool_maxsize"]`` for the concurrency of all
+    tenants together, not of one.
+    """
+
+    client_class = EtimsOClient
+    auth_class = AuthOClient
+
+    def __init__(self, config: dict, max_clients: int = 256, transport=None):
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1")
+
+        self.config = config
+        self.max_clients = max_clients
+        self._owns_transport = transport is None
+        self.transport = transport or self._build_transport()
+
+        # Retry policy, circuit breakers, rate limiter, response cache and
+        # batch validator, built once and passed to every client
+        self._shared = self.client_class._build_shared(config)
+        for name, component in self._shared.items():
+            setattr(self, name, component)
+
+        self._tenants = {}
+        self._clients = OrderedDict()
+        self._auths = {}
+        self._lock = threading.Lock()
+
+    def _build_transport(self):
+        return HttpTransport(self.config.get("http", {}))
+
+    # -----------------------------
+    # TENANTS
+    # -----------------------------
+    def register(self, tin: str, bhf_id: str, cmc_key: str, consumer_key: str = None, consumer_secret: str = None):
+        if (consumer_key is None) != (consumer_secret is None):
+            raise ValueError("consumer_key and consumer_secret must be given together")
+
+        tenant = {
+            "tin": tin,
+            "bhf_id": bhf_id,
+            "cmc_key": cmc_key,
+            "consumer_key": consumer_key,
+            "consumer_secret": consumer_secret,
+        }
+        with self._lock:
+            self._tenants[(tin, bhf_id)] = tenant
+            # A changed cmcKey or credential must not keep serving the old client
+            self._drop((tin, bhf_id))
+
+    def unregister(self, tin: str, bhf_id: str):
+        with self._lock:
+            self._tenants.pop((tin, bhf_id), None)
+            self._drop((tin, bhf_id))
+
+    def tenants(self) -> list:
+        with self._lock:
+            return list(self._tenants)
+
+    def client(self, tin: str, bhf_id: str):
+        key = (tin, bhf_id)
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._clients.move_to_end(key)
+                return entry[0]
+
+            tenant = self._tenants.get(key)
+            if tenant is None:
+                raise ApiException(f"Tenant [{tin}/{bhf_id}] not registered", 500)
+
+            client = self._build_client(tenant)
+            self._clients[key] = (client, self._auth_key(tenant))
+            while len(self._clients) > self.max_clients:
+                self._drop(next(iter(self._clients)))
+            return client
+
+    # -----------------------------
+    # BUILDING
+    # -----------------------------
+    def _build_client(self, tenant):
+        config = dict(self.config)
+        config["oscu"] = {"tin": tenant["tin"], "bhf_id": tenant["bhf_id"], "cmc_key": tenant["cmc_key"]}
+        return self.client_class(config, self._auth_for(tenant), self.transport, self._shared)
+
+    def _auth_for(self, tenant):
+        key = self._auth_key(tenant)
+        auth = self._auths.get(key)
+        if auth is None:
+            auth = self.auth_class(self._auth_config(tenant))
+            self._auths[key] = auth
+        return auth
+
+    def _auth_key(self, tenant):
+        # Same key with another secret (a rotated one) or env is another token
+        if tenant["consumer_key"] is None:
+            return (self.config.get("env"), None, None)
+        return (self.config.get("env"), tenant["consumer_key"], tenant["consumer_secret"])
+
+    def _auth_config(self, tenant):
+        if tenant["consumer_key"] is None:
+            return self.config
+
+        env = self.config["env"]
+        config = dict(self.config)
+        config["auth"] = {env: {"consumer_key": tenant["consumer_key"], "consumer_secret": tenant["consumer_secret"]}}
+
+        # Each credential needs its own token cache; name it after a digest
+        # so the consumer key never appears on disk
+        digest = hashlib.sha256(tenant["consumer_key"].encode()).hexdigest()[:16]
+        cache_dir = self.config.get("cache_dir", tempfile.gettempdir())
+        config["cache_file"] = os.path.join(cache_dir, f"kra_etims_token_{digest}.json")
+        return config
+
+    def _drop(self, key):
+        entry = self._clients.pop(key, None)
+        if entry is None:
+            return
+
+        auth_key = entry[1]
+        if not any(other == auth_key for _, other in self._clients.values()):
+            auth = self._auths.pop(auth_key, None)
+            if auth is not None:
+                auth.close()
+
+    # -----------------------------
+    # LIFECYCLE
+    # -----------------------------
+    def close(self):
+        for auth in self._release():
+            auth.close()
+        if self._owns_transport:
+            self.transport.close()
+
+    def _release(self) -> list:
+        """Forget every client, close the shared components and return the auths to close."""
+        with self._lock:
+            self._clients.clear()
+            auths, self._auths = list(self._auths.values()), {}
+
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.batch_validator is not None:
+            self.batch_validator.close()
+        return auths
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class AsyncClientPool(ClientPool):
+    """ClientPool serving AsyncEtimsOClients over one shared httpx client."""
+
+    client_class = AsyncEtimsOClient
+    auth_class = AsyncAuthOClient
+
+    def _build_transport(self):
+        return AsyncHttpTransport(self.config.get("http", {}))
+
+    async def close(self):
+        for auth in self._release():
+            # Joins the token refresher thread, which would block the loop
+            await asyncio.to_thread(auth.close)
+        if self._owns_transport:
+            await self.transport.close()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with the async pool")
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
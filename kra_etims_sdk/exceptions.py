@@ -4,6 +4,14 @@ class ValidationException(Exception):
         self.errors = errors or []
 
 
+class ResponseValidationException(ValidationException):
+    """A successful response did not match its typed response model; nothing was rejected by KRA."""
+
+    def __init__(self, message="Response validation failed", errors=None, response=None):
+        super().__init__(message, errors)
+        self.response = response
+
+
 class AuthenticationException(Exception):
     def __init__(self, message="Authentication failed", status_code=401):
         super().__init__(message)
@@ -16,3 +24,25 @@ class ApiException(Exception):
         self.status_code = status_code
         self.error_code = error_code
         self.details = details
+
+
+class CircuitOpenException(ApiException):
+    def __init__(self, endpoint_key, retry_after=0.0):
+        super().__init__(
+            f"Circuit open for endpoint [{endpoint_key}]; failing fast",
+            503,
+            details={"endpoint": endpoint_key, "retry_after": retry_after},
+        )
+        self.endpoint_key = endpoint_key
+        self.retry_after = retry_after
+
+
+class RateLimitException(ApiException):
+    def __init__(self, endpoint_key, retry_after=0.0):
+        super().__init__(
+            f"Client rate limit reached for endpoint [{endpoint_key}]",
+            429,
+            details={"endpoint": endpoint_key, "retry_after": retry_after},
+        )
+        self.endpoint_key = endpoint_key
+        self.retry_after = retry_after
@@ -0,0 +1,153 @@
+import codecs
+import json
+import re
+from typing import Any, List
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class _Incomplete(Exception):
+    """The buffer ends before the current step does."""
+
+
+class RecordParser:
+    """
+    Push parser for a response of the shape
+    ``{..., "data": {..., "<list_key>": [record, ...]}, ...}``.
+
+    feed() takes raw body chunks and returns the records completed so
+    far, so memory is bounded by one chunk plus one record. Top-level
+    fields such as resultCd collect in ``head`` as they are read, and
+    ``in_list`` turns true once the record list starts. Everything
+    outside the list is decoded whole. close() takes the end of the body
+    and raises ValueError if the document is malformed or truncated.
+    """
+
+    def __init__(self, list_key: str, container: str = "data"):
+        self.list_key = list_key
+        self.container = container
+        self.head = {}
+        self.in_list = False
+        self.done = False
+
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._final = False
+        self._started = False
+        # Open containers, innermost last: [kind, state] with kind "top",
+        # "data" or "list" and state "first", "item" or "sep"
+        self._stack = []
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+        return self._run()
+
+    def close(self) -> List[Any]:
+        self._buffer = self._buffer[self._pos:] + self._text.decode(b"", final=True)
+        self._pos = 0
+        self._final = True
+        records = self._run()
+        if not self.done:
+            raise ValueError("Truncated JSON response")
+        return records
+
+    def _run(self) -> List[Any]:
+        records = []
+        while not self.done:
+            start = self._pos
+            try:
+                self._step(records)
+            except _Incomplete:
+                # Each step either completes or leaves the position untouched
+                self._pos = start
+                break
+        return records
+
+    def _step(self, records: list):
+        if not self._stack:
+            if self._started:
+                self._trailer()
+            else:
+                self._expect("{")
+                self._stack.append(["top", "first"])
+                self._started = True
+            return
+
+        frame = self._stack[-1]
+        kind, state = frame
+        char = self._peek()
+
+        if state != "item":
+            if char == ("]" if kind == "list" else "}"):
+                self._pos += 1
+                self._stack.pop()
+                return
+            if state == "sep":
+                if char != ",":
+                    raise ValueError(f"Expected ',' at position {self._pos}")
+                self._pos += 1
+                frame[1] = "item"
+                return
+
+        if kind == "list":
+            records.append(self._value())
+            frame[1] = "sep"
+            return
+
+        key = self._value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected an object key at position {self._pos}")
+        self._expect(":")
+        char = self._peek()
+
+        if kind == "top" and key == self.container and char == "{":
+            self._pos += 1
+            frame[1] = "sep"
+            self._stack.append(["data", "first"])
+        elif kind == "data" and key == self.list_key and char == "[":
+            self._pos += 1
+            frame[1] = "sep"
+            self._stack.append(["list", "first"])
+            self.in_list = True
+        else:
+            value = self._value()
+            if kind == "top":
+                self.head[key] = value
+            frame[1] = "sep"
+
+    def _trailer(self):
+        match = _WHITESPACE.match(self._buffer, self._pos)
+        self._pos = match.end()
+        if self._pos < len(self._buffer):
+            raise ValueError(f"Extra data at position {self._pos}")
+        if not self._final:
+            raise _Incomplete
+        self.done = True
+
+    def _peek(self) -> str:
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos >= len(self._buffer):
+            raise _Incomplete
+        return self._buffer[self._pos]
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at position {self._pos}")
+        self._pos += 1
+
+    def _value(self):
+        self._peek()
+        try:
+            value, end = _DECODER.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            raise _Incomplete
+        # A number at the very end of the buffer may continue in the next chunk
+        if end == len(self._buffer) and not self._final:
+            raise _Incomplete
+        self._pos = end
+        return value
@@ -0,0 +1,103 @@
+from typing import Any, Iterator, Optional, Sequence
+
+from .exceptions import ResponseValidationException
+from .validator import Validator, _validation_error
+
+
+class LazyList(Sequence):
+    """
+    Read-only list over the raw records of a response that builds each
+    record's model the first time it is accessed, and keeps it.
+
+    Building a response whose data holds a LazyList costs the same for
+    ten records or a hundred thousand; a caller reading a few records
+    pays for just those. ``raw`` is the decoded list as received, and
+    ``location`` its path in the response, which prefixes the error keys
+    of its records.
+    """
+
+    __slots__ = ("raw", "model", "location", "_built")
+
+    def __init__(self, raw: list, model, location: Optional[str] = None):
+        self.raw = raw
+        self.model = model
+        self.location = location
+        self._built = [None] * len(raw)
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.raw)))]
+
+        built = self._built[index]
+        if built is None:
+            location = f"{self.location}.{index}" if self.location else str(index)
+            built = self._built[index] = build(self.model, self.raw[index], location)
+        return built
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self.raw)):
+            yield self[index]
+
+    def __repr__(self):
+        return f"LazyList[{self.model.__name__}]({len(self.raw)} records)"
+
+
+class LazyItems:
+    """
+    Annotation of a response field holding a list of ``model`` records:
+    ``Annotated[LazyList, LazyItems(Model)]``. Validation wraps the list
+    in a LazyList without looking at its records; dumping gives back the
+    raw list.
+    """
+
+    def __init__(self, model):
+        self.model = model
+
+    def __get_pydantic_core_schema__(self, source, handler):
+        from pydantic_core import core_schema
+
+        def wrap(value):
+            if isinstance(value, LazyList):
+                return value
+            if not isinstance(value, list):
+                raise ValueError("Input should be a valid list")
+            return LazyList(value, self.model)
+
+        return core_schema.no_info_plain_validator_function(
+            wrap,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda value: value.raw),
+        )
+
+
+def build(model, data, location: Optional[str] = None):
+    """
+    Validate a response (or one record of it) into ``model``. Errors
+    are keyed below ``location`` and raised as ResponseValidationException.
+    """
+    try:
+        built = model.model_validate(data)
+    except Exception as e:
+        if not isinstance(e, _validation_error()):
+            raise
+        messages = Validator._messages(e)
+        if location:
+            messages = {f"{location}.{field}" if field else location: message for field, message in messages.items()}
+        raise ResponseValidationException("Response validation failed", messages, data)
+    _locate(built, location)
+    return built
+
+
+def _locate(model, location: Optional[str]):
+    # Tell the LazyLists of a freshly built model where they sit
+    from pydantic import BaseModel
+
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        path = f"{location}.{name}" if location else name
+        if isinstance(value, LazyList):
+            value.location = path
+        elif isinstance(value, BaseModel):
+            _locate(value, path)
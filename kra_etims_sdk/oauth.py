@@ -1,25 +1,117 @@
-import base64, json, time, os, requests
+import base64, time, threading
 from .exceptions import AuthenticationException
+from .token_store import FileTokenStore
 
 
 class AuthOClient:
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, store=None):
         self.config = config
         self.cache_file = config.get("cache_file", "/tmp/kra_etims_token.json")
+        self.store = store or FileTokenStore(
+            self.cache_file,
+            lock_timeout=float(config.get("token", {}).get("lock_timeout", 30)),
+        )
+
+        token_config = config.get("token", {})
+        self.refresh_margin = float(token_config.get("refresh_margin", 300))
+        self.refresh_retry_interval = float(token_config.get("refresh_retry_interval", 30))
+
+        self._cached = None
+        self._lock = threading.Lock()
+        self._refresher = None
+        self._stop_refresher = threading.Event()
+
+        if token_config.get("background_refresh"):
+            self.start_refresher()
 
     def token(self, force=False):
         if not force:
-            cached = self._read_cache()
+            cached = self._cached
             if cached and time.time() < cached["expires_at"]:
                 return cached["access_token"]
 
-        token = self._fetch_token()
-        self._write_cache(token)
-        return token["access_token"]
+        with self._lock:
+            stale = self._cached["access_token"] if force and self._cached else None
+
+            if not force:
+                # Another thread may have refreshed while we waited for the lock
+                cached = self._cached
+                if cached and time.time() < cached["expires_at"]:
+                    return cached["access_token"]
+
+                cached = self._read_cache()
+                if cached and time.time() < cached["expires_at"]:
+                    self._cached = cached
+                    return cached["access_token"]
+
+            return self._refresh(stale=stale)["access_token"]
 
     def forget_token(self):
-        if os.path.exists(self.cache_file):
-            os.unlink(self.cache_file)
+        with self._lock:
+            self._cached = None
+            self.store.delete()
+
+    # -----------------------------
+    # BACKGROUND REFRESH
+    # -----------------------------
+    def start_refresher(self):
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+
+        self._stop_refresher.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            name="kra-etims-token-refresher",
+            daemon=True,
+        )
+        self._refresher.start()
+
+    def stop_refresher(self, timeout=None):
+        self._stop_refresher.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout)
+            self._refresher = None
+
+    def close(self):
+        self.stop_refresher()
+
+    def _refresh_loop(self):
+        just_refreshed = False
+        while not self._stop_refresher.is_set():
+            cached = self._cached
+            wait = cached["expires_at"] - self.refresh_margin - time.time() if cached else 0
+
+            if wait > 0 or just_refreshed:
+                # A token that lives shorter than the margin must not spin the loop
+                self._stop_refresher.wait(wait if wait > 0 else self.refresh_retry_interval)
+                just_refreshed = False
+                continue
+
+            try:
+                with self._lock:
+                    self._refresh(margin=self.refresh_margin)
+                just_refreshed = True
+            except Exception:
+                # The current token is still usable; try again shortly
+                self._stop_refresher.wait(self.refresh_retry_interval)
+
+    def _refresh(self, stale=None, margin=0):
+        # Single flight across processes: whoever holds the store lock
+        # fetches, everyone queued behind it picks up the stored result
+        with self.store.lock():
+            cached = self._read_cache()
+            if (
+                cached
+                and cached["access_token"] != stale
+                and cached["expires_at"] - margin > time.time()
+            ):
+                self._cached = cached
+                return cached
+
+            token = self._fetch_token()
+            self._write_cache(token)
+            self._cached = token
+            return token
 
     def _fetch_token(self):
         env = self.config["env"]
@@ -39,6 +131,8 @@ class AuthOClient:
             "Accept": "application/json"
         }
 
+        import requests
+
         r = requests.get(url, headers=headers, timeout=15)
         if r.status_code != 200:
             raise AuthenticationException(r.text, r.status_code)
@@ -53,11 +147,7 @@ class AuthOClient:
         }
 
     def _read_cache(self):
-        if not os.path.exists(self.cache_file):
-            return None
-        with open(self.cache_file) as f:
-            return json.load(f)
+        return self.store.read()
 
     def _write_cache(self, data):
-        with open(self.cache_file, "w") as f:
-            json.dump(data, f)
+        self.store.write(data)
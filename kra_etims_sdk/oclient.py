@@ -1,95 +1,273 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Union
 from .base_oclient import BaseOClient
-from .validator import Validator
+from .exceptions import ResponseValidationException
+from .lazy import build
+from .validator import BatchValidator, Validator
+
+# A payload dict, or an instance of the endpoint's schema model
+Payload = Union[dict, "BaseModel"]
+
+# A response (or streamed record) dict, or its model when typed responses are on
+Response = Union[dict, "BaseModel"]
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 
 class EtimsOClient(BaseOClient):
-    def __init__(self, config: dict, auth):
-        super().__init__(config, auth)
-        self.validator = Validator()
+    def __init__(self, config: dict, auth, transport=None, shared=None):
+        super().__init__(config, auth, transport, shared)
+        validation_config = config.get("validation", {})
+        # Opt-in: remember outcomes of recent payloads, so resubmissions skip pydantic
+        self.validator = Validator(cache_size=int(validation_config.get("cache_size", 0)))
+        # Trusted callers validate payloads themselves; dicts are then sent as given
+        self.trusted_input = bool(validation_config.get("trusted", False))
+
+        # Opt-in: endpoint methods return response models (see schemas.RESPONSES)
+        # whose record lists are built lazily, instead of dicts
+        self.typed_responses = bool(config.get("responses", {}).get("typed", False))
 
-    def _validate(self, data: dict, schema: str) -> dict:
+    @classmethod
+    def _build_shared(cls, config) -> dict:
+        shared = super()._build_shared(config)
+        # Opt-in: bulk methods validate across worker processes before sending
+        validation_config = config.get("validation", {})
+        processes = validation_config.get("processes")
+        if processes:
+            shared["batch_validator"] = BatchValidator(
+                max_workers=int(processes),
+                chunk_size=int(validation_config.get("chunk_size", 64)),
+            )
+        else:
+            shared["batch_validator"] = None
+        return shared
+
+    def _close_shared(self):
+        if self.batch_validator is not None and self._owns_shared:
+            self.batch_validator.close()
+        super()._close_shared()
+
+    def _validate(self, data: Payload, schema: str) -> dict:
+        if not isinstance(data, dict):
+            return self.validator.serialize(data, schema)
+        if self.trusted_input:
+            return data
         return self.validator.validate(data, schema)
 
+    def _post(self, endpoint_key: str, data: dict) -> Response:
+        response = self.post(endpoint_key, data)
+        if not self.typed_responses:
+            return response
+        return self._typed(endpoint_key, response)
+
+    def _stream(self, endpoint_key: str, list_key: str, data: dict):
+        records = self.post_stream(endpoint_key, list_key, data)
+        if not self.typed_responses:
+            return records
+        from .schemas import STREAM_RECORDS
+        model = STREAM_RECORDS[endpoint_key]
+        return (build(model, record, str(index)) for index, record in enumerate(records))
+
+    @staticmethod
+    def _typed(endpoint_key: str, response: dict):
+        from .schemas import RESPONSES, EtimsResponse
+        try:
+            return build(RESPONSES.get(endpoint_key, EtimsResponse), response)
+        except ResponseValidationException:
+            if endpoint_key.startswith("select"):
+                raise
+            # KRA accepted the save: hand back the response unchecked rather
+            # than an error a caller could take for a rejection and resubmit
+            return EtimsResponse.model_construct(**response)
+
     # -----------------------------
     # INITIALIZATION
     # -----------------------------
-    def select_init_osdc_info(self, data: dict) -> dict:
-        return self.post("selectInitOsdcInfo", self._validate(data, "selectInitOsdcInfo"))
+    def select_init_osdc_info(self, data: Payload) -> Response:
+        return self._post("selectInitOsdcInfo", self._validate(data, "selectInitOsdcInfo"))
 
     # -----------------------------
     # CODE LISTS
     # -----------------------------
-    def select_code_list(self, data: dict) -> dict:
-        return self.post("selectCodeList", self._validate(data, "lastReqOnly"))
+    def select_code_list(self, data: Payload) -> Response:
+        return self._post("selectCodeList", self._validate(data, "lastReqOnly"))
 
     # -----------------------------
     # CUSTOMER / BRANCH
     # -----------------------------
-    def select_customer(self, data: dict) -> dict:
-        return self.post("selectCustomer", self._validate(data, "selectCustomer"))
+    def select_customer(self, data: Payload) -> Response:
+        return self._post("selectCustomer", self._validate(data, "selectCustomer"))
 
-    def select_branches(self, data: dict) -> dict:
-        return self.post("selectBhfList", self._validate(data, "lastReqOnly"))
+    def select_branches(self, data: Payload) -> Response:
+        return self._post("selectBhfList", self._validate(data, "lastReqOnly"))
 
-    def save_branch_customer(self, data: dict) -> dict:
-        return self.post("saveBhfCustomer", self._validate(data, "saveBhfCustomer"))
+    def save_branch_customer(self, data: Payload) -> Response:
+        return self._post("saveBhfCustomer", self._validate(data, "saveBhfCustomer"))
 
-    def save_branch_user(self, data: dict) -> dict:
-        return self.post("saveBhfUser", self._validate(data, "saveBhfUser"))
+    def save_branch_user(self, data: Payload) -> Response:
+        return self._post("saveBhfUser", self._validate(data, "saveBhfUser"))
 
-    def save_branch_insurance(self, data: dict) -> dict:
-        return self.post("saveBhfInsurance", self._validate(data, "saveBhfInsurance"))
+    def save_branch_insurance(self, data: Payload) -> Response:
+        return self._post("saveBhfInsurance", self._validate(data, "saveBhfInsurance"))
 
     # -----------------------------
     # ITEM
     # -----------------------------
-    def select_item_classes(self, data: dict) -> dict:
-        return self.post("selectItemClsList", self._validate(data, "lastReqOnly"))
+    def select_item_classes(self, data: Payload) -> Response:
+        return self._post("selectItemClsList", self._validate(data, "lastReqOnly"))
 
-    def select_items(self, data: dict) -> dict:
-        return self.post("selectItemList", self._validate(data, "lastReqOnly"))
+    def select_items(self, data: Payload) -> Response:
+        return self._post("selectItemList", self._validate(data, "lastReqOnly"))
 
-    def save_item(self, data: dict) -> dict:
-        return self.post("saveItem", self._validate(data, "saveItem"))
+    def save_item(self, data: Payload) -> Response:
+        return self._post("saveItem", self._validate(data, "saveItem"))
 
-    def save_item_composition(self, data: dict) -> dict:
-        return self.post("saveItemComposition", self._validate(data, "saveItemComposition"))
+    def save_item_composition(self, data: Payload) -> Response:
+        return self._post("saveItemComposition", self._validate(data, "saveItemComposition"))
 
     # -----------------------------
     # IMPORTED ITEMS
     # -----------------------------
-    def select_imported_items(self, data: dict) -> dict:
-        return self.post("selectImportItemList", self._validate(data, "lastReqOnly"))
+    def select_imported_items(self, data: Payload) -> Response:
+        return self._post("selectImportItemList", self._validate(data, "lastReqOnly"))
 
-    def update_imported_item(self, data: dict) -> dict:
-        return self.post("updateImportItem", self._validate(data, "importItemUpdate"))
+    def update_imported_item(self, data: Payload) -> Response:
+        return self._post("updateImportItem", self._validate(data, "importItemUpdate"))
 
     # -----------------------------
     # PURCHASES
     # -----------------------------
-    def select_purchases(self, data: dict) -> dict:
-        return self.post("selectTrnsPurchaseSalesList", self._validate(data, "lastReqOnly"))
+    def select_purchases(self, data: Payload) -> Response:
+        return self._post("selectTrnsPurchaseSalesList", self._validate(data, "lastReqOnly"))
 
-    def save_purchase(self, data: dict) -> dict:
-        return self.post("insertTrnsPurchase", self._validate(data, "insertTrnsPurchase"))
+    def save_purchase(self, data: Payload) -> Response:
+        return self._post("insertTrnsPurchase", self._validate(data, "insertTrnsPurchase"))
 
-    def save_sales_transaction(self, data: dict) -> dict:
-        return self.post("saveTrnsSalesOsdc", self._validate(data, "saveTrnsSalesOsdc"))
+    def save_sales_transaction(self, data: Payload) -> Response:
+        return self._post("saveTrnsSalesOsdc", self._validate(data, "saveTrnsSalesOsdc"))
 
     # -----------------------------
     # STOCK
     # -----------------------------
-    def select_stock_movement(self, data: dict) -> dict:
-        return self.post("selectStockMoveList", self._validate(data, "lastReqOnly"))
+    def select_stock_movement(self, data: Payload) -> Response:
+        return self._post("selectStockMoveList", self._validate(data, "lastReqOnly"))
 
-    def save_stock_io(self, data: dict) -> dict:
-        return self.post("insertStockIO", self._validate(data, "insertStockIO"))
+    def save_stock_io(self, data: Payload) -> Response:
+        return self._post("insertStockIO", self._validate(data, "insertStockIO"))
 
-    def save_stock_master(self, data: dict) -> dict:
-        return self.post("saveStockMaster", self._validate(data, "saveStockMaster"))
+    def save_stock_master(self, data: Payload) -> Response:
+        return self._post("saveStockMaster", self._validate(data, "saveStockMaster"))
 
     # -----------------------------
     # NOTICES
     # -----------------------------
-    def select_notice_list(self, data: dict) -> dict:
-        return self.post("selectNoticeList", self._validate(data, "lastReqOnly"))
+    def select_notice_list(self, data: Payload) -> Response:
+        return self._post("selectNoticeList", self._validate(data, "lastReqOnly"))
+
+    # -----------------------------
+    # STREAMING SELECTS
+    # -----------------------------
+    # Yield the records of large select responses one at a time instead of
+    # decoding the whole body; see BaseOClient.post_stream
+    def stream_items(self, data: Payload) -> Iterator[Response]:
+        return self._stream("selectItemList", "itemList", self._validate(data, "lastReqOnly"))
+
+    def stream_purchases(self, data: Payload) -> Iterator[Response]:
+        return self._stream("selectTrnsPurchaseSalesList", "saleList", self._validate(data, "lastReqOnly"))
+
+    def stream_imported_items(self, data: Payload) -> Iterator[Response]:
+        return self._stream("selectImportItemList", "itemList", self._validate(data, "lastReqOnly"))
+
+    def stream_stock_movement(self, data: Payload) -> Iterator[Response]:
+        return self._stream("selectStockMoveList", "stockList", self._validate(data, "lastReqOnly"))
+
+    # -----------------------------
+    # BULK SUBMISSION
+    # -----------------------------
+    def save_sales_transactions_bulk(self, items: Iterable[Payload], max_concurrency: int = 8) -> List[Union[Response, Exception]]:
+        """
+        Validate and submit many invoices with at most ``max_concurrency``
+        requests in flight. Returns one outcome per input, in input order:
+        the response dict, or the exception that payload raised. A failing
+        payload never stops the rest of the batch.
+
+        ``items`` is read as the requests go out, so sending starts at once;
+        only the outcomes are kept for the whole batch. With
+        ``config["validation"]["processes"]``, payloads are validated across
+        processes a window at a time, just ahead of sending.
+        """
+        return self._bulk("saveTrnsSalesOsdc", "saveTrnsSalesOsdc", items, max_concurrency)
+
+    def save_purchases_bulk(self, items: Iterable[Payload], max_concurrency: int = 8) -> List[Union[Response, Exception]]:
+        return self._bulk("insertTrnsPurchase", "insertTrnsPurchase", items, max_concurrency)
+
+    def save_stock_io_bulk(self, items: Iterable[Payload], max_concurrency: int = 8) -> List[Union[Response, Exception]]:
+        return self._bulk("insertStockIO", "insertStockIO", items, max_concurrency)
+
+    def save_items_bulk(self, items: Iterable[Payload], max_concurrency: int = 8) -> List[Union[Response, Exception]]:
+        return self._bulk("saveItem", "saveItem", items, max_concurrency)
+
+    def _bulk(self, endpoint_key, schema, items, max_concurrency):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # A fixed set of workers pulls from one shared iterator, so items are
+        # read (and batch-validated) only as fast as they are sent
+        results = {}
+        pending = enumerate(chain.from_iterable(self._bulk_windows(schema, items, max_concurrency)))
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                with lock:
+                    job = next(pending, None)
+                if job is None:
+                    return
+                index, (data, validated) = job
+                results[index] = self._outcome(self._submit, endpoint_key, schema, data, validated)
+
+        # Keep max_concurrency within config["http"]["pool_maxsize"] so every
+        # worker gets a pooled connection
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="kra-etims-bulk") as pool:
+            for future in [pool.submit(worker) for _ in range(max_concurrency)]:
+                future.result()
+        return [results[index] for index in range(len(results))]
+
+    def _bulk_windows(self, schema, items, max_concurrency):
+        """
+        Lists of (payload, validated) pairs, read from ``items`` a window at
+        a time. With a batch validator, the dicts of each window are
+        validated across its processes before the window is handed out.
+        """
+        validator = None if self.trusted_input else self.batch_validator
+        size = max_concurrency if validator is None else validator.window_size
+        items = iter(items)
+
+        while True:
+            window = list(islice(items, size))
+            if not window:
+                return
+            jobs = [(data, False) for data in window]
+            if validator is not None:
+                indexes = [index for index, data in enumerate(window) if isinstance(data, dict)]
+                outcomes = validator.validate_many(
+                    [window[index] for index in indexes], schema, reference=self.validator.reference
+                )
+                for index, outcome in zip(indexes, outcomes):
+                    jobs[index] = (outcome, True)
+            yield jobs
+
+    def _submit(self, endpoint_key, schema, data, validated):
+        if isinstance(data, Exception):
+            raise data
+        return self._post(endpoint_key, data if validated else self._validate(data, schema))
+
+    @staticmethod
+    def _outcome(method, *args):
+        try:
+            return method(*args)
+        except Exception as e:
+            return e
@@ -0,0 +1,128 @@
+import threading
+import time
+from typing import Optional
+
+from .exceptions import RateLimitException
+
+
+class TokenBucket:
+    """
+    Token bucket allowing ``rate`` calls per second with bursts of up to
+    ``burst`` calls.
+
+    ``reserve`` takes a token even when none is left yet and returns how
+    long the caller must wait for it, so the sync client can sleep and the
+    async client can ``await asyncio.sleep`` on the same bucket.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Seconds to wait for the next token, or None if that exceeds ``max_wait``."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+
+            self._tokens -= 1
+            return wait
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            return max(0.0, min(self.burst, self._tokens + elapsed * self.rate))
+
+
+class RateLimiter:
+    """
+    Client-side throttle with one TokenBucket per TIN, branch and endpoint
+    class, configured from ``config["rate_limit"]``:
+
+    - ``select``: ``{"rate": ..., "burst": ...}`` for ``select*`` endpoints
+    - ``save``: the same for ``save*``, ``insert*`` and ``update*`` endpoints
+    - ``blocking``: wait for a token (default True); when False a call
+      that would have to wait raises RateLimitException instead
+    - ``max_wait``: longest a blocking call waits before raising
+      RateLimitException (default: no limit)
+
+    An endpoint class without settings is not throttled.
+    """
+
+    def __init__(self, limits: dict, blocking: bool = True, max_wait: Optional[float] = None):
+        self.limits = {
+            endpoint_class: (float(settings["rate"]), settings.get("burst"))
+            for endpoint_class, settings in limits.items()
+            if settings
+        }
+        self.blocking = blocking
+        self.max_wait = max_wait
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, rate_config: dict) -> Optional["RateLimiter"]:
+        rate_config = rate_config or {}
+        if rate_config.get("enabled", True) is False:
+            return None
+
+        limits = {key: rate_config.get(key) for key in ("select", "save") if rate_config.get(key)}
+        if not limits:
+            return None
+
+        max_wait = rate_config.get("max_wait")
+        return cls(
+            limits,
+            blocking=bool(rate_config.get("blocking", True)),
+            max_wait=float(max_wait) if max_wait is not None else None,
+        )
+
+    @staticmethod
+    def endpoint_class(endpoint_key: str) -> str:
+        return "select" if endpoint_key.startswith("select") else "save"
+
+    def bucket(self, tin: str, bhf_id: str, endpoint_key: str) -> Optional[TokenBucket]:
+        endpoint_class = self.endpoint_class(endpoint_key)
+        if endpoint_class not in self.limits:
+            return None
+
+        key = (tin, bhf_id, endpoint_class)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    rate, burst = self.limits[endpoint_class]
+                    bucket = TokenBucket(rate, burst)
+                    self._buckets[key] = bucket
+        return bucket
+
+    def reserve(self, tin: str, bhf_id: str, endpoint_key: str, max_wait: Optional[float] = None) -> float:
+        """
+        Seconds the caller must wait before sending; raises RateLimitException
+        instead of waiting too long. ``max_wait`` caps the wait for this call
+        only, e.g. to what is left of a retry deadline.
+        """
+        bucket = self.bucket(tin, bhf_id, endpoint_key)
+        if bucket is None:
+            return 0.0
+
+        if not self.blocking:
+            max_wait = 0.0
+        elif self.max_wait is not None:
+            max_wait = self.max_wait if max_wait is None else min(self.max_wait, max_wait)
+        wait = bucket.reserve(max_wait)
+        if wait is None:
+            raise RateLimitException(endpoint_key, max(0.0, (1 - bucket.available) / bucket.rate))
+        return wait
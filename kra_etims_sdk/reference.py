@@ -0,0 +1,104 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+from .sync_store import SyncStore, tenant_key
+
+# KRA code classes (cdCls) of selectCodeList checked on items
+TAX_TYPE_CLASS = "04"
+QUANTITY_UNIT_CLASS = "10"
+PACKAGING_UNIT_CLASS = "17"
+
+# item field -> code class its value must belong to
+CODE_FIELDS = {
+    "taxTyCd": TAX_TYPE_CLASS,
+    "pkgUnitCd": PACKAGING_UNIT_CLASS,
+    "qtyUnitCd": QUANTITY_UNIT_CLASS,
+}
+
+
+class ReferenceData:
+    """
+    In-memory index of the code lists and item classes that DeltaSync
+    keeps in a SyncStore, for lookups on every line item without a call
+    to KRA.
+
+    ``refresh()`` reads the tenant's selectCodeList and
+    selectItemClsList records once into dicts (codes per cdCls, item
+    classes per itemClsCd), so each lookup is a dict access; rows with
+    useYn "N" are left out. Call it after a sync. The new tables replace
+    the old ones in one assignment, so concurrent readers see either,
+    and ``version`` is bumped so cached validation outcomes are not
+    reused across refreshes.
+
+    Set it on a Validator (``client.validator.reference``), InvoiceBuilder
+    or StreamingValidator to have taxTyCd, pkgUnitCd, qtyUnitCd and
+    itemClsCd of items checked during validation. A table that has
+    never been synced is not checked. BatchValidator ships a pickled
+    copy to its workers: the copy keeps the tables but not the store,
+    so it cannot refresh.
+    """
+
+    def __init__(self, store: SyncStore, tenant: str):
+        self.store = store
+        self.tenant = tenant
+        self.version = 0
+        self._tables = ({}, {})
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def __getstate__(self):
+        return {"tenant": self.tenant, "version": self.version, "_tables": self._tables}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.store = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_client(cls, client, store: SyncStore) -> "ReferenceData":
+        """The reference data a client's DeltaSync stores for its TIN and branch."""
+        return cls(store, tenant_key(client.settings))
+
+    def refresh(self) -> None:
+        codes: Dict[str, Dict[str, dict]] = {}
+        for record in self.store.records(self.tenant, "selectCodeList"):
+            if record.get("useYn") != "N":
+                codes.setdefault(record.get("cdCls"), {})[record.get("cd")] = record
+
+        item_classes = {
+            record.get("itemClsCd"): record
+            for record in self.store.records(self.tenant, "selectItemClsList")
+            if record.get("useYn") != "N"
+        }
+
+        with self._lock:
+            self._tables = (codes, item_classes)
+            self.version += 1
+
+    def code(self, cd_cls: str, cd: str) -> Optional[dict]:
+        """The code record (cdNm, userDfnCd1, ...) of ``cd`` in class ``cd_cls``."""
+        return self._tables[0].get(cd_cls, {}).get(cd)
+
+    def codes(self, cd_cls: str) -> Dict[str, dict]:
+        return dict(self._tables[0].get(cd_cls, {}))
+
+    def item_class(self, item_cls_cd: str) -> Optional[dict]:
+        """The item class record (itemClsNm, taxTyCd, ...) of ``item_cls_cd``."""
+        return self._tables[1].get(item_cls_cd)
+
+    def unknown_codes(self, item: Any) -> List[str]:
+        """One message per code of ``item`` (a model or dict) missing from the synced tables."""
+        codes, item_classes = self._tables
+        value = item.get if isinstance(item, dict) else lambda field: getattr(item, field, None)
+
+        errors = []
+        for field, cd_cls in CODE_FIELDS.items():
+            cd = value(field)
+            table = codes.get(cd_cls)
+            if cd is not None and table and cd not in table:
+                errors.append(f"{field} '{cd}' is not a code of class {cd_cls}")
+
+        item_cls_cd = value("itemClsCd")
+        if item_cls_cd is not None and item_classes and item_cls_cd not in item_classes:
+            errors.append(f"itemClsCd '{item_cls_cd}' is not a known item class")
+        return errors
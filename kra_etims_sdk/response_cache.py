@@ -0,0 +1,259 @@
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Union
+
+# Slow-changing reference data: the endpoints worth caching first
+REFERENCE_ENDPOINTS = ("selectCodeList", "selectItemClsList", "selectBhfList", "selectNoticeList")
+
+
+class CacheBackend(ABC):
+    """
+    Where ResponseCache keeps encoded responses until they expire.
+
+    ``put()`` evicts the least recently used entries beyond
+    ``max_entries``; ``get()`` counts as a use and never returns an
+    expired entry. ``blocking`` backends do I/O, which the async client
+    keeps off the event loop.
+    """
+
+    blocking = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """The unexpired body stored under ``key``, or None."""
+
+    @abstractmethod
+    def put(self, key: str, endpoint: str, body: str, ttl: float) -> None:
+        """Store ``body`` for ``ttl`` seconds, evicting beyond ``max_entries``."""
+
+    @abstractmethod
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """Drop the entries of ``endpoint``, or every entry."""
+
+    @abstractmethod
+    def __len__(self):
+        """Entries currently stored, expired ones included until evicted."""
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    OrderedDict in LRU order with monotonic-clock expiry; each process
+    (and each ClientPool) fills its own.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (endpoint, body, expires_at)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, endpoint, body, ttl):
+        with self._lock:
+            self._entries[key] = (endpoint, body, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint=None):
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [key for key, entry in self._entries.items() if entry[0] == endpoint]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SqliteCacheBackend(CacheBackend):
+    """
+    SQLite database shared by every process on a host, so terminals on
+    one machine share their cached responses. Expiry uses wall-clock
+    time; each hit records its use for LRU eviction.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, max_entries: int = 256, timeout: float = 30):
+        # Only loaded when the sqlite backend is configured
+        import sqlite3
+
+        self.path = path
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                " cache_key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, body TEXT NOT NULL,"
+                " expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS response_cache_used_at ON response_cache (used_at)")
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM response_cache WHERE cache_key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute("UPDATE response_cache SET used_at = ? WHERE cache_key = ?", (now, key))
+        return row[0] if row else None
+
+    def put(self, key, endpoint, body, ttl):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?, ?)", (key, endpoint, body, now + ttl, now)
+                )
+                self._conn.execute("DELETE FROM response_cache WHERE expires_at <= ?", (now,))
+                self._conn.execute(
+                    "DELETE FROM response_cache WHERE cache_key IN (SELECT cache_key FROM response_cache"
+                    " ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def invalidate(self, endpoint=None):
+        with self._lock:
+            if endpoint is None:
+                self._conn.execute("DELETE FROM response_cache")
+            else:
+                self._conn.execute("DELETE FROM response_cache WHERE endpoint = ?", (endpoint,))
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM response_cache").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """
+    TTL cache of successful responses, per endpoint key, in front of
+    BaseOClient._send. Only the endpoints given a TTL are cached, and
+    never while streaming. Entries are keyed by base URL (so sandbox and
+    production never share one), TIN, branch, endpoint and the canonical
+    JSON of the request data, so a different lastReqDt is a different
+    entry. Responses are stored as JSON, so a
+    hit returns a fresh dict the caller may modify.
+
+    Settings are read from ``config["response_cache"]``:
+
+    - ``endpoints``: endpoint keys to cache, as a list (each gets
+      ``ttl``) or a dict of endpoint key to TTL seconds
+    - ``ttl``: default TTL in seconds (default 300)
+    - ``max_entries``: entries kept before LRU eviction (default 256)
+    - ``backend``: ``"memory"`` (default) or ``"sqlite"`` with ``path``
+    """
+
+    def __init__(self, backend: CacheBackend, ttls: Dict[str, float]):
+        self.backend = backend
+        self.ttls = dict(ttls)
+        self._counts = {endpoint: [0, 0] for endpoint in self.ttls}  # endpoint -> [hits, misses]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cache_config: dict, endpoints: Optional[Iterable[str]] = None) -> Optional["ResponseCache"]:
+        """The configured cache, or None; ``endpoints`` are the endpoint keys a client knows."""
+        cache_config = cache_config or {}
+        if cache_config.get("enabled", True) is False or not cache_config.get("endpoints"):
+            return None
+
+        ttls = _ttls(cache_config["endpoints"], float(cache_config.get("ttl", 300)))
+        if endpoints is not None:
+            known = set(endpoints)
+            unknown = [key for key in ttls if key not in known]
+            if unknown:
+                raise ValueError(f"config['response_cache'] names unknown endpoints: {', '.join(unknown)}")
+        not_selects = [endpoint for endpoint in ttls if not endpoint.startswith("select")]
+        if not_selects:
+            raise ValueError(f"Only select endpoints can be cached, got: {', '.join(not_selects)}")
+
+        max_entries = int(cache_config.get("max_entries", 256))
+        if max_entries < 1:
+            raise ValueError("config['response_cache']['max_entries'] must be at least 1")
+
+        backend = cache_config.get("backend", "memory")
+        if backend == "memory":
+            return cls(MemoryCacheBackend(max_entries), ttls)
+        if backend == "sqlite":
+            if not cache_config.get("path"):
+                raise ValueError("config['response_cache']['path'] is required for the sqlite backend")
+            return cls(SqliteCacheBackend(cache_config["path"], max_entries), ttls)
+        raise ValueError(f"Unknown response cache backend: {backend!r}")
+
+    def key(self, settings, endpoint_key: str, data) -> Optional[str]:
+        """The entry for a request, or None if its endpoint is not cached or the data is not JSON."""
+        if endpoint_key not in self.ttls:
+            return None
+        try:
+            encoded = json.dumps(
+                [settings.base_url, settings.tin, settings.bhf_id, endpoint_key, data],
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str, endpoint_key: str) -> Optional[dict]:
+        body = self.backend.get(key)
+        with self._lock:
+            self._counts[endpoint_key][0 if body is not None else 1] += 1
+        return json.loads(body) if body is not None else None
+
+    def put(self, key: str, endpoint_key: str, response: dict) -> None:
+        self.backend.put(key, endpoint_key, json.dumps(response), self.ttls[endpoint_key])
+
+    def invalidate(self, endpoint_key: Optional[str] = None) -> None:
+        self.backend.invalidate(endpoint_key)
+
+    @property
+    def blocking(self) -> bool:
+        return self.backend.blocking
+
+    def close(self) -> None:
+        self.backend.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            endpoints = {endpoint: {"hits": hits, "misses": misses} for endpoint, (hits, misses) in self._counts.items()}
+        return {
+            "size": len(self.backend),
+            "hits": sum(counts["hits"] for counts in endpoints.values()),
+            "misses": sum(counts["misses"] for counts in endpoints.values()),
+            "endpoints": endpoints,
+        }
+
+
+def _ttls(endpoints: Union[Dict[str, float], Iterable[str]], default: float) -> Dict[str, float]:
+    if isinstance(endpoints, dict):
+        return {endpoint: float(default if ttl is None else ttl) for endpoint, ttl in endpoints.items()}
+    return {endpoint: default for endpoint in endpoints}
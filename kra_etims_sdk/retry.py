@@ -0,0 +1,137 @@
+import random
+import sys
+import threading
+import time
+from typing import Iterable, Optional
+
+from .exceptions import ApiException, CircuitOpenException, RateLimitException
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of overall traffic.
+
+    Every call deposits ``ratio`` tokens and every retry spends one, with
+    ``min_retries`` available up front. When KRA is down for everyone the
+    budget drains and callers fail fast instead of multiplying the load.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            # Cap the balance so a long quiet spell cannot fund a retry storm
+            self._balance = min(self._balance + self.ratio, self.min_retries + 100 * self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed eTIMS call is retried and after how long.
+
+    Retried: connection errors and timeouts, HTTP statuses in
+    ``retry_statuses``, and eTIMS server errors (``resultCd`` 900 and up).
+    Client and business errors (``resultCd`` below 900) are never retried.
+    Only endpoint keys in ``retry_endpoints`` are retried; by default
+    these are the read-only ``select*`` endpoints, since repeating a
+    save could register a document twice.
+
+    Delays use exponential backoff with full jitter, and no retry starts
+    once ``deadline`` seconds have passed since the first attempt.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 5.0,
+        deadline: Optional[float] = None,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        retry_endpoints: Optional[Iterable[str]] = None,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_endpoints = frozenset(retry_endpoints) if retry_endpoints is not None else None
+        self.budget = budget or RetryBudget()
+
+    @classmethod
+    def from_config(cls, retry_config: dict) -> "RetryPolicy":
+        retry_config = retry_config or {}
+        if retry_config.get("enabled", True) is False:
+            return cls(max_attempts=1)
+
+        return cls(
+            max_attempts=retry_config.get("max_attempts", 3),
+            base_delay=float(retry_config.get("base_delay", 0.2)),
+            max_delay=float(retry_config.get("max_delay", 5.0)),
+            deadline=retry_config.get("deadline"),
+            retry_statuses=retry_config.get("retry_statuses", (429, 500, 502, 503, 504)),
+            retry_endpoints=retry_config.get("retry_endpoints"),
+            budget=RetryBudget(
+                ratio=float(retry_config.get("budget_ratio", 0.1)),
+                min_retries=int(retry_config.get("budget_min_retries", 10)),
+            ),
+        )
+
+    def is_retryable_endpoint(self, endpoint_key: str) -> bool:
+        if self.retry_endpoints is None:
+            return endpoint_key.startswith("select")
+        return endpoint_key in self.retry_endpoints
+
+    def is_retryable_error(self, error: Exception) -> bool:
+        if isinstance(error, (CircuitOpenException, RateLimitException)):
+            return False
+        if isinstance(error, ApiException):
+            if error.error_code is not None:
+                return error.error_code >= "900"
+            return error.status_code in self.retry_statuses
+        return is_transport_error(error)
+
+    def remaining(self, started: float) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - (time.monotonic() - started)
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+    def next_delay(self, endpoint_key: str, error: Exception, attempt: int, started: float) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to give up."""
+        if attempt >= self.max_attempts:
+            return None
+        if not self.is_retryable_endpoint(endpoint_key) or not self.is_retryable_error(error):
+            return None
+
+        delay = self.backoff(attempt)
+        remaining = self.remaining(started)
+        if remaining is not None and remaining <= delay:
+            return None
+
+        if not self.budget.withdraw():
+            return None
+        return delay
+
+
+def is_transport_error(error: Exception) -> bool:
+    # Neither HTTP library is imported just to classify an error: if one
+    # is not loaded yet, it cannot have raised
+    requests = sys.modules.get("requests")
+    if requests is not None and isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(error, httpx.TransportError)
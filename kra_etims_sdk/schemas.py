@@ -1,18 +1,83 @@
 from typing import List, Optional
 from decimal import Decimal
+import inspect
+from functools import wraps
 from typing_extensions import Annotated
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     conint,
     condecimal,
     StringConstraints,
+    ValidationInfo,
     model_validator,
     field_validator,
     AfterValidator,
 )
 import re
 
+from .amounts import invoice_aggregate_error, item_count_error, item_total_error
+from .lazy import LazyItems, LazyList
+
+
+# Validation context key set when header totals are checked outside the
+# model: InvoiceBuilder derives them, StreamingValidator sums the items
+AGGREGATES_CHECKED = "aggregates_checked"
+
+# Validation context key set by Validator.report: a list that collects
+# (model, message) for every failing rule instead of stopping at the first
+RULE_ERRORS = "rule_errors"
+
+# Validation context key holding a ReferenceData: item codes are then
+# checked against the synced code lists and item classes
+REFERENCE_DATA = "reference_data"
+
+
+# =========================================================
+# BASE MODEL
+# =========================================================
+
+class EtimsModel(BaseModel):
+    """Base for all schemas: validators are built on first use, not at import."""
+    model_config = ConfigDict(defer_build=True)
+
+
+def rule(func):
+    """
+    Model-level business rule, run after field validation. Raises like
+    any model validator unless the context collects RULE_ERRORS.
+    """
+    takes_info = len(inspect.signature(func).parameters) > 1
+
+    @wraps(func)
+    def check(self, info: ValidationInfo):
+        try:
+            return func(self, info) if takes_info else func(self)
+        except ValueError as e:
+            collected = info.context.get(RULE_ERRORS) if info.context else None
+            if collected is None:
+                raise
+            collected.append((self, str(e)))
+            return self
+
+    # pydantic reads the signature through __wrapped__; check always takes info
+    del check.__wrapped__
+    return model_validator(mode="after")(check)
+
+
+class ReferenceCodedItem(EtimsModel):
+    """Base for items whose taxTyCd, pkgUnitCd, qtyUnitCd and itemClsCd are reference codes."""
+
+    @rule
+    def validate_reference_codes(self, info: ValidationInfo):
+        reference = info.context.get(REFERENCE_DATA) if info.context else None
+        if reference is not None:
+            errors = reference.unknown_codes(self)
+            if errors:
+                raise ValueError("; ".join(errors))
+        return self
+
 
 # =========================================================
 # COMMON CONSTRAINED TYPES (aligned with PHP)
@@ -36,7 +101,7 @@ FLEX_DATE = Annotated[str, StringConstraints(min_length=8, max_length=14)]
 # NESTED MODELS FOR SAVE TRNS SALES OSDC REQUEST
 # =========================================================
 
-class TrnsSalesSaveWrReceipt(BaseModel):
+class TrnsSalesSaveWrReceipt(EtimsModel):
     """Receipt information sub-object (TrnsSalesSaveWrReceipt)"""
     custTin: Optional[TIN] = None
     custMblNo: Optional[Annotated[str, StringConstraints(max_length=20)]] = None
@@ -47,7 +112,7 @@ class TrnsSalesSaveWrReceipt(BaseModel):
     btmMsg: Optional[Annotated[str, StringConstraints(max_length=20)]] = None
     prchrAcptcYn: YN  # Required per spec
 
-class TrnsSalesSaveWrItem(BaseModel):
+class TrnsSalesSaveWrItem(ReferenceCodedItem):
     """Individual item in sales transaction (TrnsSalesSaveWrItem)"""
     itemSeq: conint(ge=1, le=999)  # 3-digit sequence
     itemClsCd: Optional[CODE_10] = None
@@ -71,21 +136,19 @@ class TrnsSalesSaveWrItem(BaseModel):
     taxAmt: AMOUNT_18_2  # Matches JSON sample key "taxAmt" (not "totTaxAmt" from table)
     totAmt: AMOUNT_18_2
 
-    @model_validator(mode="after")
+    @rule
     def validate_amounts(self) -> 'TrnsSalesSaveWrItem':
         """Business rule: totAmt should equal splyAmt - dcAmt + taxAmt"""
-        calculated = self.splyAmt - self.dcAmt + self.taxAmt
-        if abs(calculated - self.totAmt) > Decimal("0.01"):
-            raise ValueError(
-                f"Item total mismatch: splyAmt({self.splyAmt}) - dcAmt({self.dcAmt}) + taxAmt({self.taxAmt}) = {calculated} ≠ totAmt({self.totAmt})"
-            )
+        error = item_total_error(self.splyAmt, self.dcAmt, self.taxAmt, self.totAmt)
+        if error:
+            raise ValueError(error)
         return self
 
 # =========================================================
 # MAIN REQUEST MODEL: TrnsSalesSaveWrReq
 # =========================================================
 
-class SaveTrnsSalesOsdc(BaseModel):
+class SaveTrnsSalesOsdc(EtimsModel):
     """
     Request model for /saveTrnsSalesOsdc endpoint (TrnsSalesSaveWrReq)
     Validates all fields per specification table and JSON sample
@@ -147,7 +210,7 @@ class SaveTrnsSalesOsdc(BaseModel):
             raise ValueError("Invoice numbers must not have leading zeros")
         return v
 
-    @model_validator(mode="after")
+    @rule
     def validate_date_logic(self) -> 'SaveTrnsSalesOsdc':
         """Validate date relationships"""
         # salesDt (8-digit) must be prefix of cfmDt (14-digit)
@@ -161,51 +224,40 @@ class SaveTrnsSalesOsdc(BaseModel):
                 raise ValueError(f"{dt_field} ({dt_val}) cannot be before salesDt ({self.salesDt})")
         return self
 
-    @model_validator(mode="after")
-    def validate_amount_aggregates(self) -> 'SaveTrnsSalesOsdc':
+    @rule
+    def validate_amount_aggregates(self, info: ValidationInfo) -> 'SaveTrnsSalesOsdc':
         """Validate header amounts match item list aggregates and tax calculations"""
-        if not self.itemList:
-            raise ValueError("itemList cannot be empty when totItemCnt > 0")
-        
+        if info.context and info.context.get(AGGREGATES_CHECKED):
+            return self  # The caller aggregates the items as they are added
+
         # Validate item count
-        if len(self.itemList) != self.totItemCnt:
-            raise ValueError(f"totItemCnt ({self.totItemCnt}) must match actual itemList length ({len(self.itemList)})")
-        
-        # Calculate aggregates from items
-        calc_taxbl = sum(item.taxblAmt for item in self.itemList)
-        calc_tax = sum(item.taxAmt for item in self.itemList)
-        calc_tot = sum(item.totAmt for item in self.itemList)
-        
-        # Validate against header totals (with rounding tolerance)
-        tolerance = Decimal("0.01")
-        if abs(calc_taxbl - self.totTaxblAmt) > tolerance:
-            raise ValueError(f"Header totTaxblAmt ({self.totTaxblAmt}) ≠ sum of item taxblAmt ({calc_taxbl})")
-        if abs(calc_tax - self.totTaxAmt) > tolerance:
-            raise ValueError(f"Header totTaxAmt ({self.totTaxAmt}) ≠ sum of item taxAmt ({calc_tax})")
-        if abs(calc_tot - self.totAmt) > tolerance:
-            raise ValueError(f"Header totAmt ({self.totAmt}) ≠ sum of item totAmt ({calc_tot})")
-        
-        # Validate tax component sums (A-E)
-        taxbl_components = (
-            self.taxblAmtA + self.taxblAmtB + self.taxblAmtC + 
-            self.taxblAmtD + self.taxblAmtE
-        )
-        if abs(taxbl_components - self.totTaxblAmt) > tolerance:
-            raise ValueError(
-                f"Sum of taxblAmtA-E ({taxbl_components}) must equal totTaxblAmt ({self.totTaxblAmt})"
-            )
-        
-        tax_components = (
-            self.taxAmtA + self.taxAmtB + self.taxAmtC + 
-            self.taxAmtD + self.taxAmtE
+        error = item_count_error(self.totItemCnt, len(self.itemList))
+        if error:
+            raise ValueError(error)
+
+        # Calculate aggregates from items in one pass
+        calc_taxbl = calc_tax = calc_tot = 0
+        for item in self.itemList:
+            calc_taxbl += item.taxblAmt
+            calc_tax += item.taxAmt
+            calc_tot += item.totAmt
+
+        # Validate against header totals and tax components A-E (with rounding tolerance)
+        error = invoice_aggregate_error(
+            self.totTaxblAmt,
+            self.totTaxAmt,
+            self.totAmt,
+            (self.taxblAmtA, self.taxblAmtB, self.taxblAmtC, self.taxblAmtD, self.taxblAmtE),
+            (self.taxAmtA, self.taxAmtB, self.taxAmtC, self.taxAmtD, self.taxAmtE),
+            calc_taxbl,
+            calc_tax,
+            calc_tot,
         )
-        if abs(tax_components - self.totTaxAmt) > tolerance:
-            raise ValueError(
-                f"Sum of taxAmtA-E ({tax_components}) must equal totTaxAmt ({self.totTaxAmt})"
-            )
+        if error:
+            raise ValueError(error)
         return self
 
-    @model_validator(mode="after")
+    @rule
     def validate_cancelation_logic(self) -> 'SaveTrnsSalesOsdc':
         """Validate cancelation/date dependencies"""
         if self.salesSttsCd == "03":  # Assuming "03" = Canceled (per common patterns)
@@ -223,7 +275,7 @@ class SaveTrnsSalesOsdc(BaseModel):
 # RESPONSE MODELS: TrnsSalesSaveWrRes
 # =========================================================
 
-class TrnsSalesSaveWrResData(BaseModel):
+class TrnsSalesSaveWrResData(EtimsModel):
     """Response data payload (TrnsSalesSaveWrResData)"""
     curRcptNo: conint(ge=0, le=9999999999)  # 10-digit max
     totRcptNo: conint(ge=0, le=9999999999)
@@ -231,7 +283,7 @@ class TrnsSalesSaveWrResData(BaseModel):
     rcptSign: Annotated[str, StringConstraints(min_length=16, max_length=16)]
     sdcDateTime: DT14  # yyyyMMddHHmmss
 
-class TrnsSalesSaveWrRes(BaseModel):
+class TrnsSalesSaveWrRes(EtimsModel):
     """Full response object (TrnsSalesSaveWrRes)"""
     resultCd: Annotated[str, StringConstraints(min_length=3, max_length=3)]
     resultMsg: Annotated[str, StringConstraints(max_length=500)]
@@ -246,11 +298,332 @@ class TrnsSalesSaveWrRes(BaseModel):
             raise ValueError("resultCd must be numeric (e.g., '000' for success)")
         return v
 
+# =========================================================
+# RESPONSE MODELS: OTHER ENDPOINTS
+# =========================================================
+# Lenient: every field is optional and unknown fields are kept, since
+# responses carry fields beyond the spec. Record lists are LazyLists
+# whose records are built on first access.
+
+OPT_TEXT = Optional[str]
+OPT_AMOUNT = Optional[Decimal]
+
+
+class ResponseRecord(EtimsModel):
+    """Base for records and data payloads of responses"""
+    model_config = ConfigDict(extra="allow")
+
+
+class EtimsResponse(ResponseRecord):
+    """Envelope of every response; ``data`` is typed by the subclass of each endpoint"""
+    resultCd: OPT_TEXT = None
+    resultMsg: OPT_TEXT = None
+    resultDt: OPT_TEXT = None
+    data: Optional[dict] = None
+
+
+class SalesReceipt(ResponseRecord):
+    """Signed receipt of a saved sale; same fields as TrnsSalesSaveWrResData, unconstrained"""
+    curRcptNo: Optional[int] = None
+    totRcptNo: Optional[int] = None
+    intrlData: OPT_TEXT = None
+    rcptSign: OPT_TEXT = None
+    sdcDateTime: OPT_TEXT = None
+
+
+class SalesResponse(EtimsResponse):
+    data: Optional[SalesReceipt] = None
+
+
+class InitInfo(ResponseRecord):
+    tin: OPT_TEXT = None
+    taxprNm: OPT_TEXT = None
+    bsnsActv: OPT_TEXT = None
+    bhfId: OPT_TEXT = None
+    bhfNm: OPT_TEXT = None
+    bhfOpenDt: OPT_TEXT = None
+    prvncNm: OPT_TEXT = None
+    dstrtNm: OPT_TEXT = None
+    sctrNm: OPT_TEXT = None
+    locDesc: OPT_TEXT = None
+    hqYn: OPT_TEXT = None
+    mgrNm: OPT_TEXT = None
+    mgrTelNo: OPT_TEXT = None
+    mgrEmail: OPT_TEXT = None
+    dvcId: OPT_TEXT = None
+    sdcId: OPT_TEXT = None
+    mrcNo: OPT_TEXT = None
+    cmcKey: OPT_TEXT = None
+
+
+class InitData(ResponseRecord):
+    info: Optional[InitInfo] = None
+
+
+class InitResponse(EtimsResponse):
+    data: Optional[InitData] = None
+
+
+class Code(ResponseRecord):
+    cd: OPT_TEXT = None
+    cdNm: OPT_TEXT = None
+    cdDesc: OPT_TEXT = None
+    useYn: OPT_TEXT = None
+    srtOrd: Optional[int] = None
+    userDfnCd1: OPT_TEXT = None
+    userDfnCd2: OPT_TEXT = None
+    userDfnCd3: OPT_TEXT = None
+
+
+class CodeClass(ResponseRecord):
+    cdCls: OPT_TEXT = None
+    cdClsNm: OPT_TEXT = None
+    cdClsDesc: OPT_TEXT = None
+    useYn: OPT_TEXT = None
+    userDfnNm1: OPT_TEXT = None
+    userDfnNm2: OPT_TEXT = None
+    userDfnNm3: OPT_TEXT = None
+    dtlList: Optional[Annotated[LazyList, LazyItems(Code)]] = None
+
+
+class CodeListData(ResponseRecord):
+    clsList: Optional[Annotated[LazyList, LazyItems(CodeClass)]] = None
+
+
+class CodeListResponse(EtimsResponse):
+    data: Optional[CodeListData] = None
+
+
+class Customer(ResponseRecord):
+    tin: OPT_TEXT = None
+    taxprNm: OPT_TEXT = None
+    taxprSttsCd: OPT_TEXT = None
+    prvncNm: OPT_TEXT = None
+    dstrtNm: OPT_TEXT = None
+    sctrNm: OPT_TEXT = None
+    locDesc: OPT_TEXT = None
+
+
+class CustomerData(ResponseRecord):
+    custList: Optional[Annotated[LazyList, LazyItems(Customer)]] = None
+
+
+class CustomerResponse(EtimsResponse):
+    data: Optional[CustomerData] = None
+
+
+class Branch(ResponseRecord):
+    tin: OPT_TEXT = None
+    bhfId: OPT_TEXT = None
+    bhfNm: OPT_TEXT = None
+    bhfSttsCd: OPT_TEXT = None
+    prvncNm: OPT_TEXT = None
+    dstrtNm: OPT_TEXT = None
+    sctrNm: OPT_TEXT = None
+    locDesc: OPT_TEXT = None
+    mgrNm: OPT_TEXT = None
+    mgrTelNo: OPT_TEXT = None
+    mgrEmail: OPT_TEXT = None
+    hqYn: OPT_TEXT = None
+
+
+class BranchData(ResponseRecord):
+    bhfList: Optional[Annotated[LazyList, LazyItems(Branch)]] = None
+
+
+class BranchResponse(EtimsResponse):
+    data: Optional[BranchData] = None
+
+
+class Notice(ResponseRecord):
+    noticeNo: Optional[int] = None
+    title: OPT_TEXT = None
+    cont: OPT_TEXT = None
+    dtlUrl: OPT_TEXT = None
+    regrNm: OPT_TEXT = None
+    regDt: OPT_TEXT = None
+
+
+class NoticeData(ResponseRecord):
+    noticeList: Optional[Annotated[LazyList, LazyItems(Notice)]] = None
+
+
+class NoticeResponse(EtimsResponse):
+    data: Optional[NoticeData] = None
+
+
+class ItemClass(ResponseRecord):
+    itemClsCd: OPT_TEXT = None
+    itemClsNm: OPT_TEXT = None
+    itemClsLvl: Optional[int] = None
+    taxTyCd: OPT_TEXT = None
+    mjrTgYn: OPT_TEXT = None
+    useYn: OPT_TEXT = None
+
+
+class ItemClassData(ResponseRecord):
+    itemClsList: Optional[Annotated[LazyList, LazyItems(ItemClass)]] = None
+
+
+class ItemClassResponse(EtimsResponse):
+    data: Optional[ItemClassData] = None
+
+
+class Item(ResponseRecord):
+    tin: OPT_TEXT = None
+    itemCd: OPT_TEXT = None
+    itemClsCd: OPT_TEXT = None
+    itemTyCd: OPT_TEXT = None
+    itemNm: OPT_TEXT = None
+    itemStdNm: OPT_TEXT = None
+    orgnNatCd: OPT_TEXT = None
+    pkgUnitCd: OPT_TEXT = None
+    qtyUnitCd: OPT_TEXT = None
+    taxTyCd: OPT_TEXT = None
+    btchNo: OPT_TEXT = None
+    regBhfId: OPT_TEXT = None
+    bcd: OPT_TEXT = None
+    dftPrc: OPT_AMOUNT = None
+    grpPrcL1: OPT_AMOUNT = None
+    grpPrcL2: OPT_AMOUNT = None
+    grpPrcL3: OPT_AMOUNT = None
+    grpPrcL4: OPT_AMOUNT = None
+    grpPrcL5: OPT_AMOUNT = None
+    addInfo: OPT_TEXT = None
+    sftyQty: OPT_AMOUNT = None
+    isrcAplcbYn: OPT_TEXT = None
+    useYn: OPT_TEXT = None
+
+
+class ItemData(ResponseRecord):
+    itemList: Optional[Annotated[LazyList, LazyItems(Item)]] = None
+
+
+class ItemResponse(EtimsResponse):
+    data: Optional[ItemData] = None
+
+
+class ImportItem(ResponseRecord):
+    taskCd: OPT_TEXT = None
+    dclDe: OPT_TEXT = None
+    itemSeq: Optional[int] = None
+    dclNo: OPT_TEXT = None
+    hsCd: OPT_TEXT = None
+    itemNm: OPT_TEXT = None
+    imptItemsttsCd: OPT_TEXT = None
+    orgnNatCd: OPT_TEXT = None
+    exptNatCd: OPT_TEXT = None
+    pkg: OPT_AMOUNT = None
+    pkgUnitCd: OPT_TEXT = None
+    qty: OPT_AMOUNT = None
+    qtyUnitCd: OPT_TEXT = None
+    totWt: OPT_AMOUNT = None
+    netWt: OPT_AMOUNT = None
+    spplrNm: OPT_TEXT = None
+    agntNm: OPT_TEXT = None
+    invcFcurAmt: OPT_AMOUNT = None
+    invcFcurCd: OPT_TEXT = None
+    invcFcurExcrt: OPT_AMOUNT = None
+
+
+class ImportItemData(ResponseRecord):
+    itemList: Optional[Annotated[LazyList, LazyItems(ImportItem)]] = None
+
+
+class ImportItemResponse(EtimsResponse):
+    data: Optional[ImportItemData] = None
+
+
+class LineItem(ResponseRecord):
+    """Line of a purchase (sale from a supplier) or a stock movement"""
+    itemSeq: Optional[int] = None
+    itemCd: OPT_TEXT = None
+    itemClsCd: OPT_TEXT = None
+    itemNm: OPT_TEXT = None
+    bcd: OPT_TEXT = None
+    pkgUnitCd: OPT_TEXT = None
+    pkg: OPT_AMOUNT = None
+    qtyUnitCd: OPT_TEXT = None
+    qty: OPT_AMOUNT = None
+    itemExprDt: OPT_TEXT = None
+    prc: OPT_AMOUNT = None
+    splyAmt: OPT_AMOUNT = None
+    dcRt: OPT_AMOUNT = None
+    dcAmt: OPT_AMOUNT = None
+    totDcAmt: OPT_AMOUNT = None
+    taxTyCd: OPT_TEXT = None
+    taxblAmt: OPT_AMOUNT = None
+    taxAmt: OPT_AMOUNT = None
+    totAmt: OPT_AMOUNT = None
+
+
+class Purchase(ResponseRecord):
+    spplrTin: OPT_TEXT = None
+    spplrNm: OPT_TEXT = None
+    spplrBhfId: OPT_TEXT = None
+    spplrInvcNo: Optional[int] = None
+    rcptTyCd: OPT_TEXT = None
+    pmtTyCd: OPT_TEXT = None
+    cfmDt: OPT_TEXT = None
+    salesDt: OPT_TEXT = None
+    stockRlsDt: OPT_TEXT = None
+    totItemCnt: Optional[int] = None
+    taxblAmtA: OPT_AMOUNT = None
+    taxblAmtB: OPT_AMOUNT = None
+    taxblAmtC: OPT_AMOUNT = None
+    taxblAmtD: OPT_AMOUNT = None
+    taxblAmtE: OPT_AMOUNT = None
+    taxRtA: OPT_AMOUNT = None
+    taxRtB: OPT_AMOUNT = None
+    taxRtC: OPT_AMOUNT = None
+    taxRtD: OPT_AMOUNT = None
+    taxRtE: OPT_AMOUNT = None
+    taxAmtA: OPT_AMOUNT = None
+    taxAmtB: OPT_AMOUNT = None
+    taxAmtC: OPT_AMOUNT = None
+    taxAmtD: OPT_AMOUNT = None
+    taxAmtE: OPT_AMOUNT = None
+    totTaxblAmt: OPT_AMOUNT = None
+    totTaxAmt: OPT_AMOUNT = None
+    totAmt: OPT_AMOUNT = None
+    remark: OPT_TEXT = None
+    itemList: Optional[Annotated[LazyList, LazyItems(LineItem)]] = None
+
+
+class PurchaseData(ResponseRecord):
+    saleList: Optional[Annotated[LazyList, LazyItems(Purchase)]] = None
+
+
+class PurchaseResponse(EtimsResponse):
+    data: Optional[PurchaseData] = None
+
+
+class StockMovement(ResponseRecord):
+    custTin: OPT_TEXT = None
+    custBhfId: OPT_TEXT = None
+    sarNo: Optional[int] = None
+    ocrnDt: OPT_TEXT = None
+    totItemCnt: Optional[int] = None
+    totTaxblAmt: OPT_AMOUNT = None
+    totTaxAmt: OPT_AMOUNT = None
+    totAmt: OPT_AMOUNT = None
+    remark: OPT_TEXT = None
+    itemList: Optional[Annotated[LazyList, LazyItems(LineItem)]] = None
+
+
+class StockMovementData(ResponseRecord):
+    stockList: Optional[Annotated[LazyList, LazyItems(StockMovement)]] = None
+
+
+class StockMovementResponse(EtimsResponse):
+    data: Optional[StockMovementData] = None
+
+
 # =========================================================
 # INITIALIZATION
 # =========================================================
 
-class Initialization(BaseModel):
+class Initialization(EtimsModel):
     tin: TIN
     bhfId: BHF_ID
     dvcSrlNo: Annotated[str, StringConstraints(min_length=1)]  # no max in PHP
@@ -260,11 +633,11 @@ class Initialization(BaseModel):
 # COMMON REQUESTS
 # =========================================================
 
-class LastReqOnly(BaseModel):
+class LastReqOnly(EtimsModel):
     lastReqDt: DT14
 
 
-class CustSearchReq(BaseModel):
+class CustSearchReq(EtimsModel):
     custmTin: TIN
 
 
@@ -272,7 +645,7 @@ class CustSearchReq(BaseModel):
 # BRANCH MANAGEMENT
 # =========================================================
 
-class BranchCustomer(BaseModel):
+class BranchCustomer(EtimsModel):
     custNo: Annotated[str, StringConstraints(min_length=1)]
     custTin: TIN
     custNm: Annotated[str, StringConstraints(min_length=1)]
@@ -283,7 +656,7 @@ class BranchCustomer(BaseModel):
     modrNm: Optional[str] = None
 
 
-class BranchUser(BaseModel):
+class BranchUser(EtimsModel):
     userId: Annotated[str, StringConstraints(min_length=1)]
     userNm: Annotated[str, StringConstraints(min_length=1)]
     pwd: Annotated[str, StringConstraints(min_length=1)]
@@ -294,7 +667,7 @@ class BranchUser(BaseModel):
     modrNm: Optional[str] = None
 
 
-class BranchInsurance(BaseModel):
+class BranchInsurance(EtimsModel):
     isrccCd: Annotated[str, StringConstraints(min_length=1)]
     isrccNm: Annotated[str, StringConstraints(min_length=1)]
     isrcRt: condecimal(ge=0)
@@ -309,7 +682,7 @@ class BranchInsurance(BaseModel):
 # ITEM
 # =========================================================
 
-class SaveItem(BaseModel):
+class SaveItem(ReferenceCodedItem):
     itemCd: Annotated[str, StringConstraints(min_length=1)]
     itemClsCd: Annotated[str, StringConstraints(min_length=1)]
     itemTyCd: Annotated[str, StringConstraints(min_length=1)]
@@ -337,7 +710,7 @@ class SaveItem(BaseModel):
     modrNm: Annotated[str, StringConstraints(min_length=1)]  # REQUIRED in PHP
 
 
-class ItemComposition(BaseModel):
+class ItemComposition(EtimsModel):
     itemCd: Annotated[str, StringConstraints(min_length=1)]
     cpstItemCd: Annotated[str, StringConstraints(min_length=1)]
     cpstQty: condecimal(gt=0)  # min(0.001) → gt=0 covers it
@@ -351,7 +724,7 @@ class ItemComposition(BaseModel):
 # IMPORTED ITEM
 # =========================================================
 
-class ImportItemUpdate(BaseModel):
+class ImportItemUpdate(EtimsModel):
     taskCd: Annotated[str, StringConstraints(min_length=1)]
     dclDe: Annotated[str, StringConstraints(min_length=8, max_length=14)]
     itemSeq: conint(ge=1)
@@ -368,7 +741,7 @@ class ImportItemUpdate(BaseModel):
 # STOCK
 # =========================================================
 
-class StockMaster(BaseModel):
+class StockMaster(EtimsModel):
     itemCd: Annotated[str, StringConstraints(min_length=1, max_length=20)]
     rsdQty: condecimal(ge=0)  # Remaining quantity
     regrId: Annotated[str, StringConstraints(min_length=1, max_length=20)]
@@ -378,7 +751,7 @@ class StockMaster(BaseModel):
 
 
 # Purchase Transaction Item (for insertTrnsPurchase)
-class InsertTrnsPurchaseItem(BaseModel):
+class InsertTrnsPurchaseItem(ReferenceCodedItem):
     itemSeq: conint(ge=1)
     itemCd: Annotated[str, StringConstraints(min_length=1, max_length=20)]
     itemClsCd: Annotated[str, StringConstraints(min_length=1, max_length=10)]
@@ -402,7 +775,7 @@ class InsertTrnsPurchaseItem(BaseModel):
     itemExprDt: Optional[FLEX_DATE] = None  # 8–14 digits
 
 
-class InsertTrnsPurchase(BaseModel):
+class InsertTrnsPurchase(EtimsModel):
     spplrTin: Optional[Annotated[str, StringConstraints(min_length=11, max_length=11)]] = None
     invcNo: conint(ge=0)
     orgInvcNo: conint(ge=0)
@@ -448,7 +821,7 @@ class InsertTrnsPurchase(BaseModel):
 
 
 # Stock IO Item
-class SaveStockIOItem(BaseModel):
+class SaveStockIOItem(ReferenceCodedItem):
     itemSeq: conint(ge=1)
     itemCd: Annotated[str, StringConstraints(min_length=1, max_length=20)]
     itemClsCd: Annotated[str, StringConstraints(min_length=1, max_length=10)]
@@ -468,7 +841,7 @@ class SaveStockIOItem(BaseModel):
     totAmt: condecimal()
 
 
-class SaveStockIO(BaseModel):
+class SaveStockIO(EtimsModel):
     tin: Annotated[str, StringConstraints(min_length=11, max_length=11)]
     bhfId: Annotated[str, StringConstraints(min_length=2, max_length=2)]
     sarNo: conint(ge=0)
@@ -523,3 +896,29 @@ SCHEMAS = {
     "insertStockIO": SaveStockIO,
     "saveTrnsSalesOsdc": SaveTrnsSalesOsdc
 }
+
+# Endpoint key -> response model; endpoints not listed return EtimsResponse.
+# TrnsSalesSaveWrRes stays available to check a receipt strictly.
+RESPONSES = {
+    "selectInitOsdcInfo": InitResponse,
+    "selectCodeList": CodeListResponse,
+    "selectCustomer": CustomerResponse,
+    "selectNoticeList": NoticeResponse,
+    "selectItemClsList": ItemClassResponse,
+    "selectItemList": ItemResponse,
+    "selectBhfList": BranchResponse,
+    "selectImportItemList": ImportItemResponse,
+    "selectTrnsPurchaseSalesList": PurchaseResponse,
+    "selectStockMoveList": StockMovementResponse,
+    # Lenient: KRA has already accepted the sale, so a receipt outside
+    # TrnsSalesSaveWrRes's constraints must not be reported as a failure
+    "saveTrnsSalesOsdc": SalesResponse,
+}
+
+# Endpoint key -> model of the records post_stream yields
+STREAM_RECORDS = {
+    "selectItemList": Item,
+    "selectTrnsPurchaseSalesList": Purchase,
+    "selectImportItemList": ImportItem,
+    "selectStockMoveList": StockMovement,
+}
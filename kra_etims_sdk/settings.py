@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+SBX_BASE_URL = "https://etims-api-sbx.kra.go.ke/etims-api"
+PROD_BASE_URL = "https://etims-api.kra.go.ke/etims-api"
+
+# selectInitOsdcInfo runs before the device has a cmcKey, so it goes out
+# without the tin/bhfId/cmcKey headers
+UNSCOPED_ENDPOINTS = frozenset({"selectInitOsdcInfo"})
+
+
+@dataclass(frozen=True)
+class ClientSettings:
+    """
+    The parts of a client config that every request needs, resolved once.
+
+    Full URLs are computed per endpoint key and the header set per
+    endpoint is fixed, so a request only has to add its bearer token.
+    Build it with ``ClientSettings.from_config(config, endpoints)``.
+
+    A client resolves its settings when it is built; after editing
+    ``client.config``, call ``client.reload_settings()`` (or
+    ``set_cmc_key()`` for the key issued by selectInitOsdcInfo).
+    """
+
+    env: Optional[str]
+    base_url: str
+    timeout: float
+    tin: Optional[str]
+    bhf_id: Optional[str]
+    cmc_key: Optional[str]
+    urls: Mapping[str, str]
+    # endpoint key -> (url, header template); a plain dict because copying
+    # a dict is several times faster than copying a MappingProxyType
+    _routes: dict = field(repr=False, compare=False)
+
+    @classmethod
+    def from_config(cls, config: dict, endpoints: Mapping[str, str]) -> "ClientSettings":
+        env = config.get("env")
+        oscu = config.get("oscu", {})
+
+        timeout = config.get("http", {}).get("timeout", 30)
+        if not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0:
+            raise ValueError(f"config['http']['timeout'] must be a positive number, got {timeout!r}")
+
+        return cls.build(
+            env=env,
+            timeout=float(timeout),
+            tin=_oscu_value(oscu, "tin"),
+            bhf_id=_oscu_value(oscu, "bhf_id"),
+            cmc_key=_oscu_value(oscu, "cmc_key"),
+            endpoints=endpoints,
+        )
+
+    @classmethod
+    def build(cls, env, timeout, tin, bhf_id, cmc_key, endpoints) -> "ClientSettings":
+        base_url = SBX_BASE_URL if env == "sbx" else PROD_BASE_URL
+        unscoped = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        scoped = dict(unscoped)
+        for name, value in (("tin", tin), ("bhfId", bhf_id), ("cmcKey", cmc_key)):
+            # A value left as None is not sent, e.g. cmcKey before selectInitOsdcInfo
+            if value is not None:
+                scoped[name] = value
+        routes = {
+            key: (base_url + path, unscoped if key in UNSCOPED_ENDPOINTS else scoped)
+            for key, path in endpoints.items()
+        }
+
+        return cls(
+            env=env,
+            base_url=base_url,
+            timeout=timeout,
+            tin=tin,
+            bhf_id=bhf_id,
+            cmc_key=cmc_key,
+            urls=MappingProxyType({key: url for key, (url, _) in routes.items()}),
+            _routes=routes,
+        )
+
+    def route(self, endpoint_key: str, token: str):
+        """The full URL and a fresh header dict carrying ``token``."""
+        url, template = self._routes[endpoint_key]
+        headers = template.copy()
+        headers["Authorization"] = "Bearer " + token
+        return url, headers
+
+
+def _oscu_value(oscu: dict, key: str) -> Optional[str]:
+    value = oscu.get(key, "")
+    if value is not None and not isinstance(value, str):
+        # An int bhf_id would silently drop the leading zero of "00"
+        raise ValueError(f"config['oscu']['{key}'] must be a string, got {type(value).__name__}")
+    return value
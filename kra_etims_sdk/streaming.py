@@ -0,0 +1,75 @@
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from .amounts import invoice_aggregate_error, item_count_error
+from .builder import AGGREGATE_RULES, BANDS, KINDS, LineItems
+from .exceptions import ValidationException
+from .validator import Validator, _validation_error
+
+if TYPE_CHECKING:
+    from .reference import ReferenceData
+
+
+class StreamingValidator:
+    """
+    Validates a document whose itemList is an iterable, one item at a
+    time, so memory is bounded by one item instead of the whole list.
+
+    The verdict matches Validator.validate on the materialised payload:
+    the header is checked up front, each item as it is consumed, and the
+    header totals against the running item sums once the items run out.
+    Every failure raises ValidationException with the same field keys.
+    """
+
+    def __init__(self, schema: str, reference: Optional["ReferenceData"] = None):
+        if schema not in KINDS:
+            raise ValueError(f"Streaming validation of schema '{schema}' is not supported")
+        self.schema = schema
+        self.reference = reference
+
+    def validate(self, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+        """
+        Validate the header of ``payload`` and return it serialized without
+        itemList, plus an iterator of the serialized items. The iterator
+        must be exhausted: the totals are checked after the last item.
+        """
+        lines = LineItems(self.schema, reference=self.reference)
+        header = {key: value for key, value in payload.items() if key != "itemList"}
+        if "itemList" in payload:
+            header["itemList"] = []
+
+        try:
+            model = lines.model.__pydantic_validator__.validate_python(header, context=lines.context)
+        except Exception as e:
+            if not isinstance(e, _validation_error()):
+                raise
+            raise ValidationException("Validation failed", Validator._messages(e))
+
+        serialized = lines.model.__pydantic_serializer__.to_python(model, mode="json")
+        del serialized["itemList"]
+        return serialized, self._items(lines, model, payload["itemList"])
+
+    def check(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate ``payload`` without keeping its items; returns the serialized header."""
+        header, items = self.validate(payload)
+        deque(items, maxlen=0)
+        return header
+
+    def _items(self, lines: LineItems, header, items: Iterable) -> Iterator[Dict[str, Any]]:
+        serializer = lines.item_model.__pydantic_serializer__
+        for item in items:
+            yield serializer.to_python(lines.add(item), mode="json")
+
+        if self.schema in AGGREGATE_RULES:
+            error = item_count_error(header.totItemCnt, lines.count) or invoice_aggregate_error(
+                header.totTaxblAmt,
+                header.totTaxAmt,
+                header.totAmt,
+                [getattr(header, f"taxblAmt{band}") for band in BANDS],
+                [getattr(header, f"taxAmt{band}") for band in BANDS],
+                lines.tot_taxbl,
+                lines.tot_tax,
+                lines.tot,
+            )
+            if error:
+                raise ValidationException("Validation failed", {"": f"Value error, {error}"})
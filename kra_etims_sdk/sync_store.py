@@ -0,0 +1,165 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+
+def tenant_key(settings) -> str:
+    """How a client's TIN and branch are keyed in a SyncStore."""
+    return f"{settings.tin}:{settings.bhf_id}"
+
+
+class SyncStore(ABC):
+    """
+    Where DeltaSync keeps the records it has pulled and, per tenant and
+    endpoint, the lastReqDt watermark to resume from.
+
+    ``commit()`` must apply the records and the new watermark together or
+    not at all, so a failed sync never advances the watermark past data
+    that was not stored. A watermark never moves backwards.
+    """
+
+    @abstractmethod
+    def watermark(self, tenant: str, endpoint: str) -> Optional[str]:
+        """The lastReqDt to resume ``endpoint`` from, or None before its first sync."""
+
+    @abstractmethod
+    def commit(self, tenant: str, endpoint: str, records: Iterable[Tuple[str, dict]], watermark: str) -> None:
+        """Upsert ``(key, record)`` pairs and raise the watermark, atomically."""
+
+    @abstractmethod
+    def get(self, tenant: str, endpoint: str, key: str) -> Optional[dict]:
+        """The record stored under ``key``, or None."""
+
+    @abstractmethod
+    def records(self, tenant: str, endpoint: str) -> Iterator[dict]:
+        """Every record stored for ``endpoint``."""
+
+    @abstractmethod
+    def reset(self, tenant: str, endpoint: Optional[str] = None) -> None:
+        """Forget the watermark (and records) so the next sync pulls everything again."""
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySyncStore(SyncStore):
+    """
+    Dicts guarded by a lock, for tests and one-off scripts: every new
+    process starts empty and pulls each endpoint from the beginning.
+    """
+
+    def __init__(self):
+        self._watermarks: Dict[Tuple[str, str], str] = {}
+        self._records: Dict[Tuple[str, str], Dict[str, dict]] = {}
+        self._lock = threading.Lock()
+
+    def watermark(self, tenant, endpoint):
+        return self._watermarks.get((tenant, endpoint))
+
+    def commit(self, tenant, endpoint, records, watermark):
+        records = dict(records)
+        with self._lock:
+            self._records.setdefault((tenant, endpoint), {}).update(records)
+            current = self._watermarks.get((tenant, endpoint))
+            self._watermarks[(tenant, endpoint)] = max(current, watermark) if current else watermark
+
+    def get(self, tenant, endpoint, key):
+        return self._records.get((tenant, endpoint), {}).get(key)
+
+    def records(self, tenant, endpoint):
+        return iter(list(self._records.get((tenant, endpoint), {}).values()))
+
+    def reset(self, tenant, endpoint=None):
+        with self._lock:
+            for store in (self._watermarks, self._records):
+                for key in [key for key in store if key[0] == tenant and endpoint in (None, key[1])]:
+                    del store[key]
+
+
+class SqliteSyncStore(SyncStore):
+    """
+    Watermarks and records in two SQLite tables, so a restarted worker
+    resumes where the last sync stopped and the workers of one host
+    share what any of them pulled.
+
+    Each commit is one ``BEGIN IMMEDIATE`` transaction that upserts the
+    records and raises the watermark, so readers and other processes see
+    either the previous sync or the whole new one.
+    """
+
+    def __init__(self, path: str, timeout: float = 30):
+        self.path = path
+        # Autocommit mode: transactions are opened explicitly in commit()
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_watermark ("
+                " tenant TEXT NOT NULL, endpoint TEXT NOT NULL, last_req_dt TEXT NOT NULL, synced_at REAL NOT NULL,"
+                " PRIMARY KEY (tenant, endpoint))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_record ("
+                " tenant TEXT NOT NULL, endpoint TEXT NOT NULL, record_key TEXT NOT NULL, data TEXT NOT NULL,"
+                " PRIMARY KEY (tenant, endpoint, record_key)) WITHOUT ROWID"
+            )
+
+    def watermark(self, tenant, endpoint):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_req_dt FROM sync_watermark WHERE tenant = ? AND endpoint = ?", (tenant, endpoint)
+            ).fetchone()
+        return row[0] if row else None
+
+    def commit(self, tenant, endpoint, records, watermark):
+        rows = [(tenant, endpoint, key, json.dumps(record)) for key, record in records]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany("INSERT OR REPLACE INTO sync_record VALUES (?, ?, ?, ?)", rows)
+                self._conn.execute(
+                    "INSERT INTO sync_watermark VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT (tenant, endpoint) DO UPDATE SET"
+                    " last_req_dt = max(last_req_dt, excluded.last_req_dt), synced_at = excluded.synced_at",
+                    (tenant, endpoint, watermark, time.time()),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def get(self, tenant, endpoint, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sync_record WHERE tenant = ? AND endpoint = ? AND record_key = ?",
+                (tenant, endpoint, key),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def records(self, tenant, endpoint):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM sync_record WHERE tenant = ? AND endpoint = ? ORDER BY record_key",
+                (tenant, endpoint),
+            ).fetchall()
+        return (json.loads(data) for data, in rows)
+
+    def reset(self, tenant, endpoint=None):
+        condition, params = ("tenant = ?", (tenant,)) if endpoint is None else ("tenant = ? AND endpoint = ?", (tenant, endpoint))
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(f"DELETE FROM sync_record WHERE {condition}", params)
+                self._conn.execute(f"DELETE FROM sync_watermark WHERE {condition}", params)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,156 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Optional
+
+from .exceptions import AuthenticationException
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenStore(ABC):
+    """
+    Where AuthOClient keeps the current access token between processes.
+
+    ``lock()`` must be exclusive across every process that shares the
+    store: AuthOClient holds it while it re-checks the stored token and,
+    if needed, fetches a new one, so only one process refreshes at a time.
+    """
+
+    @abstractmethod
+    def read(self) -> Optional[dict]:
+        """The stored token, or None."""
+
+    @abstractmethod
+    def write(self, token: dict) -> None:
+        """Replace the stored token."""
+
+    @abstractmethod
+    def delete(self) -> None:
+        """Drop the stored token, if any."""
+
+    @abstractmethod
+    def lock(self):
+        """Context manager holding the refresh lock."""
+
+
+class MemoryTokenStore(TokenStore):
+    """
+    Token held in this process only, for a single worker or for tests;
+    each process using its own MemoryTokenStore fetches its own token.
+    """
+
+    def __init__(self):
+        self._token = None
+        self._lock = threading.Lock()
+
+    def read(self):
+        return self._token
+
+    def write(self, token):
+        self._token = dict(token)
+
+    def delete(self):
+        self._token = None
+
+    @contextmanager
+    def lock(self):
+        with self._lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """
+    JSON file on local disk holding the token; every process that uses
+    the same ``path`` shares it and refreshes it in turn.
+
+    Writes go to a temporary file that is renamed over the cache file, so
+    readers see either the old or the new token, never a partial write.
+    Refreshes are serialised with an OS lock on ``<path>.lock``.
+    """
+
+    def __init__(self, path: str, lock_timeout: float = 30):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self.lock_timeout = lock_timeout
+        self._thread_lock = threading.Lock()
+
+    def read(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or "access_token" not in data or "expires_at" not in data:
+            return None
+        return data
+
+    def write(self, token):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".kra_etims_token.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(token, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def delete(self):
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def lock(self):
+        # flock is per open file description, so threads of this process
+        # also need a regular lock to exclude each other
+        if not self._thread_lock.acquire(timeout=self.lock_timeout):
+            raise AuthenticationException("Timed out waiting for the token refresh lock")
+
+        try:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                self._acquire_os_lock(fd)
+                try:
+                    yield
+                finally:
+                    self._release_os_lock(fd)
+            finally:
+                os.close(fd)
+        finally:
+            self._thread_lock.release()
+
+    def _acquire_os_lock(self, fd):
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:  # pragma: no cover - Windows
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise AuthenticationException("Timed out waiting for the token refresh lock")
+                time.sleep(0.05)
+
+    def _release_os_lock(self, fd):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
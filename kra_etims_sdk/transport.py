@@ -0,0 +1,153 @@
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+
+class HttpTransport:
+    """
+    Pooled HTTP session shared by every call a client makes.
+
+    Connections to the eTIMS hosts are kept alive and reused, so only the
+    first request to a host pays for the TCP connect and TLS handshake.
+    Settings are read from ``config["http"]``:
+
+    - ``pool_connections``: number of hosts to keep a pool for (default 10)
+    - ``pool_maxsize``: connections kept per host (default 10)
+    - ``pool_block``: wait for a free connection instead of opening an
+      extra, unpooled one when a host pool is exhausted (default False)
+    - ``keep_alive``: reuse connections between requests (default True)
+    """
+
+    def __init__(self, http_config: dict = None):
+        http_config = http_config or {}
+        self.pool_connections = int(http_config.get("pool_connections", 10))
+        self.pool_maxsize = int(http_config.get("pool_maxsize", 10))
+        self.pool_block = bool(http_config.get("pool_block", False))
+        self.keep_alive = bool(http_config.get("keep_alive", True))
+
+        self._session = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def session(self) -> "requests.Session":
+        session = self._session
+        if session is not None:
+            return session
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("HTTP transport is closed")
+            if self._session is None:
+                self._session = self._build_session()
+            return self._session
+
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        return self.session().request(method, url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            session, self._session = self._session, None
+
+        if session is not None:
+            session.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _build_session(self) -> "requests.Session":
+        # Deferred so that importing the client stays cheap on cold start
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class AsyncHttpTransport:
+    """
+    Non-blocking counterpart of HttpTransport built on ``httpx.AsyncClient``.
+
+    Requires the optional ``httpx`` dependency (``pip install kra-etims-sdk[async]``).
+    Settings are read from ``config["http"]``:
+
+    - ``max_connections``: upper bound on concurrent connections, all of
+      which are kept alive for reuse (default 100)
+    - ``keepalive_expiry``: seconds an idle connection is kept (default 5)
+    - ``keep_alive``: reuse connections between requests (default True)
+    """
+
+    def __init__(self, http_config: dict = None):
+        http_config = http_config or {}
+        self.max_connections = int(http_config.get("max_connections", 100))
+        self.keep_alive = bool(http_config.get("keep_alive", True))
+        self.keepalive_expiry = float(http_config.get("keepalive_expiry", 5))
+
+        self._client = None
+        self._closed = False
+
+    def client(self):
+        if self._closed:
+            raise RuntimeError("HTTP transport is closed")
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+    async def request(self, method: str, url: str, stream: bool = False, **kwargs):
+        client = self.client()
+        if stream:
+            # The body is left unread; the caller reads it and closes the response
+            return await client.send(client.build_request(method, url, **kwargs), stream=True)
+        return await client.request(method, url, **kwargs)
+
+    async def close(self):
+        self._closed = True
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _build_client(self):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "The async client requires httpx. Install it with: pip install kra-etims-sdk[async]"
+            ) from e
+
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections if self.keep_alive else 0,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        return httpx.AsyncClient(limits=limits)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -1,21 +1,462 @@
-from typing import Dict, Any
-from pydantic import ValidationError
-from .schemas import SCHEMAS
+import hashlib
+import json
+import os
+import pickle
+import threading
+import weakref
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TYPE_CHECKING, Union, get_args, get_origin
 from .exceptions import ValidationException
 
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from pydantic import BaseModel
+    from .batch import BatchReport
+    from .reference import ReferenceData
+
 
 class Validator:
+    def __init__(self, cache_size: int = 0, reference: Optional["ReferenceData"] = None):
+        # schema key -> (core validator, core serializer), resolved on first use
+        self._compiled = {}
+        # Opt-in memo of outcomes for payloads seen before (retries, replays)
+        self.cache = ValidationCache(cache_size) if cache_size else None
+        self.reference = reference
+
+    @property
+    def reference(self) -> Optional["ReferenceData"]:
+        """
+        Opt-in ReferenceData that item codes are checked against. Models
+        passed to serialize() are not checked again.
+        """
+        return self._reference
+
+    @reference.setter
+    def reference(self, reference: Optional["ReferenceData"]):
+        self._reference = reference
+        self._context = None
+        if reference is not None:
+            from .schemas import REFERENCE_DATA
+            self._context = {REFERENCE_DATA: reference}
+        if self.cache is not None:
+            self.cache.clear()  # Outcomes were decided against the previous reference
+
     def validate(self, data: Dict[str, Any], schema: str) -> Dict[str, Any]:
+        if self.cache is None:
+            return self._validate(data, schema)
+        # A refresh of the reference data must not reuse earlier outcomes
+        scope = schema if self._reference is None else (schema, self._reference.version)
+        key = self.cache.key(data, scope)
+        if key is None:
+            return self._validate(data, schema)
+
+        outcome = self.cache.get(key)
+        if outcome is None:
+            try:
+                validated = self._validate(data, schema)
+            except ValidationException as e:
+                self.cache.put(key, (False, dict(e.errors)))
+                raise
+            # Kept as JSON text, so no caller can change what later hits return
+            self.cache.put(key, (True, json.dumps(validated)))
+            return validated
+
+        valid, value = outcome
+        if not valid:
+            raise ValidationException("Validation failed", dict(value))
+        return json.loads(value)
+
+    def _validate(self, data: Dict[str, Any], schema: str) -> Dict[str, Any]:
+        validator, serializer = self._compile(schema)
+
+        try:
+            # Same checks as SCHEMAS[schema](**data).model_dump(mode='json'),
+            # without the kwargs unpacking and BaseModel method dispatch
+            validated = validator.validate_python(data, context=self._context)
+            return serializer.to_python(validated, mode='json')  # Converts Decimals to strings
+        except Exception as e:
+            if not isinstance(e, _validation_error()):
+                raise
+            # Convert Pydantic errors to field:message dict like PHP
+            raise ValidationException("Validation failed", self._messages(e))
+
+    def serialize(self, model: "BaseModel", schema: str) -> Dict[str, Any]:
+        """Dump an already-validated schema model without validating it again."""
+        expected = self._model(schema)
+        if not isinstance(model, expected):
+            raise ValueError(f"Schema '{schema}' expects {expected.__name__}, got {type(model).__name__}")
+
+        _, serializer = self._compile(schema)
+        return serializer.to_python(model, mode='json')
+
+    def report(self, payloads: Iterable[Any], schema: str) -> "BatchReport":
+        """
+        Screen many payloads without raising. ``errors[i]`` maps field to
+        message like ValidationException.errors, but holds every field
+        error and every failing rule of payload ``i``; messages of several
+        rules on one model are joined with "; ". Rules read validated
+        fields, so a model's rules run once its fields are all valid: with
+        a field error in one line item, the rules of the other items are
+        still reported, but those of the invoice itself are not. Nothing
+        is serialized.
+        """
+        from .batch import BatchReport
+
+        validator, _ = self._compile(schema)
+        errors = [self._check(validator, data, schema) for data in payloads]
+        return BatchReport([not messages for messages in errors], errors)
+
+    def _check(self, validator, data, schema: str) -> dict:
+        from .schemas import RULE_ERRORS
+
+        collected = []
+        try:
+            model = validator.validate_python(data, context={**(self._context or {}), RULE_ERRORS: collected})
+        except Exception as e:
+            if not isinstance(e, _validation_error()):
+                raise
+            return self._check_items(data, schema, self._messages(e))
+        return _rule_messages(model, collected)
+
+    def _check_items(self, data, schema: str, messages: dict) -> dict:
+        """Add to ``messages`` the failing rules of list items that have no field error."""
+        from .schemas import RULE_ERRORS
+
+        if not isinstance(data, dict):
+            return messages
+
+        for field, item_model in _item_models(self._model(schema)).items():
+            items = data.get(field)
+            if not isinstance(items, list):
+                continue
+            if not item_model.__pydantic_complete__:
+                item_model.model_rebuild()
+            for index, item in enumerate(items):
+                path = f"{field}.{index}"
+                if any(location == path or location.startswith(f"{path}.") for location in messages):
+                    continue
+                collected = []
+                model = item_model.__pydantic_validator__.validate_python(
+                    item, context={**(self._context or {}), RULE_ERRORS: collected}
+                )
+                messages.update(_rule_messages(model, collected, path))
+        return messages
+
+    @staticmethod
+    def _model(schema: str):
+        # Imported here so that importing the client does not load pydantic
+        # and define every schema up front
+        from .schemas import SCHEMAS
+
         if schema not in SCHEMAS:
             raise ValueError(f"Validation schema '{schema}' not defined")
+        return SCHEMAS[schema]
+
+    def _compile(self, schema: str):
+        compiled = self._compiled.get(schema)
+        if compiled is None:
+            model = self._model(schema)
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+            compiled = (model.__pydantic_validator__, model.__pydantic_serializer__)
+            self._compiled[schema] = compiled
+        return compiled
+
+    @staticmethod
+    def _messages(error) -> dict:
+        messages = {}
+        for err in error.errors():
+            field = ".".join(str(loc) for loc in err["loc"])
+            messages[field] = err["msg"]
+        return messages
+
 
+class ValidationCache:
+    """
+    Bounded LRU map from (schema, payload content hash) to a validation
+    outcome, with hit/miss counters.
+
+    The key hashes the payload as canonical JSON (sorted keys), so equal
+    payloads match whatever their key order. Payloads holding anything
+    but JSON types and Decimal are not cached. Valid outcomes are kept
+    as JSON text, so every hit returns a fresh dict.
+    """
+
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError("Validation cache size must be at least 1")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(data: Any, schema: Union[str, tuple]) -> Optional[tuple]:
         try:
-            validated = SCHEMAS[schema](**data)
-            return validated.model_dump(mode='json')  # Converts Decimals to floats
-        except ValidationError as e:
-            # Convert Pydantic errors to field:message dict like PHP
-            messages = {}
-            for error in e.errors():
-                field = ".".join(str(loc) for loc in error["loc"])
-                messages[field] = error["msg"]
-            raise ValidationException("Validation failed", messages)
\ No newline at end of file
+            encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=_canonical_default)
+        except (TypeError, ValueError):
+            return None
+        return schema, hashlib.blake2b(encoded.encode(), digest_size=16).digest()
+
+    def get(self, key: tuple):
+        with self._lock:
+            outcome = self._entries.get(key)
+            if outcome is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return outcome
+
+    def put(self, key: tuple, outcome) -> None:
+        with self._lock:
+            self._entries[key] = outcome
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _canonical_default(value):
+    # Tagged so that Decimal("1.0") and the string "1.0" hash differently
+    if type(value) is Decimal:
+        return {"\0decimal": str(value)}
+    raise TypeError(f"{type(value).__name__} is not cached")
+
+
+class BatchValidator:
+    """
+    Validates many payloads against one schema across a process pool.
+
+    Pydantic validation holds the GIL, so threads cannot validate faster
+    than one core. Payloads travel to the worker processes in chunks of
+    ``chunk_size``, one pickle per chunk, and results come back the same
+    way. With a single CPU the transfer is pure overhead, so size
+    ``max_workers`` to the cores actually available. ``validate_many``
+    returns one outcome per payload in input order: the validated dict,
+    or the ValidationException it raised, with the same ``errors`` map as
+    Validator.validate.
+
+    A ``reference`` is pickled once per ``version``. Chunks name it by
+    digest; the first chunks of a new version also carry the pickle, and
+    a worker that has not seen it yet hands its chunk back to be sent
+    again with the pickle, so each worker unpickles it about once.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 64):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._executor = None
+        # ReferenceData -> (version, digest, pickle)
+        self._snapshots = weakref.WeakKeyDictionary()
+        # Digests already sent along with chunks of the current executor
+        self._shipped = set()
+        # Bulk calls of several threads (or ClientPool tenants) share the pool
+        self._lock = threading.Lock()
+
+    def validate_many(
+        self,
+        payloads: Iterable[Dict[str, Any]],
+        schema: str,
+        reference: Optional["ReferenceData"] = None,
+    ) -> List[Union[Dict[str, Any], ValidationException]]:
+        outcomes = []
+        for results in self._map(_validate_chunk, payloads, schema, reference):
+            for ok, value in results:
+                outcomes.append(value if ok else ValidationException("Validation failed", value))
+        return outcomes
+
+    def report_many(self, payloads: Iterable[Any], schema: str, reference: Optional["ReferenceData"] = None) -> "BatchReport":
+        """Validator.report across the process pool."""
+        from .batch import BatchReport
+
+        errors = []
+        for results in self._map(_report_chunk, payloads, schema, reference):
+            errors.extend(results)
+        return BatchReport([not messages for messages in errors], errors)
+
+    @property
+    def window_size(self) -> int:
+        """Payloads that keep every worker busy with one chunk."""
+        return self.chunk_size * self._workers
+
+    @property
+    def _workers(self) -> int:
+        return self.max_workers or os.cpu_count() or 1
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._shipped.clear()
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _map(self, function, payloads: Iterable[Any], schema: str, reference) -> Iterator[list]:
+        """``function``'s results for each chunk of ``payloads``, in order."""
+        payloads = list(payloads)
+        chunks = [payloads[start:start + self.chunk_size] for start in range(0, len(payloads), self.chunk_size)]
+        digest, snapshot = self._snapshot(reference)
+
+        executor = self._pool()
+        with self._lock:
+            # A new reference rides along with one chunk per worker
+            first = 0 if digest is None or digest in self._shipped else self._workers
+            self._shipped.add(digest)
+        futures = [
+            executor.submit(function, schema, chunk, digest, snapshot if index < first else None)
+            for index, chunk in enumerate(chunks)
+        ]
+
+        for chunk, future in zip(chunks, futures):
+            results = future.result()
+            if results is None:
+                # That worker had not seen this reference yet
+                results = executor.submit(function, schema, chunk, digest, snapshot).result()
+            yield results
+
+    def _snapshot(self, reference) -> tuple:
+        """(digest, pickle) of ``reference``, made once per version."""
+        if reference is None:
+            return None, None
+
+        with self._lock:
+            cached = self._snapshots.get(reference)
+            if cached is None or cached[0] != reference.version:
+                snapshot = pickle.dumps(reference)
+                cached = (reference.version, hashlib.sha256(snapshot).hexdigest(), snapshot)
+                self._snapshots[reference] = cached
+            return cached[1], cached[2]
+
+    def _pool(self) -> "ProcessPoolExecutor":
+        executor = self._executor
+        if executor is not None:
+            return executor
+
+        with self._lock:
+            if self._executor is None:
+                # Imported here: it costs a noticeable share of the client's import time
+                from concurrent.futures import ProcessPoolExecutor
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+
+# One Validator per worker process, so compiled schemas survive across
+# chunks, and the references it was given, by digest
+_worker_validator = None
+_worker_references = OrderedDict()
+
+# References a worker keeps, e.g. those of several ClientPool tenants
+_WORKER_REFERENCES = 8
+
+
+def _worker(digest: Optional[str], snapshot: Optional[bytes]) -> Optional[Validator]:
+    """The worker's Validator set to the reference ``digest``; None if it needs ``snapshot``."""
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = Validator()
+
+    reference = None
+    if digest is not None:
+        reference = _worker_references.get(digest)
+        if reference is None:
+            if snapshot is None:
+                return None
+            reference = pickle.loads(snapshot)
+            _worker_references[digest] = reference
+            if len(_worker_references) > _WORKER_REFERENCES:
+                _worker_references.popitem(last=False)
+        _worker_references.move_to_end(digest)
+
+    if _worker_validator.reference is not reference:
+        _worker_validator.reference = reference
+    return _worker_validator
+
+
+def _validate_chunk(schema: str, payloads: list, digest: Optional[str] = None, snapshot: Optional[bytes] = None):
+    validator = _worker(digest, snapshot)
+    if validator is None:
+        return None
+
+    results = []
+    for data in payloads:
+        try:
+            results.append((True, validator.validate(data, schema)))
+        except ValidationException as e:
+            results.append((False, e.errors))
+    return results
+
+
+def _report_chunk(schema: str, payloads: list, digest: Optional[str] = None, snapshot: Optional[bytes] = None):
+    validator = _worker(digest, snapshot)
+    if validator is None:
+        return None
+    return validator.report(payloads, schema).errors
+
+
+def _rule_messages(model, collected: list, path: str = "") -> dict:
+    """Field -> message of the rules collected while validating ``model``."""
+    if not collected:
+        return {}
+
+    locations = _locations(model, path)
+    messages = {}
+    for instance, message in collected:
+        field = locations[id(instance)]
+        message = f"Value error, {message}"
+        messages[field] = f"{messages[field]}; {message}" if field in messages else message
+    return messages
+
+
+def _item_models(model) -> dict:
+    """Fields of ``model`` annotated as a list of models -> the item model."""
+    from pydantic import BaseModel
+
+    found = {}
+    for name, field in model.model_fields.items():
+        if get_origin(field.annotation) is list:
+            (item,) = get_args(field.annotation)
+            if isinstance(item, type) and issubclass(item, BaseModel):
+                found[name] = item
+    return found
+
+
+def _locations(model, path: str = "") -> dict:
+    """id() of the model and every model nested in it -> its error location."""
+    from pydantic import BaseModel
+
+    locations = {id(model): path}
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        field = f"{path}.{name}" if path else name
+        if isinstance(value, BaseModel):
+            locations.update(_locations(value, field))
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                if isinstance(item, BaseModel):
+                    locations.update(_locations(item, f"{field}.{index}"))
+    return locations
+
+
+def _validation_error():
+    from pydantic import ValidationError
+    return ValidationError
@@ -0,0 +1,110 @@
+import copy
+import json
+
+import pytest
+
+# test_etims.py is the sandbox integration script; run it directly with
+# KRA credentials in the environment
+collect_ignore = ["test_etims.py"]
+
+TIN = "P000000000A"
+CONFIG = {"env": "sbx", "oscu": {"tin": TIN, "bhf_id": "00", "cmc_key": "0" * 64}}
+
+
+class StubResponse:
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+
+    def json(self):
+        return json.loads(json.dumps(self.body))
+
+    @property
+    def text(self):
+        return json.dumps(self.body)
+
+    def iter_content(self, chunk_size=None):
+        yield json.dumps(self.body).encode()
+
+    def close(self):
+        pass
+
+
+class StubTransport:
+    """
+    Answers every request with the body registered for its endpoint path
+    and records the requests. A body may be an exception to raise.
+    """
+
+    def __init__(self, bodies=None):
+        self.bodies = dict(bodies or {})
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        endpoint = url.rsplit("/", 1)[1]
+        self.requests.append((endpoint, kwargs))
+        body = self.bodies[endpoint]
+        if isinstance(body, Exception):
+            raise body
+        return StubResponse(body)
+
+    def close(self):
+        pass
+
+
+class StubAuth:
+    def token(self, force=False):
+        return "token"
+
+
+class FakeClock:
+    """Stands in for the ``time`` module of the SDK modules under test."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_client():
+    """Build an EtimsOClient over a StubTransport; ``config`` is merged into CONFIG."""
+    from kra_etims_sdk.oclient import EtimsOClient
+
+    clients = []
+
+    def make(bodies=None, **config):
+        transport = StubTransport(bodies)
+        client = EtimsOClient({**copy.deepcopy(CONFIG), **config}, StubAuth(), transport=transport)
+        clients.append(client)
+        return client, transport
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def make_async_client(handler, auth=None, **config):
+    """
+    An AsyncEtimsOClient whose requests ``handler`` answers, through
+    httpx.MockTransport; ``config`` is merged into CONFIG.
+    """
+    import httpx
+
+    from kra_etims_sdk.async_oclient import AsyncEtimsOClient
+
+    client = AsyncEtimsOClient({**copy.deepcopy(CONFIG), **config}, auth or StubAuth())
+    client.transport._build_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
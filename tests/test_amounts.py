@@ -0,0 +1,25 @@
+from decimal import Decimal
+
+import pytest
+
+from kra_etims_sdk.amounts import from_cents, item_total_error, to_cents
+
+
+@pytest.mark.parametrize("value, cents", [(12, 1200), ("1.25", 125), (Decimal("-0.10"), -10), (0.1, 10), ("1.500", 150)])
+def test_to_cents(value, cents):
+    assert to_cents(value) == cents
+    assert from_cents(cents) == Decimal(str(value))
+
+
+@pytest.mark.parametrize("value", ["1.001", "abc", "Infinity", "-inf", "NaN", float("inf"), float("nan")])
+def test_to_cents_rejects(value):
+    with pytest.raises(ValueError):
+        to_cents(value)
+
+
+def test_rules_agree_on_cents_at_the_tolerance():
+    for tot in ("116.01", "116.02"):
+        decimal_error = item_total_error(Decimal("100"), Decimal("0"), Decimal("16"), Decimal(tot))
+        cents_error = item_total_error(10000, 0, 1600, to_cents(tot), cents=True)
+        assert (decimal_error is None) == (cents_error is None)
+    assert item_total_error(Decimal("100"), Decimal("0"), Decimal("16"), Decimal("116.01")) is None
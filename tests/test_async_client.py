@@ -0,0 +1,155 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from conftest import make_async_client
+from kra_etims_sdk.async_oauth import AsyncAuthOClient
+from kra_etims_sdk.exceptions import ApiException, ValidationException
+from kra_etims_sdk.token_store import MemoryTokenStore
+
+LAST_REQ = {"lastReqDt": "20240101000000"}
+ITEMS = [{"itemCd": f"KE{index}", "dftPrc": 1.5, "useYn": "Y"} for index in range(5)]
+
+
+def ok(data):
+    return httpx.Response(200, json={"resultCd": "000", "resultMsg": "ok", "data": data})
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_request_carries_settings_headers_and_token():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return ok({"clsList": []})
+
+    async def main():
+        async with make_async_client(handler) as client:
+            return await client.select_code_list(LAST_REQ)
+
+    assert run(main())["data"] == {"clsList": []}
+    request = seen[0]
+    assert str(request.url) == "https://etims-api-sbx.kra.go.ke/etims-api/selectCodeList"
+    assert request.headers["tin"] == "P000000000A"
+    assert request.headers["Authorization"] == "Bearer token"
+    assert json.loads(request.content) == LAST_REQ
+
+
+def test_invalid_payload_raises_on_await_not_on_call():
+    async def main():
+        async with make_async_client(lambda request: ok({})) as client:
+            pending = client.select_code_list({"lastReqDt": "yesterday"})
+            assert asyncio.iscoroutine(pending)
+            with pytest.raises(ValidationException):
+                await pending
+
+            return await asyncio.gather(
+                client.select_code_list(LAST_REQ), client.select_code_list({}), return_exceptions=True
+            )
+
+    good, bad = run(main())
+    assert good["resultCd"] == "000"
+    assert isinstance(bad, ValidationException)
+
+
+def test_business_error_raises_api_exception():
+    handler = lambda request: httpx.Response(200, json={"resultCd": "891", "resultMsg": "bad"})
+
+    async def main():
+        async with make_async_client(handler) as client:
+            await client.select_code_list(LAST_REQ)
+
+    with pytest.raises(ApiException, match="891"):
+        run(main())
+
+
+def test_expired_token_is_refreshed_once():
+    calls = []
+
+    class Auth:
+        current = "stale"
+
+        async def token(self, force=False):
+            calls.append(force)
+            if force:
+                self.current = "fresh"
+            return self.current
+
+    def handler(request):
+        if request.headers["Authorization"] == "Bearer stale":
+            return httpx.Response(401, json={"fault": {"faultstring": "Access Token expired"}})
+        return ok({})
+
+    async def main():
+        async with make_async_client(handler, auth=Auth()) as client:
+            return await client.select_code_list(LAST_REQ)
+
+    assert run(main())["resultCd"] == "000"
+    assert calls == [False, True, False]
+
+
+def test_async_auth_refreshes_once_for_concurrent_tasks():
+    auth = AsyncAuthOClient({"env": "sbx"}, store=MemoryTokenStore())
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        time.sleep(0.05)
+        return {"access_token": "shared", "expires_at": time.time() + 3600}
+
+    auth._fetch_token = fetch
+
+    async def main():
+        return await asyncio.gather(*(auth.token() for _ in range(10)))
+
+    assert run(main()) == ["shared"] * 10
+    assert len(fetches) == 1
+
+
+def test_sync_context_manager_is_refused():
+    client = make_async_client(lambda request: ok({}))
+    with pytest.raises(TypeError):
+        with client:
+            pass
+
+
+def test_stream_yields_records():
+    body = json.dumps({"resultCd": "000", "data": {"itemList": ITEMS}}).encode()
+    handler = lambda request: httpx.Response(200, content=body)
+
+    async def main():
+        async with make_async_client(handler) as client:
+            return [record async for record in await client.stream_items(LAST_REQ)]
+
+    assert run(main()) == ITEMS
+
+
+def test_stream_error_is_raised_before_any_record():
+    handler = lambda request: httpx.Response(200, json={"resultCd": "999", "resultMsg": "down", "data": {"itemList": ITEMS}})
+
+    async def main():
+        async with make_async_client(handler, retry={"enabled": False}) as client:
+            await client.stream_items(LAST_REQ)
+
+    with pytest.raises(ApiException, match="999"):
+        run(main())
+
+
+def test_typed_responses():
+    body = json.dumps({"resultCd": "000", "data": {"itemList": ITEMS}}).encode()
+
+    async def main():
+        async with make_async_client(lambda request: httpx.Response(200, content=body), responses={"typed": True}) as client:
+            response = await client.select_items(LAST_REQ)
+            streamed = [record async for record in await client.stream_items(LAST_REQ)]
+            return response, streamed
+
+    response, streamed = run(main())
+    assert response.data.itemList[4].itemCd == "KE4"
+    assert [record.itemCd for record in streamed] == [item["itemCd"] for item in ITEMS]
@@ -0,0 +1,105 @@
+from decimal import Decimal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kra_etims_sdk.batch import INVOICE_AMOUNT_COLUMNS, ITEM_AMOUNT_COLUMNS, validate_invoice_aggregates
+from kra_etims_sdk.exceptions import ValidationException
+from kra_etims_sdk.validator import Validator
+from payloads import sales_invoice
+
+
+def columns(invoices, convert=Decimal):
+    """The invoices as the header and item columns validate_invoice_aggregates takes."""
+    head = {name: [convert(invoice[name]) for invoice in invoices] for name in INVOICE_AMOUNT_COLUMNS}
+    head["totItemCnt"] = [invoice["totItemCnt"] for invoice in invoices]
+
+    lines = [(row, item) for row, invoice in enumerate(invoices) for item in invoice["itemList"]]
+    items = {name: [convert(item[name]) for _, item in lines] for name in ITEM_AMOUNT_COLUMNS}
+    items["invoice"] = [row for row, _ in lines]
+    return head, items
+
+
+def invoices():
+    """One valid invoice and one breaking each amount rule."""
+    bad_item = sales_invoice(3)
+    bad_item["itemList"][1]["totAmt"] = "1170.00"
+    bad_count = {**sales_invoice(2), "totItemCnt": 3}
+    bad_total = {**sales_invoice(2), "totAmt": "2400.00"}
+    bad_band = {**sales_invoice(2), "taxblAmtA": "5.00"}
+    within_a_cent = {**sales_invoice(2), "totTaxAmt": "320.01", "taxAmtB": "320.01"}
+    return [sales_invoice(2), bad_item, bad_count, bad_total, bad_band, within_a_cent]
+
+
+def model_errors(payload):
+    try:
+        Validator().validate(payload, "saveTrnsSalesOsdc")
+    except ValidationException as e:
+        return e.errors
+    return {}
+
+
+def test_agrees_with_the_model():
+    payloads = invoices()
+    batch = validate_invoice_aggregates(*columns(payloads))
+
+    assert list(batch.ok) == [True, False, False, False, False, True]
+    assert batch.failed == [1, 2, 3, 4]
+    for messages, payload in zip(batch.errors, payloads):
+        expected = model_errors(payload)
+        assert list(messages) == list(expected)
+        # Same rule, same words; only the formatting of amounts may differ
+        for field, message in messages.items():
+            assert message.split(":")[0] == expected[field].split(":")[0]
+    assert batch.errors[2] == model_errors(payloads[2])
+
+
+def test_items_may_be_interleaved():
+    head, items = columns(invoices())
+    order = np.argsort([row % 2 for row in items["invoice"]], kind="stable")
+    shuffled = {name: [column[index] for index in order] for name, column in items.items()}
+
+    assert validate_invoice_aggregates(head, shuffled).errors == validate_invoice_aggregates(head, items).errors
+
+
+def test_cents_and_floats_give_the_same_report():
+    payloads = invoices()
+    expected = validate_invoice_aggregates(*columns(payloads)).errors
+
+    cents = columns(payloads, lambda value: int(Decimal(value) * 100))
+    floats = columns(payloads, float)
+    assert validate_invoice_aggregates(*cents, cents=True).errors == expected
+    assert validate_invoice_aggregates(*(
+        {name: np.array(column) for name, column in part.items()} for part in floats
+    )).errors == expected
+
+
+def test_cents_expects_integer_columns():
+    with pytest.raises(ValueError, match="cents=True expects integer columns"):
+        validate_invoice_aggregates(*columns(invoices(), float), cents=True)
+
+
+@pytest.mark.parametrize("value, message", [
+    (0.125, "at most two decimal places"),
+    (float("nan"), "finite"),
+    (float("inf"), "finite"),
+])
+def test_bad_float_amounts_are_refused(value, message):
+    head, items = columns([sales_invoice(1)], float)
+    items["dcAmt"] = np.array([value])
+    with pytest.raises(ValueError, match=message):
+        validate_invoice_aggregates(head, items)
+
+
+def test_float_noise_below_a_cent_is_accepted():
+    head, items = columns([sales_invoice(1)], float)
+    items["splyAmt"] = np.array([0.1 + 0.2 + 999.7])
+    assert list(validate_invoice_aggregates(head, items).ok) == [True]
+
+
+def test_items_must_refer_to_invoice_rows():
+    head, items = columns([sales_invoice(1)])
+    items["invoice"] = [1]
+    with pytest.raises(ValueError, match="invoice rows"):
+        validate_invoice_aggregates(head, items)
@@ -0,0 +1,108 @@
+import pytest
+
+from kra_etims_sdk.exceptions import ValidationException
+from kra_etims_sdk.reference import ReferenceData
+from kra_etims_sdk.sync_store import MemorySyncStore
+from kra_etims_sdk.validator import BatchValidator, Validator
+from payloads import sales_invoice
+
+SCHEMA = "saveTrnsSalesOsdc"
+
+
+def invoices(count=10):
+    return [{**sales_invoice(2), "invcNo": str(number)} for number in range(count)]
+
+
+def with_bad_invoices():
+    payloads = invoices()
+    payloads[3] = {**payloads[3], "totItemCnt": 4}
+    payloads[8] = {**payloads[8], "salesDt": "yesterday"}
+    return payloads
+
+
+def reference(*item_classes):
+    store = MemorySyncStore()
+    store.commit("T", "selectItemClsList", [(cd, {"itemClsCd": cd, "useYn": "Y"}) for cd in item_classes], "20240101000000")
+    return ReferenceData(store, "T")
+
+
+@pytest.fixture
+def batch():
+    with BatchValidator(max_workers=2, chunk_size=3) as validator:
+        yield validator
+
+
+def spy_on_submits(batch):
+    """Record, per submitted chunk, whether it carried the reference pickle."""
+    executor = batch._pool()
+    submit = executor.submit
+    carried = []
+
+    def recording(function, schema, chunk, digest, snapshot=None):
+        carried.append(snapshot is not None)
+        return submit(function, schema, chunk, digest, snapshot)
+
+    executor.submit = recording
+    return carried
+
+
+def test_outcomes_match_the_validator_in_input_order(batch):
+    payloads = with_bad_invoices()
+    outcomes = batch.validate_many(payloads, SCHEMA)
+
+    assert len(outcomes) == len(payloads)
+    for payload, outcome in zip(payloads, outcomes):
+        try:
+            expected = Validator().validate(payload, SCHEMA)
+        except ValidationException as e:
+            assert isinstance(outcome, ValidationException) and outcome.errors == e.errors
+        else:
+            assert outcome == expected
+
+
+def test_report_matches_the_validator(batch):
+    payloads = with_bad_invoices()
+    report = batch.report_many(payloads, SCHEMA)
+    expected = Validator().report(payloads, SCHEMA)
+
+    assert report.errors == expected.errors
+    assert report.failed == [3, 8]
+
+
+def test_reference_is_checked_in_the_workers(batch):
+    payloads = invoices(4)
+    payloads[2]["itemList"][0] = {**payloads[2]["itemList"][0], "itemClsCd": "9999999999"}
+
+    outcomes = batch.validate_many(payloads, SCHEMA, reference=reference("5059690800"))
+    assert [isinstance(outcome, ValidationException) for outcome in outcomes] == [False, False, True, False]
+    assert "itemClsCd" in outcomes[2].errors["itemList.0"]
+
+
+def test_reference_is_sent_once_per_version(batch):
+    data = reference("5059690800")
+    carried = spy_on_submits(batch)
+
+    batch.validate_many(invoices(12), SCHEMA, reference=data)
+    # Only the first chunks, and chunks a worker handed back, carry the pickle
+    first_call = list(carried)
+    assert first_call[:2] == [True, True]
+    assert first_call[2:4] == [False, False]
+
+    carried.clear()
+    batch.validate_many(invoices(12), SCHEMA, reference=data)
+    assert carried[:4] == [False] * 4
+
+    data.refresh()
+    carried.clear()
+    batch.validate_many(invoices(12), SCHEMA, reference=data)
+    assert carried[:2] == [True, True]
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ValueError):
+        BatchValidator(chunk_size=0)
+
+
+def test_empty_batch_starts_no_work(batch):
+    assert batch.validate_many([], SCHEMA) == []
+    assert batch.report_many([], SCHEMA).errors == []
@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+import pytest
+
+from kra_etims_sdk.builder import InvoiceBuilder
+from kra_etims_sdk.exceptions import ValidationException
+from kra_etims_sdk.validator import Validator
+from payloads import sales_invoice
+
+SCHEMA = "saveTrnsSalesOsdc"
+
+
+def split(invoice):
+    """The header fields a caller passes to build(), and the items."""
+    derived = set(InvoiceBuilder.sales().totals) | {"itemList"}
+    return {name: value for name, value in invoice.items() if name not in derived}, invoice["itemList"]
+
+
+def item(tax_type, amount, tax):
+    """A line item of one unit at ``amount`` taxed ``tax``, without itemSeq."""
+    line = {name: value for name, value in sales_invoice(1)["itemList"][0].items() if name != "itemSeq"}
+    total = str(Decimal(amount) + Decimal(tax))
+    return {**line, "taxTyCd": tax_type, "qty": "1", "prc": amount, "splyAmt": amount,
+            "taxblAmt": amount, "taxAmt": tax, "totAmt": total}
+
+
+def test_builder_matches_validator():
+    header, items = split(sales_invoice(3))
+    invoice = InvoiceBuilder.sales().add_items(items).build(**header)
+
+    # The builder fills in the standard 8% of band E, the sample leaves it 0
+    expected = Validator().validate({**sales_invoice(3), "taxRtE": "8"}, SCHEMA)
+    assert Validator().serialize(invoice, SCHEMA) == expected
+
+
+def test_builder_derives_totals_and_tax_bands():
+    header, items = split(sales_invoice(1))
+    builder = InvoiceBuilder.sales().add_items([*items, item("E", "250.00", "20.00"), item("A", "40.00", "0")])
+    totals = builder.totals
+
+    assert (totals["taxblAmtB"], totals["taxAmtB"]) == (Decimal("1000.00"), Decimal("160.00"))
+    assert (totals["taxblAmtE"], totals["taxAmtE"]) == (Decimal("250.00"), Decimal("20.00"))
+    assert (totals["taxblAmtA"], totals["taxAmtA"]) == (Decimal("40.00"), 0)
+    assert (totals["taxRtB"], totals["taxRtE"]) == (16, 8)
+    assert totals["totTaxblAmt"] == Decimal("1290.00")
+    assert totals["totTaxAmt"] == Decimal("180.00")
+    assert totals["totAmt"] == Decimal("1470.00")
+    assert totals["totItemCnt"] == 3
+
+    invoice = builder.build(**header)
+    assert [line.itemSeq for line in invoice.itemList] == [1, 2, 3]
+    # The model built without re-aggregating passes the full checks too
+    serialized = Validator().serialize(invoice, SCHEMA)
+    assert Validator().validate(serialized, SCHEMA) == serialized
+
+
+def test_builder_rejects_derived_fields():
+    header, items = split(sales_invoice(1))
+    with pytest.raises(ValueError, match="totAmt"):
+        InvoiceBuilder.sales().add_items(items).build(totAmt=1, **header)
+
+
+def test_builder_rejects_bad_item_with_its_index():
+    _, items = split(sales_invoice(2))
+    builder = InvoiceBuilder.sales().add_item(items[0])
+    with pytest.raises(ValidationException) as raised:
+        builder.add_item({**items[1], "totAmt": "1"})
+    assert list(raised.value.errors) == ["itemList.1"]
+    assert len(builder) == 1
+
+
+def test_empty_builder_fails_like_validator():
+    header, _ = split(sales_invoice(1))
+    with pytest.raises(ValidationException) as raised:
+        InvoiceBuilder.sales().build(**header)
+    assert raised.value.errors == {"": "Value error, itemList cannot be empty when totItemCnt > 0"}
+
+
+def test_unknown_tax_band_is_refused():
+    with pytest.raises(ValueError, match="Unknown tax bands: F"):
+        InvoiceBuilder.sales(tax_rates={"F": 5})
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import random
+import threading
+import time
+
+import httpx
+import pytest
+
+from conftest import CONFIG, StubAuth, StubResponse, make_async_client
+from kra_etims_sdk.exceptions import ApiException, ValidationException
+from kra_etims_sdk.oclient import EtimsOClient
+from payloads import sales_invoice
+
+COUNT = 40
+
+
+def invoices(count=COUNT):
+    return [{**sales_invoice(2), "invcNo": str(number)} for number in range(count)]
+
+
+def answer(payload):
+    """KRA's answer to one invoice: invoice 13 is rejected, the rest echo their invcNo."""
+    if payload["invcNo"] == "13":
+        return {"resultCd": "891", "resultMsg": "rejected"}
+    return {"resultCd": "000", "resultMsg": "ok", "data": {"invcNo": payload["invcNo"]}}
+
+
+class EchoTransport:
+    """Answers each invoice after a random delay and records the peak number in flight."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, json=None, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.sent.append(json["invcNo"])
+        time.sleep(random.uniform(0, 0.005))
+        with self._lock:
+            self.in_flight -= 1
+        return StubResponse(answer(json))
+
+    def close(self):
+        pass
+
+
+def check_outcomes(outcomes, payloads):
+    assert len(outcomes) == len(payloads)
+    for payload, outcome in zip(payloads, outcomes):
+        if payload["invcNo"] == "13":
+            assert isinstance(outcome, ApiException) and outcome.error_code == "891"
+        elif payload["invcNo"] == "7":
+            assert isinstance(outcome, ValidationException)
+        else:
+            assert outcome["data"]["invcNo"] == payload["invcNo"]
+
+
+def with_bad_invoice(payloads):
+    payloads[7] = {**payloads[7], "totItemCnt": 5}
+    return payloads
+
+
+def test_bulk_keeps_input_order_and_per_item_errors():
+    transport = EchoTransport()
+    client = EtimsOClient(CONFIG, StubAuth(), transport=transport)
+    payloads = with_bad_invoice(invoices())
+
+    check_outcomes(client.save_sales_transactions_bulk(payloads, max_concurrency=6), payloads)
+    assert "7" not in transport.sent
+    assert 1 < transport.peak <= 6
+
+
+def test_bulk_reads_items_as_it_sends():
+    transport = EchoTransport()
+    client = EtimsOClient(CONFIG, StubAuth(), transport=transport)
+    read = []
+
+    def items():
+        for payload in invoices():
+            read.append(payload["invcNo"])
+            # Never far ahead of what has been sent
+            assert len(read) - len(transport.sent) <= 4
+            yield payload
+
+    outcomes = client.save_sales_transactions_bulk(items(), max_concurrency=2)
+    assert len(outcomes) == COUNT
+
+
+def test_bulk_of_nothing():
+    client = EtimsOClient(CONFIG, StubAuth(), transport=EchoTransport())
+    assert client.save_sales_transactions_bulk([]) == []
+    with pytest.raises(ValueError):
+        client.save_sales_transactions_bulk([], max_concurrency=0)
+
+
+def test_async_bulk_keeps_input_order_and_per_item_errors():
+    in_flight = []
+    peak = []
+
+    async def handler(request):
+        payload = json.loads(request.content)
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(random.uniform(0, 0.005))
+        in_flight.pop()
+        return httpx.Response(200, json=answer(payload))
+
+    payloads = with_bad_invoice(invoices())
+
+    async def main():
+        async with make_async_client(handler) as client:
+            return await client.save_sales_transactions_bulk(payloads, max_concurrency=5)
+
+    check_outcomes(asyncio.run(main()), payloads)
+    assert 1 < max(peak) <= 5
+
+
+def test_async_bulk_rejects_bad_concurrency_on_await():
+    async def main():
+        async with make_async_client(lambda request: httpx.Response(200, json={})) as client:
+            pending = client.save_sales_transactions_bulk([], max_concurrency=0)
+            with pytest.raises(ValueError):
+                await pending
+            return await client.save_sales_transactions_bulk([])
+
+    assert asyncio.run(main()) == []
+
+
+def test_bulk_validates_across_worker_processes():
+    transport = EchoTransport()
+    config = {**CONFIG, "validation": {"processes": 2, "chunk_size": 4}}
+    with EtimsOClient(config, StubAuth(), transport=transport) as client:
+        payloads = with_bad_invoice(invoices())
+        outcomes = client.save_sales_transactions_bulk(iter(payloads), max_concurrency=3)
+        assert client.batch_validator._executor is not None
+
+    check_outcomes(outcomes, payloads)
+    assert "7" not in transport.sent
@@ -0,0 +1,92 @@
+import pytest
+
+from kra_etims_sdk import circuit_breaker
+from kra_etims_sdk.circuit_breaker import CircuitBreaker
+from kra_etims_sdk.exceptions import ApiException, CircuitOpenException
+
+SERVER_ERROR = ApiException("Server Error (999): down", 500, "999")
+CLIENT_ERROR = ApiException("Client Error (891): bad", 400, "891")
+
+
+def fail(breaker, error=SERVER_ERROR):
+    with pytest.raises(type(error)):
+        with breaker.guard():
+            raise error
+
+
+def succeed(breaker):
+    with breaker.guard():
+        pass
+
+
+@pytest.fixture
+def breaker(monkeypatch, clock):
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return CircuitBreaker("selectCodeList", failure_rate_threshold=0.5, window_size=4, minimum_calls=4, open_duration=10)
+
+
+def test_breaker_opens_at_failure_rate(breaker):
+    succeed(breaker)
+    succeed(breaker)
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.CLOSED
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenException) as raised:
+        succeed(breaker)
+    assert raised.value.retry_after == 10
+
+
+def test_breaker_ignores_business_errors(breaker):
+    for _ in range(4):
+        fail(breaker, CLIENT_ERROR)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.snapshot()["failure_rate"] == 0
+
+
+def test_breaker_half_open_probe_closes_it(breaker, clock):
+    for _ in range(4):
+        fail(breaker)
+    clock.advance(10)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    with breaker.guard():
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenException):
+            succeed(breaker)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_failed_probe_reopens_it(breaker, clock):
+    for _ in range(4):
+        fail(breaker)
+    clock.advance(10)
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.snapshot()["retry_after"] == 10
+
+
+def test_breaker_opens_on_slow_calls(monkeypatch, clock):
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    breaker = CircuitBreaker("selectCodeList", slow_call_threshold=1, slow_call_rate_threshold=0.5, window_size=2, minimum_calls=2)
+    for _ in range(2):
+        with breaker.guard():
+            clock.advance(2)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_client_fails_fast_while_open(make_client):
+    client, transport = make_client(
+        {"selectCodeList": ApiException("down", 503)},
+        retry={"enabled": False},
+        circuit_breaker={"minimum_calls": 2, "window_size": 2},
+    )
+    for _ in range(2):
+        with pytest.raises(ApiException):
+            client.select_code_list({"lastReqDt": "20240101000000"})
+
+    with pytest.raises(CircuitOpenException):
+        client.select_code_list({"lastReqDt": "20240101000000"})
+    assert len(transport.requests) == 2
+    assert client.circuit_states()["selectCodeList"]["state"] == CircuitBreaker.OPEN
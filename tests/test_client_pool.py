@@ -0,0 +1,143 @@
+import asyncio
+import threading
+
+import pytest
+
+from conftest import CONFIG, StubTransport
+from kra_etims_sdk.client_pool import AsyncClientPool, ClientPool
+from kra_etims_sdk.exceptions import ApiException
+
+OK = {"resultCd": "000", "resultMsg": "ok", "data": {}}
+LAST_REQ = {"lastReqDt": "20240101000000"}
+
+
+class Auth:
+    """Records its config and whether it was closed, and on which thread."""
+
+    def __init__(self, config):
+        self.config = config
+        self.closed_on = None
+
+    def token(self, force=False):
+        return "token"
+
+    def close(self):
+        self.closed_on = threading.current_thread()
+
+
+class Pool(ClientPool):
+    auth_class = Auth
+
+
+class AsyncPool(AsyncClientPool):
+    auth_class = Auth
+
+
+def make_pool(max_clients=256, **config):
+    transport = StubTransport({"selectCodeList": OK})
+    pool = Pool({"env": "sbx", **config}, max_clients=max_clients, transport=transport)
+    for bhf_id in ("00", "01", "02"):
+        pool.register("P000000000A", bhf_id, bhf_id * 32)
+    return pool, transport
+
+
+def test_calls_are_routed_with_the_tenant_headers():
+    pool, transport = make_pool()
+    for bhf_id in ("02", "00"):
+        pool.client("P000000000A", bhf_id).select_code_list(LAST_REQ)
+
+    headers = [kwargs["headers"] for _, kwargs in transport.requests]
+    assert [(h["bhfId"], h["cmcKey"]) for h in headers] == [("02", "02" * 32), ("00", "00" * 32)]
+    assert pool.client("P000000000A", "00") is pool.client("P000000000A", "00")
+
+
+def test_unknown_tenant_is_refused():
+    pool, _ = make_pool()
+    pool.unregister("P000000000A", "01")
+    with pytest.raises(ApiException, match="not registered"):
+        pool.client("P000000000A", "01")
+    assert sorted(pool.tenants()) == [("P000000000A", "00"), ("P000000000A", "02")]
+
+
+def test_least_recently_used_client_is_dropped():
+    pool, _ = make_pool(max_clients=2)
+    first = pool.client("P000000000A", "00")
+    pool.client("P000000000A", "01")
+    pool.client("P000000000A", "00")
+    pool.client("P000000000A", "02")
+
+    assert list(pool._clients) == [("P000000000A", "00"), ("P000000000A", "02")]
+    assert pool.client("P000000000A", "00") is first
+    assert pool.client("P000000000A", "01") is not first
+
+
+def test_reregistering_rebuilds_the_client():
+    pool, transport = make_pool()
+    old = pool.client("P000000000A", "00")
+    pool.register("P000000000A", "00", "f" * 64)
+
+    client = pool.client("P000000000A", "00")
+    assert client is not old
+    client.select_code_list(LAST_REQ)
+    assert transport.requests[-1][1]["headers"]["cmcKey"] == "f" * 64
+
+
+def test_clients_share_the_pool_components():
+    pool, transport = make_pool(
+        circuit_breaker={"minimum_calls": 3},
+        rate_limit={"select": {"rate": 10}},
+        response_cache={"endpoints": {"selectCodeList": 60}},
+        validation={"processes": 1},
+    )
+    clients = [pool.client("P000000000A", bhf_id) for bhf_id in ("00", "01")]
+
+    for name in ("retry_policy", "circuit_breakers", "rate_limiter", "response_cache", "batch_validator"):
+        component = getattr(pool, name)
+        assert component is not None
+        assert all(getattr(client, name) is component for client in clients)
+    assert all(client.transport is transport for client in clients)
+
+    # Closing one client leaves the components of the others working
+    clients[0].close()
+    clients[1].select_code_list(LAST_REQ)
+    assert pool.response_cache.stats()["size"] == 1
+    pool.close()
+
+
+def test_auths_are_shared_by_credentials():
+    pool, _ = make_pool(auth={"sbx": {"consumer_key": "key", "consumer_secret": "secret"}})
+    pool.register("P000000000B", "00", "0" * 64, "tenant", "one")
+    pool.register("P000000000B", "01", "0" * 64, "tenant", "one")
+    pool.register("P000000000B", "02", "0" * 64, "tenant", "rotated")
+
+    default = {pool.client("P000000000A", bhf_id).auth for bhf_id in ("00", "01", "02")}
+    one = {pool.client("P000000000B", bhf_id).auth for bhf_id in ("00", "01")}
+    rotated = pool.client("P000000000B", "02").auth
+
+    assert len(default) == len(one) == 1
+    assert len(default | one | {rotated}) == 3
+    assert rotated.config["auth"] == {"sbx": {"consumer_key": "tenant", "consumer_secret": "rotated"}}
+    assert "tenant" not in rotated.config["cache_file"]
+
+
+def test_dropping_the_last_client_of_an_auth_closes_it():
+    pool, _ = make_pool(max_clients=1)
+    pool.register("P000000000B", "00", "0" * 64, "tenant", "secret")
+    auth = pool.client("P000000000B", "00").auth
+    pool.client("P000000000A", "00")
+    assert auth.closed_on is threading.current_thread()
+
+
+def test_async_pool_closes_auths_off_the_event_loop():
+    transport = StubTransport()
+    pool = AsyncPool({**CONFIG}, transport=transport)
+    pool.register("P000000000A", "00", "0" * 64)
+
+    async def main():
+        async with pool:
+            return pool.client("P000000000A", "00").auth
+
+    auth = asyncio.run(main())
+    assert auth.closed_on is not None
+    assert auth.closed_on is not threading.current_thread()
+    assert pool._auths == {}
@@ -0,0 +1,116 @@
+import pytest
+
+from kra_etims_sdk.delta_sync import DEFAULT_START, DeltaSync
+from kra_etims_sdk.exceptions import ApiException
+from kra_etims_sdk.sync_store import MemorySyncStore, SqliteSyncStore, SyncStore
+
+TENANT = "P000000000A:00"
+
+
+def codes(result_dt, *codes):
+    classes = [{"cdCls": "04", "cdClsNm": "Taxation Type", "dtlList": [{"cd": cd, "useYn": "Y"} for cd in codes]}]
+    return {"resultCd": "000", "resultMsg": "ok", "resultDt": result_dt, "data": {"clsList": classes}}
+
+
+def item_classes(result_dt, *item_cls_cds):
+    items = [{"itemClsCd": cd, "useYn": "Y"} for cd in item_cls_cds]
+    return {"resultCd": "000", "resultMsg": "ok", "resultDt": result_dt, "data": {"itemClsList": items}}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    store = MemorySyncStore() if request.param == "memory" else SqliteSyncStore(str(tmp_path / "sync.db"))
+    yield store
+    store.close()
+
+
+def sent_last_req_dts(transport):
+    return [kwargs["json"]["lastReqDt"] for _, kwargs in transport.requests]
+
+
+def test_sync_store_is_abstract():
+    with pytest.raises(TypeError):
+        SyncStore()
+
+
+def test_first_sync_pulls_everything_and_stores_the_watermark(make_client, store):
+    client, transport = make_client({"selectCodeList": codes("20240301120000", "A", "B")})
+    summary = DeltaSync(client, store, ["selectCodeList"]).sync("selectCodeList")
+
+    assert sent_last_req_dts(transport) == [DEFAULT_START]
+    # resultDt less the default 60 second overlap
+    assert summary == {"endpoint": "selectCodeList", "last_req_dt": DEFAULT_START, "records": 2, "watermark": "20240301115900"}
+    assert store.watermark(TENANT, "selectCodeList") == "20240301115900"
+    assert store.get(TENANT, "selectCodeList", "04|B") == {"cdCls": "04", "cdClsNm": "Taxation Type", "cd": "B", "useYn": "Y"}
+
+
+def test_next_sync_resumes_from_the_watermark(make_client, store):
+    client, transport = make_client({"selectItemClsList": item_classes("20240301120000", "1", "2")})
+    sync = DeltaSync(client, store, ["selectItemClsList"], overlap=0)
+    sync.sync("selectItemClsList")
+
+    transport.bodies["selectItemClsList"] = item_classes("20240302120000", "2", "3")
+    summary = sync.sync("selectItemClsList")
+
+    assert sent_last_req_dts(transport) == [DEFAULT_START, "20240301120000"]
+    assert summary["records"] == 2
+    assert sorted(record["itemClsCd"] for record in store.records(TENANT, "selectItemClsList")) == ["1", "2", "3"]
+    assert store.watermark(TENANT, "selectItemClsList") == "20240302120000"
+
+
+def test_watermark_survives_a_restart(make_client, tmp_path):
+    path = str(tmp_path / "sync.db")
+    client, transport = make_client({"selectItemClsList": item_classes("20240301120000", "1")})
+
+    first = SqliteSyncStore(path)
+    DeltaSync(client, first, ["selectItemClsList"], overlap=0).sync("selectItemClsList")
+    first.close()
+
+    reopened = SqliteSyncStore(path)
+    DeltaSync(client, reopened, ["selectItemClsList"], overlap=0).sync("selectItemClsList")
+    assert sent_last_req_dts(transport) == [DEFAULT_START, "20240301120000"]
+    assert reopened.get(TENANT, "selectItemClsList", "1") == {"itemClsCd": "1", "useYn": "Y"}
+    reopened.close()
+
+
+def test_failed_sync_keeps_the_watermark(make_client, store):
+    client, transport = make_client({
+        "selectCodeList": codes("20240301120000", "A"),
+        "selectItemClsList": ApiException("down", 503),
+    })
+    sync = DeltaSync(client, store, ["selectItemClsList", "selectCodeList"], overlap=0)
+    outcomes = sync.sync_all()
+
+    assert isinstance(outcomes["selectItemClsList"], ApiException)
+    assert outcomes["selectCodeList"]["records"] == 1
+    assert store.watermark(TENANT, "selectItemClsList") is None
+    assert store.watermark(TENANT, "selectCodeList") == "20240301120000"
+
+
+def test_watermark_never_moves_backwards(make_client, store):
+    client, transport = make_client({"selectCodeList": codes("20240301120000", "A")})
+    sync = DeltaSync(client, store, ["selectCodeList"], overlap=0)
+    sync.sync("selectCodeList")
+
+    transport.bodies["selectCodeList"] = codes("20240201000000", "B")
+    sync.sync("selectCodeList")
+    assert store.watermark(TENANT, "selectCodeList") == "20240301120000"
+    assert store.get(TENANT, "selectCodeList", "04|B") is not None
+
+
+def test_reset_starts_over(make_client, store):
+    client, transport = make_client({"selectCodeList": codes("20240301120000", "A")})
+    sync = DeltaSync(client, store, ["selectCodeList"])
+    sync.sync("selectCodeList")
+    sync.reset()
+
+    assert store.watermark(TENANT, "selectCodeList") is None
+    assert list(store.records(TENANT, "selectCodeList")) == []
+    sync.sync("selectCodeList")
+    assert sent_last_req_dts(transport) == [DEFAULT_START, DEFAULT_START]
+
+
+def test_unsupported_endpoint_is_refused(make_client, store):
+    client, _ = make_client()
+    with pytest.raises(ValueError, match="selectCustomer"):
+        DeltaSync(client, store, ["selectCustomer"])
@@ -79,7 +79,7 @@ except AuthenticationException as e:
 #     cmc_key = init_data.get('cmcKey')
 #     if not cmc_key:
 #         abort(init_data.get('resultMsg', 'Missing cmcKey'))
-#     config['oscu']['cmc_key'] = cmc_key
+#     etims.set_cmc_key(cmc_key)  # Also updates config['oscu']['cmc_key']
 # except ApiException as e:
 #     abort(f"OSCU Init failed: {e}")
 
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from kra_etims_sdk.exceptions import ApiException
+from kra_etims_sdk.json_stream import RecordParser
+
+RECORDS = [{"itemCd": "KE1", "dftPrc": 1.5, "itemNm": "Çaï"}, {"itemCd": "KE2", "dftPrc": 12345}, {"itemCd": "KE3", "nested": [1, {"a": None}]}]
+BODY = json.dumps(
+    {"resultCd": "000", "resultMsg": "ok", "data": {"count": 3, "itemList": RECORDS, "more": False}, "resultDt": "20240101"},
+    ensure_ascii=False,
+).encode()
+
+
+def parse(chunks):
+    parser = RecordParser("itemList")
+    records = []
+    for chunk in chunks:
+        records.extend(parser.feed(chunk))
+    records.extend(parser.close())
+    return parser, records
+
+
+def test_split_anywhere_gives_the_same_records():
+    # Includes splits inside the two-byte characters of itemNm
+    for split in range(1, len(BODY)):
+        parser, records = parse([BODY[:split], BODY[split:]])
+
+        assert records == RECORDS, split
+        assert parser.head == {"resultCd": "000", "resultMsg": "ok", "resultDt": "20240101"}
+        assert parser.done
+
+
+def test_byte_at_a_time():
+    parser, records = parse(BODY[i:i + 1] for i in range(len(BODY)))
+    assert records == RECORDS
+    assert parser.head["resultDt"] == "20240101"
+
+
+def test_head_is_read_before_the_records():
+    parser = RecordParser("itemList")
+    assert parser.feed(BODY[:BODY.index(b"[")]) == []
+    assert parser.head["resultCd"] == "000"
+    assert not parser.in_list
+    parser.feed(b"[")
+    assert parser.in_list
+
+
+def test_number_at_end_of_chunk_waits_for_the_rest():
+    parser = RecordParser("itemList")
+    assert parser.feed(b'{"data": {"itemList": [12') == []
+    assert parser.feed(b"34, 5") == [1234]
+    assert parser.feed(b"]}}") == [5]
+    parser.close()
+
+
+def test_missing_list_yields_nothing():
+    _, records = parse([b'{"resultCd": "000", "data": null}'])
+    assert records == []
+
+
+@pytest.mark.parametrize("body", [BODY[:-1], BODY + b"{}", b'{"data": {"itemList": [1 2]}}'])
+def test_malformed_or_truncated_body_raises_value_error(body):
+    with pytest.raises(ValueError):
+        parse([body])
+
+
+def test_client_streams_records(make_client):
+    client, transport = make_client({"selectItemList": json.loads(BODY)})
+    assert list(client.stream_items({"lastReqDt": "20240101000000"})) == RECORDS
+    assert transport.requests[0][1]["stream"] is True
+
+
+def test_client_raises_business_errors_before_any_record(make_client):
+    client, _ = make_client({"selectItemList": {"resultCd": "891", "resultMsg": "bad", "data": {"itemList": RECORDS}}})
+    with pytest.raises(ApiException, match="891"):
+        client.stream_items({"lastReqDt": "20240101000000"})
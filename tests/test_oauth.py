@@ -0,0 +1,114 @@
+import threading
+import time
+
+from kra_etims_sdk.oauth import AuthOClient
+from kra_etims_sdk.token_store import MemoryTokenStore
+
+CONFIG = {"env": "sbx", "auth": {"sbx": {"consumer_key": "key", "consumer_secret": "secret"}}}
+
+
+class CountingStore(MemoryTokenStore):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def read(self):
+        self.reads += 1
+        return super().read()
+
+
+def make_auth(config=None, lifetime=3600):
+    """An AuthOClient whose fetches are counted and never leave the process."""
+    auth = AuthOClient({**CONFIG, **(config or {})}, store=CountingStore())
+    auth.fetches = 0
+
+    def fetch():
+        auth.fetches += 1
+        return {"access_token": f"token-{auth.fetches}", "expires_at": time.time() + lifetime}
+
+    auth._fetch_token = fetch
+    return auth
+
+
+def test_token_is_served_from_memory():
+    auth = make_auth()
+    assert auth.token() == "token-1"
+    reads = auth.store.reads
+
+    assert [auth.token() for _ in range(5)] == ["token-1"] * 5
+    assert auth.fetches == 1
+    assert auth.store.reads == reads
+
+
+def test_expired_token_is_refreshed():
+    auth = make_auth()
+    auth.token()
+    auth._cached = {**auth._cached, "expires_at": time.time() - 1}
+    auth.store.write(auth._cached)
+
+    assert auth.token() == "token-2"
+    assert auth.fetches == 2
+
+
+def test_stored_token_fills_an_empty_memory_cache():
+    auth = make_auth()
+    auth.store.write({"access_token": "stored", "expires_at": time.time() + 60})
+    assert auth.token() == "stored"
+    assert auth.fetches == 0
+
+
+def test_forced_refresh_replaces_the_rejected_token():
+    auth = make_auth()
+    auth.token()
+    assert auth.token(force=True) == "token-2"
+    assert auth.token() == "token-2"
+
+
+def test_forget_token_clears_memory_and_store():
+    auth = make_auth()
+    auth.token()
+    auth.forget_token()
+    assert auth.store.read() is None
+    assert auth.token() == "token-2"
+
+
+def test_background_refresher_renews_before_expiry():
+    # Each token expires within the refresh margin, so the refresher renews
+    # it at once and then waits refresh_retry_interval before the next one
+    auth = make_auth({"token": {"refresh_margin": 300, "refresh_retry_interval": 0.05}}, lifetime=100)
+    auth.token()
+    auth.start_refresher()
+    try:
+        deadline = time.monotonic() + 5
+        while auth.fetches < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        auth.close()
+
+    assert auth.fetches >= 3
+    assert auth.token() == f"token-{auth.fetches}"
+    assert not any(thread.name == "kra-etims-token-refresher" for thread in threading.enumerate())
+
+
+def test_background_refresher_survives_failed_fetches():
+    auth = make_auth({"token": {"refresh_retry_interval": 0.01}})
+    fetch = auth._fetch_token
+    failures = []
+
+    def flaky():
+        if len(failures) < 2:
+            failures.append(1)
+            raise OSError("token endpoint down")
+        return fetch()
+
+    auth._fetch_token = flaky
+    auth.start_refresher()
+    try:
+        deadline = time.monotonic() + 5
+        while auth.fetches < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        auth.close()
+
+    assert len(failures) == 2
+    assert auth.token() == "token-1"
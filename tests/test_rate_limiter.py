@@ -0,0 +1,71 @@
+import pytest
+
+from kra_etims_sdk import rate_limiter
+from kra_etims_sdk.exceptions import RateLimitException
+from kra_etims_sdk.rate_limiter import RateLimiter, TokenBucket
+
+OK = {"resultCd": "000", "resultMsg": "ok", "data": {}}
+
+
+@pytest.fixture
+def bucket(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return TokenBucket(rate=2, burst=2)
+
+
+def test_bucket_allows_burst_then_schedules_waits(bucket):
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+
+def test_bucket_refills_up_to_burst(bucket, clock):
+    bucket.reserve()
+    bucket.reserve()
+    clock.advance(100)
+    assert bucket.available == 2
+    assert bucket.reserve() == 0
+
+
+def test_bucket_over_max_wait_takes_no_token(bucket):
+    bucket.reserve()
+    bucket.reserve()
+    assert bucket.reserve(max_wait=0.1) is None
+    assert bucket.reserve(max_wait=0.5) == 0.5
+
+
+def test_rate_limiter_non_blocking_raises(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    limiter = RateLimiter.from_config({"select": {"rate": 1}, "blocking": False})
+
+    assert limiter.reserve("P000000000A", "00", "selectCodeList") == 0
+    assert limiter.reserve("P000000000A", "01", "selectCodeList") == 0
+    assert limiter.reserve("P000000000A", "00", "saveItem") == 0
+    with pytest.raises(RateLimitException) as raised:
+        limiter.reserve("P000000000A", "00", "selectItemList")
+    assert raised.value.retry_after == 1
+
+
+def test_rate_limiter_caps_wait_per_call(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    limiter = RateLimiter.from_config({"select": {"rate": 1}, "max_wait": 5})
+
+    limiter.reserve("P000000000A", "00", "selectCodeList")
+    with pytest.raises(RateLimitException):
+        limiter.reserve("P000000000A", "00", "selectCodeList", max_wait=0.5)
+    assert limiter.reserve("P000000000A", "00", "selectCodeList", max_wait=10) == 1
+
+
+def test_client_throttle_does_not_wait_past_deadline(make_client, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    client, transport = make_client(
+        {"selectCodeList": OK}, rate_limit={"select": {"rate": 0.1}}, retry={"deadline": 1}
+    )
+
+    client.select_code_list({"lastReqDt": "20240101000000"})
+    with pytest.raises(RateLimitException):
+        client.select_code_list({"lastReqDt": "20240101000000"})
+    assert sleeps == []
+    assert len(transport.requests) == 1
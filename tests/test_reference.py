@@ -0,0 +1,110 @@
+import pytest
+
+from conftest import CONFIG, StubAuth, StubResponse
+from kra_etims_sdk.exceptions import ApiException, ValidationException
+from kra_etims_sdk.oclient import EtimsOClient
+from kra_etims_sdk.reference import ReferenceData
+from kra_etims_sdk.sync_store import MemorySyncStore
+from kra_etims_sdk.validator import Validator
+from payloads import sales_invoice
+
+TENANT = "P000000000A:00"
+SCHEMA = "saveTrnsSalesOsdc"
+SYNCED_AT = "20240101000000"
+
+
+def synced_store(tax_types=("A", "B", "C", "D", "E"), item_classes=("5059690800",)):
+    store = MemorySyncStore()
+    codes = [(f"04|{cd}", {"cdCls": "04", "cd": cd, "useYn": "Y"}) for cd in tax_types]
+    codes += [(f"17|{cd}", {"cdCls": "17", "cd": cd, "useYn": "Y"}) for cd in ("NT",)]
+    codes += [(f"10|{cd}", {"cdCls": "10", "cd": cd, "useYn": "Y"}) for cd in ("U",)]
+    store.commit(TENANT, "selectCodeList", codes, SYNCED_AT)
+    store.commit(TENANT, "selectItemClsList", [(cd, {"itemClsCd": cd, "useYn": "Y"}) for cd in item_classes], SYNCED_AT)
+    return store
+
+
+def with_item(**fields):
+    invoice = sales_invoice(2)
+    invoice["itemList"][1] = {**invoice["itemList"][1], **fields}
+    return invoice
+
+
+@pytest.mark.parametrize("fields, message", [
+    ({"itemClsCd": "9999999999"}, "itemClsCd '9999999999' is not a known item class"),
+    ({"pkgUnitCd": "XX"}, "pkgUnitCd 'XX' is not a code of class 17"),
+])
+def test_unknown_codes_are_rejected(fields, message):
+    validator = Validator(reference=ReferenceData(synced_store(), TENANT))
+    validator.validate(sales_invoice(2), SCHEMA)
+
+    with pytest.raises(ValidationException) as raised:
+        validator.validate(with_item(**fields), SCHEMA)
+    assert message in raised.value.errors["itemList.1"]
+
+
+def test_unknown_tax_type_is_rejected():
+    validator = Validator(reference=ReferenceData(synced_store(tax_types=("A", "C")), TENANT))
+    with pytest.raises(ValidationException) as raised:
+        validator.validate(sales_invoice(1), SCHEMA)
+    assert "taxTyCd 'B' is not a code of class 04" in raised.value.errors["itemList.0"]
+
+
+def test_unsynced_tables_are_not_checked():
+    validator = Validator(reference=ReferenceData(MemorySyncStore(), TENANT))
+    validator.validate(with_item(itemClsCd="9999999999", pkgUnitCd="XX"), SCHEMA)
+
+
+def test_disabled_codes_are_unknown():
+    store = synced_store(item_classes=("5059690800", "1111111111"))
+    store.commit(TENANT, "selectItemClsList", [("1111111111", {"itemClsCd": "1111111111", "useYn": "N"})], SYNCED_AT)
+    validator = Validator(reference=ReferenceData(store, TENANT))
+
+    with pytest.raises(ValidationException):
+        validator.validate(with_item(itemClsCd="1111111111"), SCHEMA)
+
+
+def test_refresh_invalidates_cached_outcomes():
+    store = synced_store()
+    reference = ReferenceData(store, TENANT)
+    validator = Validator(cache_size=8, reference=reference)
+    invoice = with_item(itemClsCd="1111111111")
+
+    with pytest.raises(ValidationException):
+        validator.validate(invoice, SCHEMA)
+    with pytest.raises(ValidationException):
+        validator.validate(invoice, SCHEMA)
+    assert validator.cache.stats()["hits"] == 1
+
+    store.commit(TENANT, "selectItemClsList", [("1111111111", {"itemClsCd": "1111111111", "useYn": "Y"})], SYNCED_AT)
+    version = reference.version
+    reference.refresh()
+    assert reference.version == version + 1
+    assert validator.validate(invoice, SCHEMA)["itemList"][1]["itemClsCd"] == "1111111111"
+
+
+class SavingTransport:
+    def __init__(self):
+        self.sent = []
+
+    def request(self, method, url, json=None, **kwargs):
+        self.sent.append(json["invcNo"])
+        return StubResponse({"resultCd": "000", "resultMsg": "ok", "data": {}})
+
+    def close(self):
+        pass
+
+
+def test_unknown_codes_are_rejected_in_bulk_workers():
+    transport = SavingTransport()
+    config = {**CONFIG, "validation": {"processes": 2, "chunk_size": 2}}
+    payloads = [{**sales_invoice(1), "invcNo": str(number)} for number in range(6)]
+    payloads[4] = {**with_item(itemClsCd="9999999999"), "invcNo": "4"}
+
+    with EtimsOClient(config, StubAuth(), transport=transport) as client:
+        client.validator.reference = ReferenceData(synced_store(), TENANT)
+        outcomes = client.save_sales_transactions_bulk(payloads)
+
+    assert isinstance(outcomes[4], ValidationException)
+    assert "is not a known item class" in outcomes[4].errors["itemList.1"]
+    assert not any(isinstance(outcome, (ValidationException, ApiException)) for outcome in outcomes[:4] + outcomes[5:])
+    assert sorted(transport.sent) == ["0", "1", "2", "3", "5"]
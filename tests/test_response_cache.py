@@ -0,0 +1,100 @@
+import pytest
+
+from kra_etims_sdk import response_cache
+from kra_etims_sdk.response_cache import CacheBackend, MemoryCacheBackend, ResponseCache, SqliteCacheBackend
+from kra_etims_sdk.settings import ClientSettings
+
+CODES = {"resultCd": "000", "resultMsg": "ok", "data": {"clsList": [{"cdCls": "04", "dtlList": []}]}}
+
+
+def settings(tin="P000000000A", bhf_id="00", env="sbx"):
+    return ClientSettings.build(env, 30, tin, bhf_id, "key", {})
+
+
+def test_response_cache_key_per_branch_endpoint_and_data():
+    cache = ResponseCache(MemoryCacheBackend(), {"selectCodeList": 60, "selectBhfList": 60})
+    key = cache.key(settings(), "selectCodeList", {"lastReqDt": "20240101000000"})
+
+    assert key == cache.key(settings(), "selectCodeList", {"lastReqDt": "20240101000000"})
+    assert key != cache.key(settings(bhf_id="01"), "selectCodeList", {"lastReqDt": "20240101000000"})
+    assert key != cache.key(settings(), "selectBhfList", {"lastReqDt": "20240101000000"})
+    assert key != cache.key(settings(), "selectCodeList", {"lastReqDt": "20240102000000"})
+    assert cache.key(settings(), "selectItemList", {}) is None
+
+
+def test_response_cache_key_per_environment():
+    cache = ResponseCache(MemoryCacheBackend(), {"selectCodeList": 60})
+    data = {"lastReqDt": "20240101000000"}
+    assert cache.key(settings(env="sbx"), "selectCodeList", data) != cache.key(settings(env="prod"), "selectCodeList", data)
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path, monkeypatch, clock):
+    monkeypatch.setattr(response_cache, "time", clock)
+    if request.param == "memory":
+        backend = MemoryCacheBackend(max_entries=2)
+    else:
+        backend = SqliteCacheBackend(str(tmp_path / "cache.db"), max_entries=2)
+    yield backend
+    backend.close()
+
+
+def test_backend_expires_entries(backend, clock):
+    backend.put("a", "selectCodeList", "1", ttl=10)
+    clock.advance(9)
+    assert backend.get("a") == "1"
+    clock.advance(1)
+    assert backend.get("a") is None
+
+
+def test_backend_evicts_least_recently_used(backend, clock):
+    backend.put("a", "selectCodeList", "1", ttl=60)
+    clock.advance(1)
+    backend.put("b", "selectCodeList", "2", ttl=60)
+    clock.advance(1)
+    backend.get("a")
+    clock.advance(1)
+    backend.put("c", "selectCodeList", "3", ttl=60)
+
+    assert len(backend) == 2
+    assert backend.get("b") is None
+    assert backend.get("a") == "1" and backend.get("c") == "3"
+
+
+def test_backend_invalidates_per_endpoint(backend):
+    backend.put("a", "selectCodeList", "1", ttl=60)
+    backend.put("b", "selectBhfList", "2", ttl=60)
+    backend.invalidate("selectCodeList")
+    assert backend.get("a") is None and backend.get("b") == "2"
+    backend.invalidate()
+    assert len(backend) == 0
+
+
+@pytest.mark.parametrize(
+    "cache_config",
+    [{"endpoints": ["saveItem"]}, {"endpoints": ["selectNothing"]}, {"endpoints": ["selectCodeList"], "backend": "redis"}],
+)
+def test_response_cache_config_errors(make_client, cache_config):
+    with pytest.raises(ValueError):
+        make_client(response_cache=cache_config)
+
+
+def test_client_serves_repeats_from_cache(make_client):
+    client, transport = make_client({"selectCodeList": CODES}, response_cache={"endpoints": {"selectCodeList": 60}})
+
+    first = client.select_code_list({"lastReqDt": "20240101000000"})
+    first["data"] = None
+    second = client.select_code_list({"lastReqDt": "20240101000000"})
+
+    assert second == CODES
+    assert len(transport.requests) == 1
+    assert client.cache_stats()["hits"] == 1
+
+    client.invalidate_cache("selectCodeList")
+    client.select_code_list({"lastReqDt": "20240101000000"})
+    assert len(transport.requests) == 2
@@ -0,0 +1,78 @@
+import pytest
+import requests
+
+from kra_etims_sdk import retry
+from kra_etims_sdk.exceptions import ApiException, CircuitOpenException, RateLimitException
+from kra_etims_sdk.retry import RetryBudget, RetryPolicy
+
+SERVER_ERROR = ApiException("Server Error (999): down", 500, "999")
+CLIENT_ERROR = ApiException("Client Error (891): bad", 400, "891")
+
+
+def test_retry_only_select_endpoints_and_server_errors():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.next_delay("selectCodeList", SERVER_ERROR, 1, 0) is not None
+    assert policy.next_delay("selectCodeList", requests.ConnectionError(), 1, 0) is not None
+    assert policy.next_delay("selectCodeList", ApiException("busy", 503), 1, 0) is not None
+    assert policy.next_delay("saveTrnsSalesOsdc", SERVER_ERROR, 1, 0) is None
+    assert policy.next_delay("selectCodeList", CLIENT_ERROR, 1, 0) is None
+    assert policy.next_delay("selectCodeList", RateLimitException("selectCodeList"), 1, 0) is None
+    assert policy.next_delay("selectCodeList", CircuitOpenException("selectCodeList"), 1, 0) is None
+    assert policy.next_delay("selectCodeList", ValueError(), 1, 0) is None
+
+
+def test_retry_stops_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.next_delay("selectCodeList", SERVER_ERROR, 2, 0) is not None
+    assert policy.next_delay("selectCodeList", SERVER_ERROR, 3, 0) is None
+
+
+def test_retry_backoff_is_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=3)
+    assert all(0 <= policy.backoff(attempt) <= min(3, 2 ** (attempt - 1)) for attempt in range(1, 10) for _ in range(20))
+
+
+def test_retry_respects_deadline(monkeypatch, clock):
+    monkeypatch.setattr(retry, "time", clock)
+    policy = RetryPolicy(base_delay=0.5, max_delay=0.5, deadline=2)
+    started = clock.monotonic()
+
+    clock.advance(1)
+    assert policy.remaining(started) == 1
+    monkeypatch.setattr(policy, "backoff", lambda attempt: 0.5)
+    assert policy.next_delay("selectCodeList", SERVER_ERROR, 1, started) == 0.5
+    clock.advance(0.6)
+    assert policy.next_delay("selectCodeList", SERVER_ERROR, 1, started) is None
+
+
+def test_retry_budget_drains_and_refills():
+    budget = RetryBudget(ratio=0.5, min_retries=2)
+    assert budget.withdraw() and budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_exhausted_budget_stops_retries():
+    policy = RetryPolicy(max_attempts=5, budget=RetryBudget(ratio=0, min_retries=1))
+    assert policy.next_delay("selectCodeList", SERVER_ERROR, 1, 0) is not None
+    assert policy.next_delay("selectCodeList", SERVER_ERROR, 1, 0) is None
+
+
+def test_client_retries_server_errors(make_client, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    client, transport = make_client({"selectCodeList": {"resultCd": "999", "resultMsg": "down"}}, retry={"max_attempts": 3})
+
+    with pytest.raises(ApiException, match="999"):
+        client.select_code_list({"lastReqDt": "20240101000000"})
+    assert len(transport.requests) == 3
+
+    transport.requests.clear()
+    transport.bodies["saveItem"] = {"resultCd": "999", "resultMsg": "down"}
+    with pytest.raises(ApiException):
+        client.post("saveItem", {})
+    assert len(transport.requests) == 1
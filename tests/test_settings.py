@@ -0,0 +1,78 @@
+import pytest
+
+from conftest import CONFIG
+from kra_etims_sdk.base_oclient import BaseOClient
+from kra_etims_sdk.settings import PROD_BASE_URL, SBX_BASE_URL, ClientSettings
+
+OK = {"resultCd": "000", "resultMsg": "ok", "data": {}}
+
+
+def settings(**oscu):
+    return ClientSettings.from_config({"env": "sbx", "oscu": {**CONFIG["oscu"], **oscu}}, BaseOClient.endpoints)
+
+
+def test_routes_carry_url_and_scoped_headers():
+    url, headers = settings().route("saveItem", "abc")
+
+    assert url == SBX_BASE_URL + "/saveItem"
+    assert headers == {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "tin": "P000000000A",
+        "bhfId": "00",
+        "cmcKey": "0" * 64,
+        "Authorization": "Bearer abc",
+    }
+    assert "tin" not in settings().route("selectInitOsdcInfo", "abc")[1]
+
+
+def test_route_returns_a_fresh_header_dict():
+    client_settings = settings()
+    _, headers = client_settings.route("saveItem", "abc")
+    headers["tin"] = "changed"
+    assert client_settings.route("saveItem", "abc")[1]["tin"] == "P000000000A"
+
+
+def test_production_is_the_default_env():
+    prod = ClientSettings.from_config({"oscu": CONFIG["oscu"]}, BaseOClient.endpoints)
+    assert prod.urls["saveItem"] == PROD_BASE_URL + "/saveItem"
+    assert prod.timeout == 30
+
+
+def test_none_values_are_left_out_of_the_headers():
+    _, headers = settings(cmc_key=None).route("saveItem", "abc")
+    assert "cmcKey" not in headers
+    assert headers["tin"] == "P000000000A"
+
+
+@pytest.mark.parametrize("oscu", [{"bhf_id": 0}, {"tin": 123}, {"cmc_key": b"key"}])
+def test_non_string_values_are_rejected(oscu):
+    with pytest.raises(ValueError, match="must be a string"):
+        settings(**oscu)
+
+
+@pytest.mark.parametrize("timeout", [0, -1, "30", True])
+def test_bad_timeout_is_rejected(timeout):
+    with pytest.raises(ValueError, match="timeout"):
+        ClientSettings.from_config({"http": {"timeout": timeout}}, BaseOClient.endpoints)
+
+
+def test_config_edits_apply_after_reload_settings(make_client):
+    client, transport = make_client({"selectCodeList": OK})
+    client.config = {**client.config, "oscu": {**client.config["oscu"], "bhf_id": "01"}}
+    client.select_code_list({"lastReqDt": "20240101000000"})
+    assert transport.requests[-1][1]["headers"]["bhfId"] == "00"
+
+    client.reload_settings()
+    client.select_code_list({"lastReqDt": "20240101000000"})
+    assert transport.requests[-1][1]["headers"]["bhfId"] == "01"
+
+
+def test_set_cmc_key_updates_request_headers(make_client):
+    client, transport = make_client({"selectCodeList": OK})
+    client.set_cmc_key("f" * 64)
+    client.select_code_list({"lastReqDt": "20240101000000"})
+
+    assert transport.requests[0][1]["headers"]["cmcKey"] == "f" * 64
+    assert client.config["oscu"]["cmc_key"] == "f" * 64
+    assert client.settings.cmc_key == "f" * 64
@@ -0,0 +1,73 @@
+import pytest
+
+from kra_etims_sdk.exceptions import ValidationException
+from kra_etims_sdk.streaming import StreamingValidator
+from kra_etims_sdk.validator import Validator
+from payloads import sales_invoice
+
+SCHEMA = "saveTrnsSalesOsdc"
+
+
+def streamed(payload, items=None):
+    """``payload`` with its itemList as a one-pass iterator."""
+    return {**payload, "itemList": iter(payload["itemList"] if items is None else items)}
+
+
+def validator_errors(payload):
+    with pytest.raises(ValidationException) as raised:
+        Validator().validate(payload, SCHEMA)
+    return raised.value.errors
+
+
+def test_items_are_validated_as_they_are_consumed():
+    payload = sales_invoice(3)
+    header, items = StreamingValidator(SCHEMA).validate(streamed(payload))
+    expected = Validator().validate(payload, SCHEMA)
+
+    assert header == {key: value for key, value in expected.items() if key != "itemList"}
+    assert list(items) == expected["itemList"]
+
+
+def test_header_is_checked_before_any_item():
+    consumed = []
+
+    def items():
+        for item in sales_invoice(2)["itemList"]:
+            consumed.append(item)
+            yield item
+
+    payload = {**sales_invoice(2), "salesDt": "yesterday", "itemList": items()}
+    with pytest.raises(ValidationException) as raised:
+        StreamingValidator(SCHEMA).validate(payload)
+    assert list(raised.value.errors) == ["salesDt"]
+    assert consumed == []
+
+
+def test_bad_item_fails_like_validator():
+    payload = sales_invoice(3)
+    payload["itemList"][1]["qty"] = "many"
+    with pytest.raises(ValidationException) as raised:
+        StreamingValidator(SCHEMA).check(streamed(payload))
+    assert raised.value.errors == validator_errors(payload)
+
+
+def test_mismatched_totals_fail_after_the_last_item():
+    payload = {**sales_invoice(3), "totAmt": "1.00"}
+    _, items = StreamingValidator(SCHEMA).validate(streamed(payload))
+    assert next(items)["itemSeq"] == 1
+
+    with pytest.raises(ValidationException) as raised:
+        list(items)
+    assert raised.value.errors == validator_errors(payload)
+
+
+def test_missing_items_fail_the_count():
+    payload = sales_invoice(3)
+    with pytest.raises(ValidationException) as raised:
+        StreamingValidator(SCHEMA).check(streamed(payload, payload["itemList"][:2]))
+    assert "totItemCnt (3)" in raised.value.errors[""]
+
+
+def test_unsupported_schema_is_refused():
+    with pytest.raises(ValueError, match="not supported"):
+        StreamingValidator("saveItem")
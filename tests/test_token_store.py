@@ -0,0 +1,167 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from kra_etims_sdk.exceptions import AuthenticationException
+from kra_etims_sdk.oauth import AuthOClient
+from kra_etims_sdk.token_store import FileTokenStore, TokenStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG = {"env": "sbx", "auth": {"sbx": {"consumer_key": "key", "consumer_secret": "secret"}}}
+TOKEN = {"access_token": "token", "expires_at": 2e9}
+
+# Runs AuthOClient.token() in a separate process whose fetch takes a while
+# and appends a line to <path>.fetches, so overlapping refreshes would show
+CHILD = """
+import sys, time
+from kra_etims_sdk.oauth import AuthOClient
+
+path = sys.argv[1]
+auth = AuthOClient({"env": "sbx", "cache_file": path})
+
+def fetch():
+    with open(path + ".fetches", "a") as f:
+        f.write("fetch\\n")
+    time.sleep(0.3)
+    return {"access_token": "shared", "expires_at": time.time() + 3600}
+
+auth._fetch_token = fetch
+print(auth.token())
+"""
+
+# Holds the refresh lock of the store at argv[1] until stdin closes
+HOLDER = """
+import sys
+from kra_etims_sdk.token_store import FileTokenStore
+
+with FileTokenStore(sys.argv[1]).lock():
+    print("locked", flush=True)
+    sys.stdin.read()
+"""
+
+
+def child(code, *args, **kwargs):
+    return subprocess.Popen([sys.executable, "-c", code, *args], cwd=ROOT, text=True, stdout=subprocess.PIPE, **kwargs)
+
+
+def test_token_store_is_abstract():
+    with pytest.raises(TypeError):
+        TokenStore()
+
+
+def test_write_replaces_the_file_atomically(tmp_path, monkeypatch):
+    path = str(tmp_path / "token.json")
+    store = FileTokenStore(path)
+    store.write(TOKEN)
+    assert store.read() == TOKEN
+
+    def broken_dump(data, f):
+        f.write('{"access_token": "half')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", broken_dump)
+    with pytest.raises(OSError):
+        store.write({"access_token": "new", "expires_at": 1})
+
+    assert store.read() == TOKEN
+    assert os.listdir(tmp_path) == ["token.json"]
+
+
+def test_unreadable_file_reads_as_no_token(tmp_path):
+    path = tmp_path / "token.json"
+    store = FileTokenStore(str(path))
+    assert store.read() is None
+    path.write_text('{"access_token": "x"}')
+    assert store.read() is None
+    path.write_text("{")
+    assert store.read() is None
+    store.delete()
+    store.delete()
+
+
+def test_lock_excludes_other_processes(tmp_path):
+    path = str(tmp_path / "token.json")
+    holder = child(HOLDER, path, stdin=subprocess.PIPE)
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        started = time.monotonic()
+        with pytest.raises(AuthenticationException):
+            with FileTokenStore(path, lock_timeout=0.2).lock():
+                pass
+        assert time.monotonic() - started >= 0.2
+    finally:
+        holder.stdin.close()
+        holder.wait()
+
+    with FileTokenStore(path, lock_timeout=0.2).lock():
+        pass
+
+
+def test_lock_excludes_other_threads(tmp_path):
+    store = FileTokenStore(str(tmp_path / "token.json"))
+    inside = []
+    overlaps = []
+
+    def hold():
+        with store.lock():
+            inside.append(1)
+            overlaps.append(len(inside))
+            time.sleep(0.01)
+            inside.pop()
+
+    threads = [threading.Thread(target=hold) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert overlaps == [1] * 8
+
+
+def test_refresh_is_single_flight_across_threads(tmp_path):
+    path = str(tmp_path / "token.json")
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        time.sleep(0.1)
+        return {"access_token": "shared", "expires_at": time.time() + 3600}
+
+    # Two clients on one store stand in for two workers of the same host
+    clients = [AuthOClient({**CONFIG, "cache_file": path}) for _ in range(2)]
+    for auth in clients:
+        auth._fetch_token = fetch
+
+    tokens = []
+    threads = [threading.Thread(target=lambda auth=auth: tokens.append(auth.token())) for auth in clients * 4]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tokens == ["shared"] * 8
+    assert len(fetches) == 1
+
+
+def test_refresh_is_single_flight_across_processes(tmp_path):
+    path = str(tmp_path / "token.json")
+    workers = [child(CHILD, path) for _ in range(4)]
+    tokens = [worker.communicate()[0].strip() for worker in workers]
+
+    assert tokens == ["shared"] * 4
+    with open(path + ".fetches") as f:
+        assert f.read().splitlines() == ["fetch"]
+
+
+def test_forced_refresh_keeps_a_token_another_worker_just_stored(tmp_path):
+    path = str(tmp_path / "token.json")
+    auth = AuthOClient({**CONFIG, "cache_file": path})
+    auth._fetch_token = lambda: {"access_token": "mine", "expires_at": time.time() + 3600}
+    auth.token()
+
+    FileTokenStore(path).write({"access_token": "theirs", "expires_at": time.time() + 3600})
+    assert auth.token(force=True) == "theirs"
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from conftest import CONFIG, StubAuth
+from kra_etims_sdk.oclient import EtimsOClient
+from kra_etims_sdk.transport import HttpTransport
+
+
+def test_session_is_built_once_and_shared_across_threads():
+    transport = HttpTransport()
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(transport.session())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(map(id, sessions))) == 1
+    transport.close()
+
+
+def test_pool_settings_come_from_http_config():
+    transport = HttpTransport({"pool_connections": 3, "pool_maxsize": 7, "pool_block": True})
+    adapter = transport.session().get_adapter("https://etims-api-sbx.kra.go.ke")
+
+    assert adapter.poolmanager.pools._maxsize == 3
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 7
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter.max_retries.total == 0
+    assert transport.session().headers["Connection"] == "keep-alive"
+    transport.close()
+
+
+def test_keep_alive_off_closes_connections():
+    transport = HttpTransport({"keep_alive": False})
+    assert transport.session().headers["Connection"] == "close"
+    transport.close()
+
+
+def test_closed_transport_refuses_requests():
+    with HttpTransport() as transport:
+        transport.session()
+    assert transport.closed
+    with pytest.raises(RuntimeError):
+        transport.session()
+
+
+def test_client_owns_only_the_transport_it_built():
+    client = EtimsOClient({**CONFIG, "http": {"pool_maxsize": 4}}, StubAuth())
+    assert client.transport.pool_maxsize == 4
+    client.close()
+    assert client.transport.closed
+
+    shared = HttpTransport()
+    EtimsOClient(CONFIG, StubAuth(), transport=shared).close()
+    assert not shared.closed
+    shared.close()
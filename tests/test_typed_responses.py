@@ -0,0 +1,59 @@
+import pytest
+
+from kra_etims_sdk.exceptions import ResponseValidationException, ValidationException
+from kra_etims_sdk.lazy import LazyList
+from kra_etims_sdk.schemas import EtimsResponse, SalesResponse
+
+SALES = {
+    "resultCd": "000",
+    "resultMsg": "ok",
+    "resultDt": "20240101120000",
+    "data": {"curRcptNo": 5, "totRcptNo": 9, "intrlData": "A" * 26, "rcptSign": "B" * 16, "sdcDateTime": "20240101120000"},
+}
+CODES = {
+    "resultCd": "000",
+    "resultMsg": "ok",
+    "data": {"clsList": [{"cdCls": "04", "dtlList": [{"cd": "A", "srtOrd": 1}, {"cd": "B", "srtOrd": "x"}]}]},
+}
+TYPED = {"responses": {"typed": True}, "validation": {"trusted": True}}
+
+
+def test_typed_save_response(make_client):
+    client, _ = make_client({"saveTrnsSalesOsdc": SALES}, **TYPED)
+    response = client.save_sales_transaction({})
+
+    assert isinstance(response, SalesResponse)
+    assert response.data.curRcptNo == 5
+
+
+def test_typed_save_accepts_unexpected_receipt_values(make_client):
+    # KRA already registered the sale: an odd signature must not turn it into an error
+    receipt = {**SALES["data"], "rcptSign": "short", "intrlData": None}
+    client, _ = make_client({"saveTrnsSalesOsdc": {**SALES, "data": receipt}}, **TYPED)
+    response = client.save_sales_transaction({})
+    assert response.data.rcptSign == "short"
+
+    client, _ = make_client({"saveTrnsSalesOsdc": {**SALES, "data": {**receipt, "curRcptNo": "abc"}}}, **TYPED)
+    response = client.save_sales_transaction({})
+    assert type(response) is EtimsResponse
+    assert response.resultCd == "000"
+
+
+def test_typed_select_builds_records_lazily(make_client):
+    client, _ = make_client({"selectCodeList": CODES}, **TYPED)
+    response = client.select_code_list({"lastReqDt": "20240101000000"})
+
+    details = response.data.clsList[0].dtlList
+    assert isinstance(details, LazyList)
+    assert details[0].cd == "A"
+    with pytest.raises(ResponseValidationException) as raised:
+        details[1]
+
+    assert isinstance(raised.value, ValidationException)
+    assert list(raised.value.errors) == ["data.clsList.0.dtlList.1.srtOrd"]
+    assert raised.value.response == CODES["data"]["clsList"][0]["dtlList"][1]
+
+
+def test_untyped_responses_stay_dicts(make_client):
+    client, _ = make_client({"selectCodeList": CODES})
+    assert client.select_code_list({"lastReqDt": "20240101000000"}) == CODES
@@ -0,0 +1,61 @@
+from decimal import Decimal
+
+import pytest
+
+from kra_etims_sdk.exceptions import ValidationException
+from kra_etims_sdk.validator import ValidationCache, Validator
+from payloads import sales_invoice
+
+
+def test_validation_cache_key_ignores_key_order():
+    assert ValidationCache.key({"a": 1, "b": [1, 2]}, "s") == ValidationCache.key({"b": [1, 2], "a": 1}, "s")
+    assert ValidationCache.key({"a": 1}, "s") != ValidationCache.key({"a": 1}, "t")
+    assert ValidationCache.key({"a": "1.0"}, "s") != ValidationCache.key({"a": Decimal("1.0")}, "s")
+    assert ValidationCache.key({"a": object()}, "s") is None
+
+
+def test_validation_cache_evicts_least_recently_used():
+    cache = ValidationCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats() == {"size": 2, "max_size": 2, "hits": 3, "misses": 1}
+
+
+def test_validator_cache_hits_return_fresh_dicts():
+    validator = Validator(cache_size=8)
+    payload = sales_invoice(1)
+
+    first = validator.validate(payload, "saveTrnsSalesOsdc")
+    first["itemList"].clear()
+    second = validator.validate(payload, "saveTrnsSalesOsdc")
+    second["totAmt"] = "0"
+    third = validator.validate(payload, "saveTrnsSalesOsdc")
+
+    assert len(third["itemList"]) == 1
+    assert third["totAmt"] != "0"
+    assert validator.cache.stats()["hits"] == 2
+
+
+def test_validator_caches_failures():
+    validator = Validator(cache_size=8)
+    payload = {**sales_invoice(1), "totAmt": "1"}
+
+    for _ in range(2):
+        with pytest.raises(ValidationException) as raised:
+            validator.validate(payload, "saveTrnsSalesOsdc")
+        raised.value.errors.clear()
+    with pytest.raises(ValidationException) as raised:
+        validator.validate(payload, "saveTrnsSalesOsdc")
+    assert raised.value.errors
+    assert validator.cache.stats()["hits"] == 2
+
+
+def test_client_cache_size_turns_the_cache_on(make_client):
+    assert make_client()[0].validator.cache is None
+    client, _ = make_client(validation={"cache_size": 4})
+    assert client.validator.cache.stats()["max_size"] == 4
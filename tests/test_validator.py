@@ -0,0 +1,95 @@
+import pytest
+
+from kra_etims_sdk.exceptions import ValidationException
+from kra_etims_sdk.schemas import SCHEMAS
+from kra_etims_sdk.validator import Validator
+from payloads import PAYLOADS, sales_invoice
+
+
+@pytest.mark.parametrize("schema", sorted(PAYLOADS))
+def test_fast_path_matches_the_model(schema):
+    data = PAYLOADS[schema]
+    assert Validator().validate(data, schema) == SCHEMAS[schema](**data).model_dump(mode="json")
+
+
+def test_field_errors_map_location_to_message():
+    invoice = sales_invoice(2)
+    invoice["itemList"][1]["qty"] = "many"
+    del invoice["salesDt"]
+
+    with pytest.raises(ValidationException) as raised:
+        Validator().validate(invoice, "saveTrnsSalesOsdc")
+    assert set(raised.value.errors) == {"itemList.1.qty", "salesDt"}
+
+
+def test_rule_errors_are_reported_like_field_errors():
+    invoice = {**sales_invoice(2), "totItemCnt": 3}
+    with pytest.raises(ValidationException) as raised:
+        Validator().validate(invoice, "saveTrnsSalesOsdc")
+    assert list(raised.value.errors) == [""]
+
+
+def test_unknown_schema_is_refused():
+    with pytest.raises(ValueError, match="not defined"):
+        Validator().validate({}, "saveNothing")
+
+
+def test_client_sends_a_model_without_validating_it_again(make_client, monkeypatch):
+    client, transport = make_client({"saveItem": {"resultCd": "000", "resultMsg": "ok", "data": None}})
+    model = SCHEMAS["saveItem"](**PAYLOADS["saveItem"])
+    monkeypatch.setattr(client.validator, "_validate", None)
+
+    client.save_item(model)
+    assert transport.requests[0][1]["json"] == model.model_dump(mode="json")
+
+
+def test_model_of_another_schema_is_refused(make_client):
+    client, transport = make_client()
+    model = SCHEMAS["saveBhfUser"](**PAYLOADS["saveBhfUser"])
+
+    with pytest.raises(ValueError, match="Schema 'saveItem' expects SaveItem, got BranchUser"):
+        client.save_item(model)
+    assert transport.requests == []
+
+
+def test_trusted_input_sends_dicts_as_given(make_client):
+    client, transport = make_client(
+        {"saveItem": {"resultCd": "000", "resultMsg": "ok", "data": None}}, validation={"trusted": True}
+    )
+    data = {"itemCd": "anything"}
+
+    client.save_item(data)
+    assert transport.requests[0][1]["json"] is data
+
+
+def test_report_holds_every_failing_rule():
+    good = sales_invoice(2)
+    bad = sales_invoice(3)
+    bad["itemList"][0]["totAmt"] = "1.00"
+    bad["itemList"][2]["totAmt"] = "2.00"
+    bad["totItemCnt"] = 4
+
+    report = Validator().report([good, bad], "saveTrnsSalesOsdc")
+    assert report.ok == [True, False]
+    assert report.failed == [1]
+    assert report.errors[0] == {}
+    assert set(report.errors[1]) == {"itemList.0", "itemList.2", ""}
+    assert "totItemCnt (4)" in report.errors[1][""]
+
+
+def test_report_keeps_item_rules_beside_field_errors():
+    invoice = sales_invoice(3)
+    invoice["itemList"][0]["qty"] = "many"
+    invoice["itemList"][1]["totAmt"] = "1.00"
+    invoice["totAmt"] = "1.00"
+
+    errors = Validator().report([invoice], "saveTrnsSalesOsdc").errors[0]
+    # The invoice's own rules need valid fields, so its totals go unchecked
+    assert set(errors) == {"itemList.0.qty", "itemList.1"}
+    assert errors["itemList.1"].startswith("Value error, Item total mismatch")
+
+
+def test_report_raises_nothing():
+    report = Validator().report([{}, "not a payload"], "saveTrnsSalesOsdc")
+    assert report.ok == [False, False]
+    assert len(report) == 2